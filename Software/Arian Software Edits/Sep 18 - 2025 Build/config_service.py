@@ -0,0 +1,358 @@
+# aOS1/main_ui_layer/config_service.py
+# =============================================================================
+# CONFIG SERVICE
+# -----------------------------------------------------------------------------
+# - Turns the merged config dict (services.load_config) into an immutable,
+#   typed Config object once per (re)load, so panes read attributes
+#   (ctx.config.display.fps) instead of fishing through nested dicts.
+#   Config.get()/[] still work for older `ctx.config.get("features", {})` code.
+# - Watches config.yaml (inotify on Linux, mtime polling elsewhere) and, when
+#   it changes, rebuilds the Config, diffs it against the old one and calls
+#   only the subscribers whose keys changed:
+#
+#       svc.subscribe(["display.fps"], lambda cfg, changed: budget.set_fps(cfg.display.fps))
+#
+# - set("features.background_mode", "blur") applies a runtime override
+#   (settings pane, voice commands) through the same diff/notify path.
+#
+# Nothing here uses threads: call poll() from the render loop (PaneHost does,
+# once per frame) and callbacks run on that thread. Checking costs one
+# non-blocking read() on the inotify fd.
+# =============================================================================
+
+from __future__ import annotations
+import copy
+import ctypes
+import ctypes.util
+import os
+import struct
+import time
+from dataclasses import dataclass, field, fields, is_dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+def deep_merge(base: Mapping[str, Any], override: Mapping[str, Any]) -> Dict[str, Any]:
+    """New dict: `override` merged into a deep copy of `base` (inputs untouched)."""
+    out = copy.deepcopy(dict(base))
+    for k, v in override.items():
+        if isinstance(v, Mapping) and isinstance(out.get(k), dict):
+            out[k] = deep_merge(out[k], v)
+        else:
+            out[k] = copy.deepcopy(v)
+    return out
+
+
+def _freeze(v: Any) -> Any:
+    if isinstance(v, Mapping):
+        return MappingProxyType({k: _freeze(x) for k, x in v.items()})
+    if isinstance(v, (list, tuple)):
+        return tuple(_freeze(x) for x in v)
+    return v
+
+
+# ------------------------------ TYPED CONFIG ---------------------------------
+
+class _Section:
+    """Dict-style access for code written against the old plain-dict config."""
+
+    def get(self, key: str, default: Any = None) -> Any:
+        node: Any = self
+        for part in key.split("."):
+            if is_dataclass(node) and part in {f.name for f in fields(node)}:
+                node = getattr(node, part)
+            elif isinstance(node, _Section) and part in node.extra:
+                node = node.extra[part]
+            elif isinstance(node, Mapping) and part in node:
+                node = node[part]
+            else:
+                return default
+        return node
+
+    def __getitem__(self, key: str) -> Any:
+        missing = object()
+        v = self.get(key, missing)
+        if v is missing:
+            raise KeyError(key)
+        return v
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, None) is not None
+
+    @property
+    def extra(self) -> Mapping[str, Any]:
+        return MappingProxyType({})
+
+
+@dataclass(frozen=True)
+class DisplayConfig(_Section):
+    width: int = 640
+    height: int = 400
+    ppi: int = 220
+    safe_insets: Tuple[int, int, int, int] = (28, 12, 12, 12)   # top, right, bottom, left
+    fps: int = 30
+
+    @classmethod
+    def from_dict(cls, d: Mapping[str, Any]) -> "DisplayConfig":
+        # missing keys fall back to the field defaults above (cls.width etc.)
+        return cls(
+            width=int(d.get("width", cls.width)),
+            height=int(d.get("height", cls.height)),
+            ppi=int(d.get("ppi", cls.ppi)),
+            safe_insets=tuple(int(x) for x in d.get("safe_insets", cls.safe_insets)),
+            fps=int(d.get("fps", cls.fps)),
+        )
+
+
+@dataclass(frozen=True)
+class FeaturesConfig(_Section):
+    background_removal: bool = False
+    background_mode: str = "black"
+    other: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+
+    @property
+    def extra(self) -> Mapping[str, Any]:
+        return self.other
+
+    @classmethod
+    def from_dict(cls, d: Mapping[str, Any]) -> "FeaturesConfig":
+        known = {"background_removal", "background_mode"}
+        return cls(
+            background_removal=bool(d.get("background_removal", cls.background_removal)),
+            background_mode=str(d.get("background_mode", cls.background_mode)),
+            other=_freeze({k: v for k, v in d.items() if k not in known}),
+        )
+
+
+@dataclass(frozen=True)
+class Config(_Section):
+    display: DisplayConfig
+    features: FeaturesConfig
+    default_pane: str = "assistant"
+    enabled_panes: Tuple[str, ...] = ()
+    assets_dir: str = "VA-Assets"
+    model_path: str = ""
+    voice_hotword: str = "hey vision"
+    other: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+
+    @property
+    def extra(self) -> Mapping[str, Any]:
+        return self.other
+
+    @classmethod
+    def from_dict(cls, d: Mapping[str, Any]) -> "Config":
+        known = {f.name for f in fields(cls)} - {"other"}
+        return cls(
+            display=DisplayConfig.from_dict(d.get("display") or {}),
+            features=FeaturesConfig.from_dict(d.get("features") or {}),
+            default_pane=str(d.get("default_pane", cls.default_pane)),
+            enabled_panes=tuple(d.get("enabled_panes") or cls.enabled_panes),
+            assets_dir=str(d.get("assets_dir", cls.assets_dir)),
+            model_path=str(d.get("model_path", cls.model_path)),
+            voice_hotword=str(d.get("voice_hotword", cls.voice_hotword)),
+            other=_freeze({k: v for k, v in d.items() if k not in known}),
+        )
+
+    def flat(self) -> Dict[str, Any]:
+        """{"display.fps": 30, "features.background_mode": "black", ...} for diffing."""
+        out: Dict[str, Any] = {}
+
+        def walk(prefix: str, node: Any) -> None:
+            join = (lambda k: f"{prefix}.{k}") if prefix else str
+            if isinstance(node, _Section):
+                for f in fields(node):
+                    if f.name != "other":
+                        walk(join(f.name), getattr(node, f.name))
+                for k, v in node.extra.items():
+                    walk(join(k), v)
+            elif isinstance(node, Mapping):
+                for k, v in node.items():
+                    walk(join(k), v)
+            else:
+                out[prefix] = node
+
+        walk("", self)
+        return out
+
+
+def diff(old: Config, new: Config) -> List[str]:
+    a, b = old.flat(), new.flat()
+    return sorted(k for k in a.keys() | b.keys() if a.get(k) != b.get(k))
+
+
+# ------------------------------- WATCHERS ------------------------------------
+
+class _InotifyWatch:
+    """Non-blocking inotify on the file's directory (editors save via rename)."""
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, path: str) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self.name = os.path.basename(path).encode()
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE | self.IN_DELETE
+        d = os.path.dirname(os.path.abspath(path)).encode()
+        if libc.inotify_add_watch(self.fd, d, mask) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+
+    def changed(self) -> bool:
+        hit = False
+        while True:
+            try:
+                buf = os.read(self.fd, 4096)
+            except BlockingIOError:
+                return hit
+            i = 0
+            while i + self._EVENT.size <= len(buf):
+                _, _, _, n = self._EVENT.unpack_from(buf, i)
+                name = buf[i + self._EVENT.size:i + self._EVENT.size + n].rstrip(b"\0")
+                hit = hit or name == self.name
+                i += self._EVENT.size + n
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class _PollWatch:
+    """Fallback: stat() the file at most every `interval_s`."""
+
+    def __init__(self, path: str, interval_s: float = 1.0) -> None:
+        self.path = path
+        self.interval_s = interval_s
+        self._next = 0.0
+        self._sig = self._stat()
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def changed(self) -> bool:
+        now = time.monotonic()
+        if now < self._next:
+            return False
+        self._next = now + self.interval_s
+        sig = self._stat()
+        if sig != self._sig:
+            self._sig = sig
+            return True
+        return False
+
+    def close(self) -> None:
+        pass
+
+
+# ------------------------------- SERVICE -------------------------------------
+
+Subscriber = Callable[[Config, List[str]], None]
+
+
+class ConfigService:
+    def __init__(self, path: str, loader: Callable[..., Dict[str, Any]]) -> None:
+        """
+        path:   the config.yaml to watch
+        loader: returns the merged config dict (services.load_config); called
+                with strict=True on reloads so a half-saved or broken file
+                raises instead of silently falling back to the defaults
+        """
+        self.path = path
+        self.loader = loader
+        self._file_cfg = loader()
+        self._overrides: Dict[str, Any] = {}
+        self.config = Config.from_dict(self._file_cfg)
+        self._subs: List[Tuple[Tuple[str, ...], Subscriber]] = []
+        self._watch: Any = None
+
+    # ----- subscribers -------------------------------------------------------
+
+    def subscribe(self, keys: Iterable[str], fn: Subscriber) -> None:
+        """
+        fn(config, changed_keys) runs when any changed key equals, or sits
+        under, one of `keys` ("display" covers "display.fps"); "*" = any.
+        """
+        self._subs.append((tuple(keys), fn))
+
+    @staticmethod
+    def _matches(keys: Tuple[str, ...], changed: List[str]) -> List[str]:
+        if "*" in keys:
+            return changed
+        return [c for c in changed
+                if any(c == k or c.startswith(k + ".") for k in keys)]
+
+    def _apply(self, new: Config) -> List[str]:
+        changed = diff(self.config, new)
+        if not changed:
+            return []
+        self.config = new
+        for keys, fn in list(self._subs):
+            hits = self._matches(keys, changed)
+            if hits:
+                try:
+                    fn(new, hits)
+                except Exception as e:
+                    print(f"[config] ⚠️  subscriber for {keys} failed: {e}")
+        return changed
+
+    # ----- changes -----------------------------------------------------------
+
+    def set(self, key: str, value: Any) -> List[str]:
+        """Runtime override of one dotted key; returns the keys that changed."""
+        node = self._overrides
+        *parents, leaf = key.split(".")
+        for p in parents:
+            node = node.setdefault(p, {})
+        node[leaf] = value
+        return self._rebuild()
+
+    def _rebuild(self) -> List[str]:
+        try:
+            new = Config.from_dict(deep_merge(self._file_cfg, self._overrides))
+        except (TypeError, ValueError) as e:
+            print(f"[config] ⚠️  invalid config ({e}); keeping the current one")
+            return []
+        return self._apply(new)
+
+    def reload(self) -> List[str]:
+        """Re-read config.yaml now; returns the keys that changed."""
+        try:
+            self._file_cfg = self.loader(strict=True)
+        except Exception as e:
+            print(f"[config] ⚠️  reload failed ({e}); keeping the current config")
+            return []
+        changed = self._rebuild()
+        if changed:
+            print(f"[config] reloaded: {', '.join(changed)}")
+        return changed
+
+    # ----- watching ----------------------------------------------------------
+
+    def watch(self) -> None:
+        if self._watch is not None:
+            return
+        try:
+            self._watch = _InotifyWatch(self.path)
+        except (OSError, AttributeError):
+            # no inotify (macOS/Windows dev boxes): poll the mtime instead
+            self._watch = _PollWatch(self.path)
+
+    def poll(self) -> List[str]:
+        """Call once per frame; reloads if config.yaml changed since last call."""
+        if self._watch is not None and self._watch.changed():
+            return self.reload()
+        return []
+
+    def close(self) -> None:
+        if self._watch is not None:
+            self._watch.close()
+            self._watch = None
@@ -0,0 +1,551 @@
+# aOS1/main_ui_layer/event_bus.py
+# =============================================================================
+# EVENT BUS
+# -----------------------------------------------------------------------------
+# Topic pub/sub behind ctx.event_bus. Producers publish by type:
+#
+#     bus.emit("VOICE", text="open maps")                   # priority from type
+#     bus.publish("SAFETY", {"msg": "obstacle"}, priority=CRITICAL)
+#
+# and components subscribe to the types they care about ("*" = everything):
+#
+#     bus.subscribe(["NAVIGATE", "VOICE"], host.dispatch)              # host loop
+#     bus.subscribe(["DETECTIONS"], logger.write, mode=THREAD,
+#                   maxsize=64, overflow=DROP_OLDEST)                  # own thread
+#
+# Where handlers run (mode):
+#   HOST    queued; delivered by pump() on the thread that runs the frame loop
+#           (PaneHost.step), so pane code never sees another thread
+#   THREAD  queued; a dedicated daemon thread per subscription calls handler
+#   SYNC    called inline on the publisher's thread (cheap, thread-safe code)
+#
+# Backpressure: every queued subscription is bounded (maxsize) and split into
+# priority lanes, CRITICAL > HIGH > NORMAL > LOW; the highest lane is always
+# delivered first. When a queue is full the overflow policy picks a victim:
+#   DROP_OLDEST  evict the oldest event from the least important lane that is
+#                no more important than the new one, else drop the new one
+#   DROP_NEWEST  drop the new event, unless something strictly less important
+#                is queued (that goes instead)
+#   BLOCK        (THREAD mode only) make the publisher wait up to block_s for
+#                room, then behave like DROP_NEWEST
+# CRITICAL events are never dropped: if nothing can be evicted, the queue
+# goes over its bound. So a safety alert can't get stuck behind a flood of
+# telemetry, and a flood can't grow memory without limit.
+#
+# Per-frame draining: pump(budget_s=...) takes everything queued for HOST
+# subscribers, coalesces it, and delivers highest priority first until the
+# time budget runs out; the rest goes back to the front of its queue for the
+# next frame (CRITICAL events are always delivered, and at least one event
+# per pump, so nothing starves). Coalescing rules are per type:
+#
+#     bus.coalesce("NAVIGATE")                              # last writer wins
+#     bus.coalesce("STORE", key=lambda p: p.get("key"))     # ...per store key
+#     bus.coalesce("SCROLL", merge=add_counts)              # counters are summed
+#
+# key(payload) picks what collapses together (None = keep this event as is);
+# merge(old, new) builds the combined payload (default: new replaces old).
+# Only a run of same-type events in a queue is coalesced, so a burst of
+# NAVIGATE can't jump over the VOICE command that was sent between them.
+#
+# Wakeups: whenever a HOST subscriber gets an event the bus signals a file
+# descriptor (eventfd on Linux, a socketpair elsewhere), at most once until
+# the next pump(). Whatever loop owns the host thread watches it, so events
+# from other threads are handled right away instead of on the next poll:
+#
+#     bus.attach_qt()                       # QSocketNotifier -> pump()
+#     bus.attach_asyncio(loop)              # loop.add_reader -> pump()
+#     if bus.wait(timeout): bus.pump()      # plain loop (PaneHost.run, tests)
+#
+# All three go through the same fd and the same pump(), so a headless test
+# exercises exactly what runs under Qt.
+#
+# next() is kept for old polling code: it lazily adds a "poll" subscription
+# and returns {"type": "NOP"} when nothing is queued.
+# =============================================================================
+
+from __future__ import annotations
+import os
+import select
+import socket
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+CRITICAL, HIGH, NORMAL, LOW = 0, 1, 2, 3
+LANES = 4
+
+# Priority by event type; anything unlisted is NORMAL.
+DEFAULT_PRIORITIES: Dict[str, int] = {
+    "SAFETY": CRITICAL,
+    "ALERT": CRITICAL,
+    "NAVIGATE": HIGH,
+    "VOICE": HIGH,
+    "GESTURE": HIGH,
+    "NOTIFY": NORMAL,
+    "DETECTIONS": LOW,
+    "TELEMETRY": LOW,
+}
+
+DROP_OLDEST, DROP_NEWEST, BLOCK = "drop_oldest", "drop_newest", "block"
+HOST, THREAD, SYNC = "host", "thread", "sync"
+_POLL = "poll"      # internal: the legacy next() queue
+
+Event = Dict[str, Any]
+Handler = Callable[[Event], None]
+KeyFn = Callable[[Dict[str, Any]], Any]
+MergeFn = Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]]
+NOP: Event = {"type": "NOP", "payload": {}}
+
+
+def _whole(payload: Dict[str, Any]) -> Any:
+    return True
+
+
+def add_counts(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge for counter payloads: numbers are summed, anything else from `new`."""
+    out = dict(new)
+    for k, v in old.items():
+        if (isinstance(v, (int, float)) and not isinstance(v, bool)
+                and isinstance(out.get(k), (int, float)) and not isinstance(out[k], bool)):
+            out[k] = v + out[k]
+    return out
+
+
+# Coalescing rules by type: (key, merge); merge None = last writer wins.
+DEFAULT_COALESCE: Dict[str, Tuple[KeyFn, Optional[MergeFn]]] = {
+    "NAVIGATE": (_whole, None),
+    "VOICE": (lambda p: "partial" if p.get("partial") else None, None),   # finals are kept
+    "STORE": (lambda p: p.get("key"), None),
+}
+
+
+class Wakeup:
+    """Cross-thread doorbell: set() from any thread, fileno() is readable until clear()."""
+    def __init__(self) -> None:
+        self._armed = False
+        self._sock: Optional[Tuple[socket.socket, socket.socket]] = None
+        if hasattr(os, "eventfd"):
+            self._r = self._w = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+        else:
+            r, w = socket.socketpair()
+            r.setblocking(False)
+            w.setblocking(False)
+            self._sock = (r, w)
+            self._r, self._w = r.fileno(), w.fileno()
+
+    def fileno(self) -> int:
+        return self._r
+
+    def set(self) -> None:
+        if self._armed:             # already pending: no syscall per event
+            return
+        self._armed = True
+        try:
+            if self._sock is None:
+                os.eventfd_write(self._w, 1)
+            else:
+                self._sock[1].send(b"\0")
+        except (BlockingIOError, OSError):
+            pass                    # full or closed: the reader is awake anyway
+
+    def clear(self) -> None:
+        if not self._armed:
+            return
+        # drain before disarming: a set() racing with us either lands in the
+        # drained fd or is skipped while still armed - and its event is
+        # already queued for the pump() that follows
+        try:
+            if self._sock is None:
+                os.eventfd_read(self._r)
+            else:
+                while self._sock[0].recv(4096):
+                    pass
+        except (BlockingIOError, OSError):
+            pass
+        self._armed = False
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        """Block until set() or `timeout` seconds; True if woken."""
+        if self._armed:
+            return True
+        try:
+            r, _, _ = select.select([self._r], [], [], timeout)
+        except (OSError, ValueError):
+            return False
+        return bool(r)
+
+    def close(self) -> None:
+        if self._sock is not None:
+            for sk in self._sock:
+                sk.close()
+        elif self._r >= 0:
+            os.close(self._r)
+        self._r = self._w = -1
+
+
+class Subscription:
+    def __init__(self, bus: "EventBus", types: Tuple[str, ...], handler: Optional[Handler],
+                 name: str, mode: str, maxsize: int, overflow: str, block_s: float) -> None:
+        self.bus = bus
+        self.types = types
+        self.handler = handler
+        self.name = name
+        self.mode = mode
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.block_s = block_s
+        self.lanes: List[deque] = [deque() for _ in range(LANES)]
+        self.size = 0
+        self.cond = threading.Condition()
+        self.active = True
+        # stats
+        self.delivered = 0
+        self.dropped: Dict[str, int] = {}
+        self.failed = 0
+        self.coalesced = 0
+        self.deferred = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self._thread: Optional[threading.Thread] = None
+        if mode == THREAD:
+            self._thread = threading.Thread(target=self._run, name=f"bus:{name}", daemon=True)
+            self._thread.start()
+
+    # ----- queueing ----------------------------------------------------------
+
+    def offer(self, ev: Event) -> bool:
+        """Queue `ev`, applying the overflow policy; False if it was dropped."""
+        prio = ev["priority"]
+        with self.cond:
+            if self.size >= self.maxsize and self.overflow == BLOCK and prio != CRITICAL:
+                self.cond.wait_for(lambda: self.size < self.maxsize or not self.active,
+                                   self.block_s)
+            if self.size >= self.maxsize and not self._make_room(prio) and prio != CRITICAL:
+                self._count_drop(ev)
+                return False
+            self.lanes[prio].append(ev)
+            self.size += 1
+            self.cond.notify_all()
+        return True
+
+    def _make_room(self, prio: int) -> bool:
+        floor = prio if self.overflow == DROP_OLDEST else prio + 1
+        # never evict CRITICAL: a full CRITICAL lane makes the queue go over its bound
+        for lane in range(LANES - 1, max(floor, CRITICAL + 1) - 1, -1):
+            if self.lanes[lane]:
+                self._count_drop(self.lanes[lane].popleft())
+                self.size -= 1
+                return True
+        return False
+
+    def _count_drop(self, ev: Event) -> None:
+        self.dropped[ev["type"]] = self.dropped.get(ev["type"], 0) + 1
+
+    def take(self) -> Optional[Event]:
+        """Highest-priority queued event, or None."""
+        with self.cond:
+            for lane in self.lanes:
+                if lane:
+                    self.size -= 1
+                    self.cond.notify_all()      # room for BLOCK publishers
+                    return lane.popleft()
+        return None
+
+    def take_all(self) -> List[Event]:
+        """Everything queued, highest priority first."""
+        with self.cond:
+            out = [ev for lane in self.lanes for ev in lane]
+            for lane in self.lanes:
+                lane.clear()
+            self.size = 0
+            self.cond.notify_all()
+        return out
+
+    def requeue(self, events: List[Event]) -> None:
+        """Put undelivered events back at the front of their lanes, order kept."""
+        with self.cond:
+            for ev in reversed(events):
+                self.lanes[ev["priority"]].appendleft(ev)
+            self.size += len(events)
+            self.deferred += len(events)
+
+    def pending(self) -> int:
+        return self.size
+
+    # ----- delivery ----------------------------------------------------------
+
+    def deliver(self, ev: Event) -> None:
+        lat = time.monotonic() - ev["t"]
+        self.latency_sum += lat
+        if lat > self.latency_max:
+            self.latency_max = lat
+        self.delivered += 1
+        try:
+            self.handler(ev)
+        except Exception as e:
+            self.failed += 1
+            print(f"[bus] ⚠️  {self.name} failed on {ev['type']}: {e}")
+
+    def _run(self) -> None:
+        while True:
+            with self.cond:
+                self.cond.wait_for(lambda: self.size > 0 or not self.active)
+                if not self.active:
+                    return
+            ev = self.take()
+            if ev is not None:
+                self.deliver(ev)
+
+    def close(self) -> None:
+        with self.cond:
+            self.active = False
+            self.cond.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(1.0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "types": list(self.types),
+            "pending": self.size,
+            "delivered": self.delivered,
+            "dropped": dict(self.dropped),
+            "failed": self.failed,
+            "coalesced": self.coalesced,
+            "deferred": self.deferred,
+            "latency_avg_ms": round(1000 * self.latency_sum / self.delivered, 3) if self.delivered else 0.0,
+            "latency_max_ms": round(1000 * self.latency_max, 3),
+        }
+
+
+class EventBus:
+    def __init__(self, priorities: Optional[Dict[str, int]] = None,
+                 default_maxsize: int = 256) -> None:
+        self.priorities = dict(DEFAULT_PRIORITIES)
+        self.priorities.update(priorities or {})
+        self.default_maxsize = default_maxsize
+        self.published = 0
+        self._lock = threading.Lock()       # guards (un)subscribe only
+        self._subs: Tuple[Subscription, ...] = ()
+        self._by_type: Dict[str, Tuple[Subscription, ...]] = {}
+        self._host: Tuple[Subscription, ...] = ()
+        self._poll: Optional[Subscription] = None
+        self._coalesce: Dict[str, Tuple[KeyFn, Optional[MergeFn]]] = dict(DEFAULT_COALESCE)
+        self.last_pump: Dict[str, Any] = {"delivered": 0, "coalesced": 0, "deferred": 0, "ms": 0.0}
+        self.wakeup = Wakeup()
+        self.wakeup_budget_s: Optional[float] = None    # pump budget for attach_qt/asyncio
+        self._notifier: Any = None
+
+    # ----- subscribers -------------------------------------------------------
+
+    def subscribe(self, types: Iterable[str], handler: Optional[Handler], name: Optional[str] = None,
+                  mode: str = HOST, maxsize: Optional[int] = None,
+                  overflow: str = DROP_OLDEST, block_s: float = 0.05) -> Subscription:
+        if mode not in (HOST, THREAD, SYNC, _POLL):
+            raise ValueError(f"unknown delivery mode {mode!r}")
+        if overflow not in (DROP_OLDEST, DROP_NEWEST, BLOCK):
+            raise ValueError(f"unknown overflow policy {overflow!r}")
+        if overflow == BLOCK and mode != THREAD:
+            # a host-loop subscriber blocking its own publisher would deadlock
+            raise ValueError("overflow=BLOCK needs mode=THREAD")
+        types = tuple([types] if isinstance(types, str) else types)
+        name = name or getattr(handler, "__qualname__", None) or "subscriber"
+        sub = Subscription(self, types, handler, name, mode,
+                           maxsize or self.default_maxsize, overflow, block_s)
+        with self._lock:
+            self._subs += (sub,)
+            self._reindex()
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            self._subs = tuple(s for s in self._subs if s is not sub)
+            self._reindex()
+        sub.close()
+
+    def _reindex(self) -> None:
+        # copy-on-write: publish() reads these tuples without taking the lock
+        types = {t for s in self._subs for t in s.types if t != "*"}
+        self._by_type = {t: tuple(s for s in self._subs if t in s.types or "*" in s.types)
+                         for t in types}
+        self._by_type["*"] = tuple(s for s in self._subs if "*" in s.types)
+        self._host = tuple(s for s in self._subs if s.mode == HOST)
+
+    def priority_of(self, type_: str) -> int:
+        return self.priorities.get(type_, NORMAL)
+
+    def set_priority(self, type_: str, priority: int) -> None:
+        self.priorities[type_] = priority
+
+    def coalesce(self, type_: str, key: Optional[KeyFn] = None,
+                 merge: Optional[MergeFn] = None) -> None:
+        """Collapse queued `type_` events with equal key(payload) when pumped."""
+        self._coalesce[type_] = (key or _whole, merge)
+
+    def no_coalesce(self, type_: str) -> None:
+        self._coalesce.pop(type_, None)
+
+    # ----- publishing --------------------------------------------------------
+
+    def publish(self, type_: str, payload: Optional[Dict[str, Any]] = None,
+                priority: Optional[int] = None) -> int:
+        """Thread-safe. Returns how many subscribers took the event."""
+        ev = {"type": type_, "payload": payload or {},
+              "priority": self.priority_of(type_) if priority is None else priority,
+              "t": time.monotonic()}
+        self.published += 1
+        taken, host = 0, False
+        for sub in self._by_type.get(type_, self._by_type.get("*", ())):
+            if sub.mode == SYNC:
+                sub.deliver(ev)
+                taken += 1
+            elif sub.offer(ev):
+                taken += 1
+                host = host or sub.mode == HOST
+        if host:
+            self.wakeup.set()
+        return taken
+
+    def emit(self, type_: str, **payload: Any) -> None:
+        self.publish(type_, payload)
+
+    # ----- host-loop delivery ------------------------------------------------
+
+    def pump(self, max_events: Optional[int] = None, budget_s: Optional[float] = None) -> int:
+        """
+        Deliver queued HOST events on the calling thread, highest priority
+        first across all host subscribers. Only what was queued when pump()
+        started, so handlers that publish can't starve the frame. Events are
+        coalesced first; whatever is past max_events or budget_s (seconds)
+        is put back for the next pump. Returns how many were delivered.
+        """
+        t0 = time.monotonic()
+        self.wakeup.clear()
+        batch: List[Tuple[int, int, Subscription, Event]] = []
+        coalesced = 0
+        for i, s in enumerate(self._host):
+            if not s.size:
+                continue
+            evs = s.take_all()
+            kept = self._coalesced(evs)
+            s.coalesced += len(evs) - len(kept)
+            coalesced += len(evs) - len(kept)
+            batch.extend((ev["priority"], i, s, ev) for ev in kept)
+        # stable: FIFO within a lane, subscriber order breaks priority ties
+        batch.sort(key=lambda b: (b[0], b[1]))
+        deadline = None if budget_s is None else t0 + budget_s
+        done = 0
+        for n, (prio, _, s, ev) in enumerate(batch):
+            if done and prio != CRITICAL and (
+                    (max_events is not None and done >= max_events)
+                    or (deadline is not None and time.monotonic() >= deadline)):
+                self._defer(batch[n:])
+                break
+            s.deliver(ev)
+            done += 1
+        self.last_pump = {"delivered": done, "coalesced": coalesced,
+                          "deferred": len(batch) - done,
+                          "ms": round(1000 * (time.monotonic() - t0), 3)}
+        return done
+
+    def _coalesced(self, events: List[Event]) -> List[Event]:
+        out: List[Event] = []
+        run_type, slots = None, {}          # key -> index in out, current run only
+        for ev in events:
+            if ev["type"] != run_type:
+                run_type, slots = ev["type"], {}
+            rule = self._coalesce.get(run_type)
+            k = rule[0](ev["payload"]) if rule is not None else None
+            if k is None:
+                out.append(ev)
+                continue
+            i = slots.get(k)
+            if i is None:
+                slots[k] = len(out)
+                out.append(ev)
+                continue
+            old, merge = out[i], rule[1]
+            payload = merge(old["payload"], ev["payload"]) if merge else ev["payload"]
+            out[i] = dict(ev, payload=payload, t=old["t"])      # latency from the first
+        return out
+
+    @staticmethod
+    def _defer(rest: List[Tuple[int, int, Subscription, Event]]) -> None:
+        by_sub: Dict[int, Tuple[Subscription, List[Event]]] = {}
+        for _, i, s, ev in rest:
+            by_sub.setdefault(i, (s, []))[1].append(ev)
+        for s, evs in by_sub.values():
+            s.requeue(evs)
+
+    def pending(self) -> int:
+        return sum(s.pending() for s in self._host)
+
+    # ----- loop integration --------------------------------------------------
+
+    def fileno(self) -> int:
+        """Readable while HOST events are waiting for pump()."""
+        return self.wakeup.fileno()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Sleep until a HOST event arrives or `timeout`; True if there is work."""
+        return self.wakeup.wait(timeout)
+
+    def _on_wakeup(self, *_: Any) -> None:
+        self.pump(budget_s=self.wakeup_budget_s)
+        if self.pending():
+            self.wakeup.set()       # deferred by the budget: come back next turn
+
+    def attach_qt(self, parent: Any = None) -> Any:
+        """Pump on the Qt GUI thread whenever events arrive (QSocketNotifier)."""
+        from PyQt5.QtCore import QSocketNotifier
+        self.detach()
+        self._notifier = QSocketNotifier(self.fileno(), QSocketNotifier.Read, parent)
+        self._notifier.activated.connect(self._on_wakeup)
+        if self.pending():
+            self.wakeup.set()
+        return self._notifier
+
+    def attach_asyncio(self, loop: Any) -> None:
+        """Pump on `loop`'s thread whenever events arrive (loop.add_reader)."""
+        self.detach()
+        loop.add_reader(self.fileno(), self._on_wakeup)
+        self._notifier = loop
+        if self.pending():
+            self.wakeup.set()
+
+    def detach(self) -> None:
+        n, self._notifier = self._notifier, None
+        if n is None:
+            return
+        if hasattr(n, "remove_reader"):
+            n.remove_reader(self.fileno())
+        else:
+            n.setEnabled(False)
+            n.deleteLater()
+
+    def next(self, block: bool = False, timeout: float = 0.0) -> Event:
+        """Legacy polling: next event from a private "poll" queue, or NOP."""
+        if self._poll is None:
+            self._poll = self.subscribe(["*"], None, name="poll", mode=_POLL)
+        sub = self._poll
+        if block:
+            with sub.cond:
+                sub.cond.wait_for(lambda: sub.size > 0, timeout or None)
+        return sub.take() or NOP
+
+    # ----- housekeeping ------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        return {"published": self.published,
+                "last_pump": dict(self.last_pump),
+                "subscribers": {s.name: s.stats() for s in self._subs}}
+
+    def close(self) -> None:
+        with self._lock:
+            subs, self._subs = self._subs, ()
+            self._reindex()
+        for s in subs:
+            s.close()
+        self.detach()
+        self.wakeup.close()
@@ -0,0 +1,230 @@
+# aOS1/main_ui_layer/event_bus_bench.py
+# =============================================================================
+# EVENT BUS BENCHMARK
+# -----------------------------------------------------------------------------
+# Compares event_bus.EventBus with the old single unbounded queue.Queue bus
+# (QueueBus below, kept verbatim for reference) on three things we care about:
+#
+#   throughput   publish N events on one thread, then drain them
+#   latency      producer thread -> consumer thread, per-event delay
+#                (old: consumer blocked in Queue.get; new: THREAD subscriber)
+#   priority     a SAFETY event published behind a flood of TELEMETRY: how
+#                long until it's handled, and how many events went first
+#   host         producer thread -> HOST subscriber on a 30 fps loop that
+#                pumps once per frame vs one that sleeps on bus.wait()
+#
+#     python event_bus_bench.py                 # table
+#     python event_bus_bench.py --json out.json --events 200000
+# =============================================================================
+
+from __future__ import annotations
+import argparse
+import json
+import platform
+import queue
+import statistics
+import sys
+import threading
+import time
+from typing import Any, Dict, List
+
+from event_bus import CRITICAL, THREAD, DROP_OLDEST, EventBus
+
+
+class QueueBus:
+    """The pre-pub/sub ctx.event_bus."""
+    def __init__(self) -> None:
+        self._q: "queue.Queue[dict]" = queue.Queue()
+        self._lock = threading.Lock()
+
+    def emit(self, type_: str, **payload: Any) -> None:
+        self._q.put({"type": type_, "payload": payload})
+
+    def next(self, block: bool = False, timeout: float = 0.0) -> dict:
+        try:
+            return self._q.get(block=block, timeout=timeout)
+        except queue.Empty:
+            return {"type": "NOP", "payload": {}}
+
+
+def _pct(samples: List[float], p: float) -> float:
+    s = sorted(samples)
+    return s[min(len(s) - 1, int(p * len(s)))]
+
+
+def _lat(samples: List[float]) -> Dict[str, float]:
+    return {"avg_us": round(statistics.mean(samples) * 1e6, 1),
+            "p50_us": round(_pct(samples, 0.50) * 1e6, 1),
+            "p99_us": round(_pct(samples, 0.99) * 1e6, 1),
+            "max_us": round(max(samples) * 1e6, 1)}
+
+
+# ----- throughput -------------------------------------------------------------
+
+def throughput_queue(n: int) -> float:
+    bus = QueueBus()
+    t0 = time.perf_counter()
+    for i in range(n):
+        bus.emit("TELEMETRY", i=i)
+    while bus.next()["type"] != "NOP":
+        pass
+    return n / (time.perf_counter() - t0)
+
+
+def throughput_bus(n: int) -> float:
+    bus = EventBus()
+    seen = [0]
+    bus.subscribe(["TELEMETRY"], lambda ev: seen.__setitem__(0, seen[0] + 1), maxsize=n)
+    t0 = time.perf_counter()
+    for i in range(n):
+        bus.emit("TELEMETRY", i=i)
+    bus.pump()
+    dt = time.perf_counter() - t0
+    assert seen[0] == n
+    return n / dt
+
+
+# ----- cross-thread latency ---------------------------------------------------
+
+def latency_queue(n: int, gap_s: float) -> List[float]:
+    bus, out = QueueBus(), []
+
+    def consume() -> None:
+        for _ in range(n):
+            ev = bus.next(block=True, timeout=5.0)
+            out.append(time.perf_counter() - ev["payload"]["t"])
+
+    th = threading.Thread(target=consume)
+    th.start()
+    for _ in range(n):
+        bus.emit("VOICE", t=time.perf_counter())
+        time.sleep(gap_s)
+    th.join()
+    return out
+
+
+def latency_bus(n: int, gap_s: float) -> List[float]:
+    bus, out, done = EventBus(), [], threading.Event()
+
+    def handle(ev: dict) -> None:
+        out.append(time.perf_counter() - ev["payload"]["t"])
+        if len(out) == n:
+            done.set()
+
+    bus.subscribe(["VOICE"], handle, mode=THREAD)
+    for _ in range(n):
+        bus.emit("VOICE", t=time.perf_counter())
+        time.sleep(gap_s)
+    done.wait(5.0)
+    bus.close()
+    return out
+
+
+def latency_host(n: int, gap_s: float, wakeup: bool, fps: int = 30) -> List[float]:
+    bus, out = EventBus(), []
+    bus.subscribe(["VOICE"], lambda ev: out.append(time.perf_counter() - ev["payload"]["t"]))
+
+    def produce() -> None:
+        for _ in range(n):
+            bus.emit("VOICE", t=time.perf_counter())
+            time.sleep(gap_s)
+
+    th = threading.Thread(target=produce)
+    th.start()
+    next_frame = time.monotonic()
+    while len(out) < n and (th.is_alive() or bus.pending()):
+        bus.pump()
+        next_frame += 1.0 / fps
+        delay = next_frame - time.monotonic()
+        while delay > 0:
+            if not wakeup:
+                time.sleep(delay)
+            elif bus.wait(delay):
+                bus.pump()
+            delay = next_frame - time.monotonic()
+    th.join()
+    bus.close()
+    return out
+
+
+# ----- priority under a flood -------------------------------------------------
+
+def priority_queue(flood: int) -> Dict[str, Any]:
+    bus = QueueBus()
+    for i in range(flood):
+        bus.emit("TELEMETRY", i=i)
+    bus.emit("SAFETY", t=time.perf_counter())
+    ahead = 0
+    while True:
+        ev = bus.next()
+        if ev["type"] == "SAFETY":
+            return {"handled_after_us": round((time.perf_counter() - ev["payload"]["t"]) * 1e6, 1),
+                    "events_ahead": ahead, "queued_peak": flood + 1}
+        ahead += 1
+
+
+def priority_bus(flood: int, maxsize: int = 256) -> Dict[str, Any]:
+    bus = EventBus()
+    result: Dict[str, Any] = {}
+    ahead = [0]
+
+    def handle(ev: dict) -> None:
+        if ev["type"] == "SAFETY" and "handled_after_us" not in result:
+            result["handled_after_us"] = round((time.perf_counter() - ev["payload"]["t"]) * 1e6, 1)
+            result["events_ahead"] = ahead[0]
+        ahead[0] += 1
+
+    sub = bus.subscribe(["TELEMETRY", "SAFETY"], handle, maxsize=maxsize, overflow=DROP_OLDEST)
+    for i in range(flood):
+        bus.emit("TELEMETRY", i=i)
+    bus.publish("SAFETY", {"t": time.perf_counter()}, priority=CRITICAL)
+    result["queued_peak"] = sub.pending()
+    bus.pump()
+    result["dropped"] = sum(sub.dropped.values())
+    return result
+
+
+def main(argv: List[str] = None) -> int:
+    ap = argparse.ArgumentParser(description="EventBus vs the old queue.Queue bus")
+    ap.add_argument("--events", type=int, default=100_000, help="throughput events")
+    ap.add_argument("--latency-events", type=int, default=2_000)
+    ap.add_argument("--gap-ms", type=float, default=0.5, help="producer spacing for latency")
+    ap.add_argument("--flood", type=int, default=10_000, help="TELEMETRY ahead of the SAFETY event")
+    ap.add_argument("--host-events", type=int, default=200, help="events for the host-loop test")
+    ap.add_argument("--host-gap-ms", type=float, default=7.0)
+    ap.add_argument("--json", default=None, help="also write results here")
+    args = ap.parse_args(argv)
+
+    gap = args.gap_ms / 1000
+    report = {
+        "meta": {"python": platform.python_version(), "machine": platform.machine()},
+        "throughput_ev_s": {"queue": round(throughput_queue(args.events)),
+                            "bus": round(throughput_bus(args.events))},
+        "latency": {"queue": _lat(latency_queue(args.latency_events, gap)),
+                    "bus": _lat(latency_bus(args.latency_events, gap))},
+        "priority": {"queue": priority_queue(args.flood),
+                     "bus": priority_bus(args.flood)},
+        "host": {"frame_poll": _lat(latency_host(args.host_events, args.host_gap_ms / 1000, False)),
+                 "wakeup": _lat(latency_host(args.host_events, args.host_gap_ms / 1000, True))},
+    }
+
+    t, l, p = report["throughput_ev_s"], report["latency"], report["priority"]
+    print(f"{'':22}{'queue.Queue':>14}{'EventBus':>14}")
+    print(f"{'throughput (ev/s)':22}{t['queue']:>14,}{t['bus']:>14,}")
+    for k in ("p50_us", "p99_us", "max_us"):
+        print(f"{'latency ' + k:22}{l['queue'][k]:>14}{l['bus'][k]:>14}")
+    print(f"{'SAFETY after (us)':22}{p['queue']['handled_after_us']:>14}{p['bus']['handled_after_us']:>14}")
+    print(f"{'SAFETY events ahead':22}{p['queue']['events_ahead']:>14}{p['bus']['events_ahead']:>14}")
+    print(f"{'queued at peak':22}{p['queue']['queued_peak']:>14}{p['bus']['queued_peak']:>14}")
+    h = report["host"]
+    print(f"\n{'host loop @30fps':22}{'frame poll':>14}{'wakeup fd':>14}")
+    for k in ("p50_us", "p99_us", "max_us"):
+        print(f"{'latency ' + k:22}{h['frame_poll'][k]:>14}{h['wakeup'][k]:>14}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,279 @@
+# aOS1/main_ui_layer/executor_service.py
+# =============================================================================
+# EXECUTOR SERVICE
+# -----------------------------------------------------------------------------
+# ctx.executors: the one place background work runs, so panes never start
+# their own threads and the thread count stays fixed on the Zero 2W.
+#
+#   pools (config "executors")
+#     io        blocking calls: files, sockets, serial, libraries without
+#               an async API (network waits belong on ctx.loop)
+#     cpu       OpenCV / numpy work that releases the GIL
+#     process   a process pool for pure-Python heavy lifting; the function
+#               and its arguments must be picklable (module-level functions)
+#
+#   usage
+#     self.ctx.executors.submit(make_thumbnail, path, pool="cpu", owner=self,
+#                               on_result=self._show_thumb)
+#
+#     token = self.ctx.executors.token(self)       # long-running loops
+#     self.ctx.executors.submit(self._record, token, pool="io", owner=self)
+#         ...inside: while not token.cancelled: ...
+#
+# on_result / on_error run on the UI thread through `post` (make_services
+# posts them as CALL events that PaneHost runs between frames). Everything
+# submitted with owner=pane is cancelled when the pane unmounts: queued work
+# never starts, running work sees token.cancelled, and late results are
+# dropped instead of reaching a pane that's gone.
+#
+# stats() per pool: queue depth (now and peak), queue wait and run time
+# percentiles (frame_budget.RollingStats), completed / failed / cancelled.
+# =============================================================================
+
+from __future__ import annotations
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+try:
+    from .frame_budget import RollingStats
+except ImportError:         # run from this directory, not as aOS1.main_ui_layer
+    from frame_budget import RollingStats
+
+DEFAULT_POOLS: Dict[str, int] = {"io": 2, "cpu": 2}
+PROCESS = "process"
+
+
+class Cancelled(Exception):
+    """Raised by CancelToken.check() once the token is cancelled."""
+
+
+class CancelToken:
+    def __init__(self, owner: Any = None) -> None:
+        self.owner = owner
+        self._event = threading.Event()
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for cb in callbacks:
+            cb()
+
+    def on_cancel(self, cb: Callable[[], None]) -> None:
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(cb)
+                return
+        cb()
+
+    def check(self) -> None:
+        if self._event.is_set():
+            raise Cancelled()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Sleep up to `timeout`; True if cancelled meanwhile (use instead of time.sleep)."""
+        return self._event.wait(timeout)
+
+
+class PoolStats:
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self.lock = threading.Lock()
+        self.queued = 0
+        self.queued_peak = 0
+        self.running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.wait_ms = RollingStats()
+        self.run_ms = RollingStats()
+
+    def summary(self) -> Dict[str, Any]:
+        with self.lock:
+            return {"workers": self.workers, "queued": self.queued,
+                    "queued_peak": self.queued_peak, "running": self.running,
+                    "submitted": self.submitted, "completed": self.completed,
+                    "failed": self.failed, "cancelled": self.cancelled,
+                    "wait_ms": self.wait_ms.summary(), "run_ms": self.run_ms.summary()}
+
+
+class ExecutorService:
+    def __init__(self, pools: Optional[Dict[str, int]] = None, processes: int = 1,
+                 post: Optional[Callable[[Callable[[], None]], None]] = None) -> None:
+        self.post = post or (lambda fn: fn())
+        self._threads: Dict[str, ThreadPoolExecutor] = {}
+        self._stats: Dict[str, PoolStats] = {}
+        for name, n in (pools or DEFAULT_POOLS).items():
+            self._threads[name] = ThreadPoolExecutor(max_workers=max(1, int(n)),
+                                                     thread_name_prefix=f"pool:{name}")
+            self._stats[name] = PoolStats(max(1, int(n)))
+        self.processes = int(processes)
+        self._procs: Optional[ProcessPoolExecutor] = None     # started on first use
+        if self.processes > 0:
+            self._stats[PROCESS] = PoolStats(self.processes)
+        # id(owner) -> (its current token, futures still pending)
+        self._owned: Dict[int, Tuple[CancelToken, Set[Future]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, cfg: Dict[str, Any], post: Optional[Callable] = None) -> "ExecutorService":
+        pools = {k: int(v) for k, v in cfg.items() if k != PROCESS}
+        return cls(pools or None, int(cfg.get(PROCESS, 1)), post)
+
+    # ----- submitting ----------------------------------------------------------
+
+    def submit(self, fn: Callable[..., Any], *args: Any, pool: str = "io",
+               owner: Any = None, on_result: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None,
+               **kwargs: Any) -> Future:
+        """
+        Run fn(*args, **kwargs) on `pool`. on_result / on_error are posted to
+        the UI thread. With `owner`, the work is cancelled by cancel(owner).
+        """
+        st = self._stats.get(pool)
+        if st is None:
+            raise ValueError(f"unknown pool {pool!r}; have {sorted(self._stats)}")
+        t_sub = time.monotonic()
+        with st.lock:
+            st.submitted += 1
+            st.queued += 1
+            st.queued_peak = max(st.queued_peak, st.queued)
+        started: List[float] = []   # set by run(); stays empty in the process pool
+        if pool == PROCESS:
+            fut = self._process_pool().submit(fn, *args, **kwargs)
+        else:
+            def run() -> Any:
+                t0 = time.monotonic()
+                started.append(t0)
+                with st.lock:
+                    st.queued -= 1
+                    st.running += 1
+                    st.wait_ms.add(1000 * (t0 - t_sub))
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    with st.lock:
+                        st.running -= 1
+
+            fut = self._threads[pool].submit(run)
+        tok = None
+        if owner is not None:
+            with self._lock:
+                tok, futs = self._owner_entry(owner)
+                if not fut.done():
+                    futs.add(fut)
+        name = getattr(fn, "__qualname__", "task")
+        fut.add_done_callback(lambda f: self._done(f, st, t_sub, started, owner, tok, name,
+                                                   on_result, on_error))
+        return fut
+
+    def _done(self, fut: Future, st: PoolStats, t_sub: float, started: List[float],
+              owner: Any, tok: Optional[CancelToken], name: str,
+              on_result: Optional[Callable], on_error: Optional[Callable]) -> None:
+        now = time.monotonic()
+        if owner is not None:
+            with self._lock:
+                entry = self._owned.get(id(owner))
+                if entry is not None:
+                    entry[1].discard(fut)
+        with st.lock:
+            if not started:
+                st.queued -= 1          # cancelled before it ran, or process pool
+            if fut.cancelled():
+                st.cancelled += 1
+                return
+            st.run_ms.add(1000 * (now - (started[0] if started else t_sub)))
+            exc = fut.exception()
+            if exc is None:
+                st.completed += 1
+            elif isinstance(exc, Cancelled):
+                st.cancelled += 1
+            else:
+                st.failed += 1
+        if tok is not None and tok.cancelled:
+            return                      # owner went away: drop late results
+        if exc is None:
+            if on_result is not None:
+                res = fut.result()
+                self.post(lambda: on_result(res))
+        elif isinstance(exc, Cancelled):
+            pass
+        elif on_error is not None:
+            self.post(lambda: on_error(exc))
+        else:
+            print(f"[executors] ⚠️  {name} failed: {type(exc).__name__}: {exc}")
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        if self._procs is None:
+            if self.processes <= 0:
+                raise ValueError("no process pool configured (executors.process: 0)")
+            # forkserver: forking a process that already runs threads is unsafe
+            methods = multiprocessing.get_all_start_methods()
+            mp = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            self._procs = ProcessPoolExecutor(max_workers=self.processes, mp_context=mp)
+        return self._procs
+
+    # ----- cancellation ----------------------------------------------------------
+
+    def _owner_entry(self, owner: Any) -> Tuple[CancelToken, Set[Future]]:
+        # caller holds self._lock
+        entry = self._owned.get(id(owner))
+        if entry is None:
+            entry = self._owned[id(owner)] = (CancelToken(owner), set())
+        return entry
+
+    def token(self, owner: Any = None) -> CancelToken:
+        """CancelToken that cancel(owner) (pane unmount) will trip."""
+        if owner is None:
+            return CancelToken()
+        with self._lock:
+            return self._owner_entry(owner)[0]
+
+    def cancel(self, owner: Any) -> int:
+        """Cancel `owner`'s token and whatever it submitted; returns how many were pending."""
+        with self._lock:
+            entry = self._owned.pop(id(owner), None)
+        if entry is None:
+            return 0
+        tok, futs = entry
+        tok.cancel()
+        for f in list(futs):
+            f.cancel()
+        return len(futs)
+
+    # ----- introspection ---------------------------------------------------------
+
+    def thread_pool(self, name: str) -> ThreadPoolExecutor:
+        """The raw pool, e.g. as ctx.loop's default executor (not counted in stats)."""
+        return self._threads[name]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: st.summary() for name, st in self._stats.items()}
+
+    def thread_count(self) -> int:
+        return sum(st.workers for name, st in self._stats.items() if name != PROCESS)
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            owned, self._owned = self._owned, {}
+        for tok, futs in owned.values():
+            tok.cancel()
+            for f in list(futs):
+                f.cancel()
+        for ex in self._threads.values():
+            ex.shutdown(wait=wait, cancel_futures=True)
+        if self._procs is not None:
+            self._procs.shutdown(wait=wait, cancel_futures=True)
+            self._procs = None
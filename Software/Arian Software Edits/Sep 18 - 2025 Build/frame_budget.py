@@ -0,0 +1,161 @@
+# aOS1/main_ui_layer/frame_budget.py
+# =============================================================================
+# FRAME BUDGET
+# -----------------------------------------------------------------------------
+# Measures what every pane costs per frame and keeps it inside its share of
+# the display.fps budget (33 ms at 30 fps).
+#
+#   - The host wraps render(), on_voice(), on_gesture() and timer callbacks
+#     in `budget.measure(pane, kind)`.
+#   - We keep rolling per-(pane, kind) samples and report p50/p95/p99.
+#   - At the end of each frame we compare what each pane spent against
+#     `pane.frame_share * frame_ms`. Sustained overruns log a warning and, if
+#     the pane declares `quality_levels`, step it down one level. Sustained
+#     headroom steps it back up.
+# =============================================================================
+
+from __future__ import annotations
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Tuple
+
+
+def _pane_id(pane: Any) -> str:
+    return pane if isinstance(pane, str) else getattr(pane, "id", type(pane).__name__)
+
+
+class RollingStats:
+    """Last N samples (ms) with cheap percentile queries."""
+    def __init__(self, size: int = 240) -> None:
+        self.samples: "deque[float]" = deque(maxlen=size)
+        self.count = 0
+
+    def add(self, ms: float) -> None:
+        self.samples.append(ms)
+        self.count += 1
+
+    def percentile(self, p: float) -> float:
+        if not self.samples:
+            return 0.0
+        s = sorted(self.samples)
+        return s[min(len(s) - 1, int(len(s) * p / 100.0))]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "p50": round(self.percentile(50), 3),
+            "p95": round(self.percentile(95), 3),
+            "p99": round(self.percentile(99), 3),
+            "max": round(max(self.samples, default=0.0), 3),
+        }
+
+
+class FrameBudget:
+    def __init__(self, fps: int = 30, window: int = 240,
+                 overrun_frames: int = 15, recover_frames: int = 300,
+                 warn_interval_s: float = 5.0) -> None:
+        self.frame_ms = 1000.0 / max(1, fps)
+        self.window = window
+        self.overrun_frames = overrun_frames    # consecutive overruns before stepping down
+        self.recover_frames = recover_frames    # consecutive calm frames before stepping up
+        self.warn_interval_s = warn_interval_s
+
+        self.stats: Dict[Tuple[str, str], RollingStats] = {}
+        self.frame_totals: Dict[str, RollingStats] = {}
+        self._this_frame: Dict[str, float] = defaultdict(float)
+        self._panes: Dict[str, Any] = {}
+        self._over: Dict[str, int] = defaultdict(int)
+        self._calm: Dict[str, int] = defaultdict(int)
+        self._last_warn: Dict[str, float] = {}
+
+    def set_fps(self, fps: int) -> None:
+        self.frame_ms = 1000.0 / max(1, fps)
+
+    # ----- measuring ---------------------------------------------------------
+
+    @contextmanager
+    def measure(self, pane: Any, kind: str) -> Iterator[None]:
+        """Time one callback (render / on_voice / on_gesture / timer...)."""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(pane, kind, (time.perf_counter() - t0) * 1000.0)
+
+    def record(self, pane: Any, kind: str, ms: float) -> None:
+        pid = _pane_id(pane)
+        if not isinstance(pane, str):
+            self._panes[pid] = pane
+        key = (pid, kind)
+        st = self.stats.get(key)
+        if st is None:
+            st = self.stats[key] = RollingStats(self.window)
+        st.add(ms)
+        self._this_frame[pid] += ms
+
+    def wrap(self, pane: Any, kind: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a timer/signal callback so its cost is charged to `pane`."""
+        def _timed(*args: Any, **kwargs: Any) -> Any:
+            with self.measure(pane, kind):
+                return fn(*args, **kwargs)
+        return _timed
+
+    # ----- per-frame bookkeeping --------------------------------------------
+
+    def share_ms(self, pane: Any) -> float:
+        return self.frame_ms * float(getattr(pane, "frame_share", 0.5))
+
+    def end_frame(self) -> None:
+        """Call once per frame after render; checks budgets, adjusts quality."""
+        spent, self._this_frame = self._this_frame, defaultdict(float)
+        for pid, ms in spent.items():
+            tot = self.frame_totals.get(pid)
+            if tot is None:
+                tot = self.frame_totals[pid] = RollingStats(self.window)
+            tot.add(ms)
+
+            pane = self._panes.get(pid)
+            limit = self.share_ms(pane)
+            if ms > limit:
+                self._over[pid] += 1
+                self._calm[pid] = 0
+            else:
+                self._over[pid] = 0
+                if ms < 0.5 * limit:
+                    self._calm[pid] += 1
+
+            if self._over[pid] >= self.overrun_frames:
+                self._over[pid] = 0
+                self._warn(pid, tot, limit)
+                self._step(pane, +1)
+            elif self._calm[pid] >= self.recover_frames:
+                self._calm[pid] = 0
+                self._step(pane, -1)
+
+    def _warn(self, pid: str, tot: RollingStats, limit: float) -> None:
+        now = time.monotonic()
+        if now - self._last_warn.get(pid, 0.0) < self.warn_interval_s:
+            return
+        self._last_warn[pid] = now
+        print(f"[budget] ⚠️  {pid} over budget: p95 {tot.percentile(95):.1f} ms "
+              f"vs {limit:.1f} ms share of {self.frame_ms:.1f} ms frame")
+
+    def _step(self, pane: Any, direction: int) -> None:
+        """direction +1 = cheaper quality level, -1 = better one."""
+        levels = tuple(getattr(pane, "quality_levels", ()) or ())
+        if pane is None or len(levels) < 2:
+            return
+        cur = levels.index(pane.quality) if pane.quality in levels else 0
+        nxt = cur + direction
+        if 0 <= nxt < len(levels):
+            pane.set_quality(levels[nxt])
+            print(f"[budget] {pane.id}: quality {levels[cur]} -> {levels[nxt]}")
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        out: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        for (pid, kind), st in self.stats.items():
+            out[pid][kind] = st.summary()
+        for pid, st in self.frame_totals.items():
+            out[pid]["frame"] = st.summary()
+        return dict(out)
@@ -1,7 +1,11 @@
 # aOS1/main_ui_layer/pane_base.py
 # Base class for all panes (Bluetooth, Maps, Assistant, etc.)
 # Keep panes lightweight: they receive a shared `ctx` with services
-# (overlay, event_bus, camera, voice, notify, assets, store, config, display).
+# (overlay, event_bus, camera, voice, notify, assets, store, config, display,
+# executors, loop). Background work goes through ctx.executors / ctx.loop with
+# owner=self, never a thread of the pane's own. render() can skip work with
+# a ctx.store.watch("battery", ...) whose changed() is False. Polling panes
+# take their cadence from ctx.power.profile (detector_fps, weather_s).
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
@@ -32,10 +36,17 @@ class Pane(ABC):
     title: str = "Pane"
     # Relative icon path inside VA-Assets (optional)
     icon: Optional[str] = None
+    # Fraction of the display.fps frame budget this pane may spend per frame
+    frame_share: float = 0.5
+    # Quality levels, best first. The host steps down when the pane keeps
+    # overrunning its share, and back up when there's headroom.
+    quality_levels: tuple[str, ...] = ("normal",)
 
     def __init__(self) -> None:
         self.ctx: Any = None            # populated by mount()
         self._mounted: bool = False
+        self.quality: str = self.quality_levels[0]
+        self.hibernated: bool = False
 
     # ----- Lifecycle ---------------------------------------------------------
 
@@ -82,6 +93,52 @@ class Pane(ABC):
         """Generic actions routed from the system (e.g., notifications)."""
         pass
 
+    # ----- Quality -----------------------------------------------------------
+
+    def set_quality(self, level: str) -> None:
+        if level != self.quality:
+            self.quality = level
+            self.on_quality_change(level)
+
+    def on_quality_change(self, level: str) -> None:
+        """Optional: drop resolution, skip frames, disable effects, etc."""
+        pass
+
+    # ----- Memory pressure ---------------------------------------------------
+
+    def hibernate(self) -> None:
+        """Called by the memory manager while the pane is hidden."""
+        if not self.hibernated:
+            self.on_hibernate()
+            self.hibernated = True
+
+    def wake(self) -> None:
+        """Called by the host before the next mount of a hibernated pane."""
+        if self.hibernated:
+            self.hibernated = False
+            self.on_wake()
+
+    def on_hibernate(self) -> None:
+        """Optional: drop heavy resources (models, graphs, canvases, decoded assets)."""
+        pass
+
+    def on_wake(self) -> None:
+        """Optional: rebuild whatever on_hibernate() dropped."""
+        pass
+
+    # ----- Fast resume -------------------------------------------------------
+
+    def snapshot_state(self) -> Any:
+        """
+        Optional: small plain-data state (dict/list/str/numbers/bytes) to keep
+        across reboots; None means nothing to save. See snapshot.py.
+        """
+        return None
+
+    def restore_state(self, state: Any) -> None:
+        """Optional: take back what snapshot_state() returned last run."""
+        pass
+
     # ----- Helpers -----------------------------------------------------------
 
     def ensure_mounted(self) -> None:
@@ -0,0 +1,221 @@
+# aOS1/main_ui_layer/pane_host.py
+# =============================================================================
+# PANE HOST
+# -----------------------------------------------------------------------------
+# The loop that drives ctx-style panes (see pane_base.Pane):
+#   - subscribes to every ctx.event_bus type and, once per frame, pumps the
+#     queued events (highest priority first, coalesced, within
+#     config events.frame_share of the frame; the rest waits a frame) and
+#     routes them to the active pane
+#       NAVIGATE {"pane_id": ...}        -> unmount old pane, mount new one
+#       VOICE    {"text": ...}           -> active.on_voice(text)
+#       GESTURE  {"name": ..., "data"}   -> active.on_gesture(name, data)
+#       CALL     {"fn": callable}        -> fn() on the host thread (ctx.loop
+#                                           results, other threads' callbacks)
+#       anything else                    -> active.on_action(type, **payload)
+#   - between frames sleeps on the bus's wakeup fd rather than time.sleep,
+#     so events from other threads are delivered as soon as they arrive
+#   - runs pane timers registered with add_timer()
+#   - cancels a pane's ctx.executors / ctx.loop work (owner=pane) on unmount
+#   - calls render() once per display frame between overlay begin/end_frame
+#   - charges every callback to its pane in ctx.budget (frame_budget.py)
+#   - polls ctx.config_service once per frame so config.yaml edits apply live
+#   - offers hidden panes to ctx.memory (memory_manager.py) least recently
+#     used first, and wakes a hibernated pane before mounting it again
+#   - lets ctx.power (power_profiles.py) re-read the battery and switch
+#     profile; the frame rate below follows it through ctx.display.fps
+#   - with ctx.snapshot (snapshot.py): saves the active pane and any pane
+#     snapshot_state() periodically and on stop(), and resumes from them
+#
+# Example:
+#     ctx = make_services()
+#     host = PaneHost(ctx, [LauncherPane(), WiFiPane(), SettingsPane()])
+#     host.run()
+# =============================================================================
+
+from __future__ import annotations
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    from .pane_base import Pane
+except ImportError:         # run from this directory, not as aOS1.main_ui_layer
+    from pane_base import Pane
+
+
+class PaneHost:
+    def __init__(self, ctx: Any, panes: Iterable[Pane]) -> None:
+        self.ctx = ctx
+        self.budget = ctx.budget
+        self.panes: Dict[str, Pane] = {p.id: p for p in panes}
+        self.active: Optional[Pane] = None
+        self._timers: List[list] = []      # [pane, interval_s, next_due, fn]
+        self._running = False
+        self._lru: "OrderedDict[str, None]" = OrderedDict()   # pane ids, oldest first
+        self._resume_pane: Optional[str] = None
+        self.snapshot = getattr(ctx, "snapshot", None)
+        if self.snapshot is not None:
+            self.snapshot.register("host", self._snapshot_host, self._restore_host)
+            for p in self.panes.values():
+                if type(p).snapshot_state is not Pane.snapshot_state:
+                    self.snapshot.register(f"pane:{p.id}", p.snapshot_state, p.restore_state)
+        self.memory = getattr(ctx, "memory", None)
+        if self.memory is not None:
+            self.memory.add_source(self.hibernate_candidates)
+        self.power = getattr(ctx, "power", None)
+        self.events = ctx.event_bus.subscribe(["*"], self.dispatch, name="host")
+
+    # ----- Fast resume -------------------------------------------------------
+
+    def _snapshot_host(self) -> dict:
+        return {"pane": self.active.id if self.active is not None else None}
+
+    def _restore_host(self, state: dict) -> None:
+        self._resume_pane = state.get("pane")
+
+    # ----- Navigation --------------------------------------------------------
+
+    def navigate(self, pane_id: str) -> None:
+        pane = self.panes.get(pane_id)
+        if pane is None or pane is self.active:
+            return
+        if self.active is not None:
+            with self.budget.measure(self.active, "unmount"):
+                self.active.unmount()
+            self._cancel_work(self.active)
+        self.active = pane
+        self._lru.pop(pane.id, None)
+        self._lru[pane.id] = None
+        with self.budget.measure(pane, "mount"):
+            pane.wake()
+            pane.mount(self.ctx)
+
+    def _cancel_work(self, pane: Pane) -> None:
+        """Drop background work the pane started (executors / loop, owner=pane)."""
+        for svc in (getattr(self.ctx, "executors", None), getattr(self.ctx, "loop", None)):
+            if svc is not None:
+                svc.cancel(pane)
+
+    def hibernate_candidates(self) -> List[tuple]:
+        """(name, release) for hidden panes that can hibernate, LRU first."""
+        out = []
+        for pid in self._lru:
+            pane = self.panes[pid]
+            if (pane is self.active or pane.hibernated
+                    or type(pane).on_hibernate is Pane.on_hibernate):
+                continue
+            out.append((f"pane:{pid}", pane.hibernate))
+        return out
+
+    # ----- Timers ------------------------------------------------------------
+
+    def add_timer(self, pane: Pane, interval_s: float, fn: Callable[[], Any]) -> None:
+        """Periodic callback for `pane`; only fires while the pane is mounted."""
+        self._timers.append([pane, interval_s, time.monotonic() + interval_s, fn])
+
+    def _run_timers(self, now: float) -> None:
+        for t in self._timers:
+            pane, interval, due, fn = t
+            if now < due:
+                continue
+            t[2] = now + interval
+            if pane._mounted:
+                with self.budget.measure(pane, "timer"):
+                    fn()
+
+    # ----- Events ------------------------------------------------------------
+
+    def dispatch(self, event: dict) -> None:
+        type_, payload = event.get("type"), event.get("payload", {})
+        if type_ == "NAVIGATE":
+            self.navigate(payload.get("pane_id", ""))
+            return
+        if type_ == "CALL":
+            payload["fn"]()
+            return
+        pane = self.active
+        if pane is None:
+            return
+        if type_ == "VOICE":
+            with self.budget.measure(pane, "on_voice"):
+                pane.on_voice(payload.get("text", ""))
+        elif type_ == "GESTURE":
+            with self.budget.measure(pane, "on_gesture"):
+                pane.on_gesture(payload.get("name", ""), payload.get("data"))
+        else:
+            with self.budget.measure(pane, "on_action"):
+                pane.on_action(type_, **payload)
+
+    def pump_events(self) -> int:
+        # read every call so fps / frame_share changes apply live
+        share = float(self.ctx.config.get("events", {}).get("frame_share", 0.25))
+        return self.ctx.event_bus.pump(budget_s=share / max(1, self.ctx.display.fps))
+
+    # ----- Frame loop --------------------------------------------------------
+
+    def step(self) -> None:
+        """One frame: config changes, events, timers, render, budget check."""
+        watchdog = getattr(self.ctx, "watchdog", None)
+        if watchdog is not None:
+            watchdog.beat()
+        config_service = getattr(self.ctx, "config_service", None)
+        if config_service is not None:
+            config_service.poll()
+
+        self.pump_events()
+
+        now = time.monotonic()
+        self._run_timers(now)
+        if self.snapshot is not None:
+            self.snapshot.save_if_due(now)
+        if self.memory is not None:
+            self.memory.check(now)
+        if self.power is not None:
+            self.power.check(now)
+
+        overlay = self.ctx.overlay
+        overlay.begin_frame()
+        if self.active is not None:
+            with self.budget.measure(self.active, "render"):
+                self.active.render()
+        overlay.end_frame()
+        self.budget.end_frame()
+
+    def run(self) -> None:
+        self._running = True
+        if self.active is None:
+            pane_id = self._resume_pane
+            if pane_id not in self.panes:
+                pane_id = self.ctx.config.get("default_pane", "launcher")
+            self.navigate(pane_id)
+        next_frame = time.monotonic()
+        while self._running:
+            self.step()
+            # read fps every frame so a config change retunes the loop
+            next_frame += 1.0 / max(1, self.ctx.display.fps)
+            delay = next_frame - time.monotonic()
+            if delay <= 0:
+                next_frame = time.monotonic()   # running late: don't try to catch up
+            # sleep on the bus's wakeup fd: events published meanwhile (voice
+            # thread, notifications, ...) are handled now, not next frame
+            while delay > 0 and self._running:
+                if self.ctx.event_bus.wait(delay):
+                    self.pump_events()
+                delay = next_frame - time.monotonic()
+
+    def stop(self) -> None:
+        self._running = False
+        if self.snapshot is not None:
+            self.snapshot.close()
+        for name in ("loop", "executors"):
+            svc = getattr(self.ctx, name, None)
+            if svc is not None:
+                svc.shutdown()
+        for name in ("trace", "watchdog"):
+            svc = getattr(self.ctx, name, None)
+            if svc is not None:
+                svc.close()
+        if self.active is not None:
+            self.active.unmount()
+            self.active = None
@@ -17,11 +17,25 @@
 from __future__ import annotations
 
 import os
-import queue
+import threading
+from contextlib import nullcontext
 from dataclasses import dataclass
 from types import SimpleNamespace
 from typing import Any, Optional
 
+try:
+    from .frame_budget import FrameBudget
+    from .event_bus import EventBus
+    from .executor_service import ExecutorService
+    from .state_store import StateStore
+    from .config_service import Config, ConfigService, deep_merge
+except ImportError:         # run from this directory, not as aOS1.main_ui_layer
+    from frame_budget import FrameBudget
+    from event_bus import EventBus
+    from executor_service import ExecutorService
+    from state_store import StateStore
+    from config_service import Config, ConfigService, deep_merge
+
 # ----------------------------- CONFIG LOADING --------------------------------
 # We load config.yaml if it exists, otherwise use DEFAULT_CONFIG so devs can
 # run without any setup.
@@ -45,33 +59,58 @@ DEFAULT_CONFIG = {
     "assets_dir": "VA-Assets",           # where icons/images live
     "model_path": "models/yolov5nu.pt",  # example ML model path
     "voice_hotword": "hey vision",       # wake phrase for voice manager
+    "memory": {                          # memory-pressure watermarks (MB)
+        "rss_high_mb": 300,              # hibernate hidden panes above this RSS
+        "rss_critical_mb": 380,          # ...all of them above this one
+        "avail_low_mb": 80,              # or when free system RAM drops below
+        "avail_critical_mb": 40,
+        "interval_s": 2.0
+    },
+    "executors": {                       # ctx.executors threads (executor_service.py);
+        "io": 2,                         # read at boot only
+        "cpu": 2,
+        "process": 1
+    },
+    "events": {                          # host-loop event draining (event_bus.py)
+        "frame_share": 0.25              # at most this share of a frame; rest waits a frame
+    },
+    "power": {                           # battery-aware profiles (power_profiles.py)
+        "profile": "auto",               # or "performance" | "balanced" | "saver" to pin one
+        "saver_pct": 20,                 # on battery at or below this: saver
+        "hysteresis_pct": 5,             # ...until it's back above saver_pct + this
+        "interval_s": 10.0
+    },
     "features": {
         "background_removal": False,     # if True: run a simple BG stripper
-        "background_mode": "black"       # "black" | "blur" | "transparent" (future)
+        "background_mode": "black"       # "black" | "blur" | "off" | "transparent" (future);
+                                         # the power profile may cap it (ctx.background_remove)
     }
 }
 
 
-def load_config(repo_root: Optional[str] = None) -> dict:
+def config_path(repo_root: Optional[str] = None) -> str:
+    return os.path.join(repo_root or os.getcwd(), "config.yaml")
+
+
+def load_config(repo_root: Optional[str] = None, strict: bool = False) -> dict:
     """
     Try to read config.yaml at the repo root. If missing or YAML not installed,
-    we log a note and continue with DEFAULT_CONFIG.
+    we log a note and continue with DEFAULT_CONFIG. With strict=True (config
+    hot-reload) a file that fails to parse raises instead.
     """
-    cfg = DEFAULT_CONFIG.copy()
-    repo_root = repo_root or os.getcwd()
-    path = os.path.join(repo_root, "config.yaml")
+    cfg = deep_merge(DEFAULT_CONFIG, {})   # deep copy: never mutate the defaults
+    path = config_path(repo_root)
 
     if yaml and os.path.exists(path):
         try:
             with open(path, "r", encoding="utf-8") as f:
                 user_cfg = yaml.safe_load(f) or {}
-            # Shallow merge is fine for our simple tree
-            for k, v in user_cfg.items():
-                if isinstance(v, dict) and isinstance(cfg.get(k), dict):
-                    cfg[k].update(v)
-                else:
-                    cfg[k] = v
+            if not isinstance(user_cfg, dict):
+                raise ValueError("top level must be a mapping")
+            cfg = deep_merge(cfg, user_cfg)
         except Exception as e:
+            if strict:
+                raise
             print(f"[services] ⚠️  Failed to read config.yaml: {e}. Using defaults.")
     else:
         if not yaml:
@@ -102,25 +141,16 @@ class DisplayProfile:
 
 
 # -------------------------------- EVENT BUS ----------------------------------
-# Tiny, thread-safe FIFO queue. Everything in the system talks by posting events.
+# Topic pub/sub (event_bus.py). Everything in the system talks by posting events.
 # Example events:
 #   {"type": "NAVIGATE", "payload": {"pane_id": "maps"}}
 #   {"type": "VOICE", "payload": {"text": "open bluetooth"}}
-
-class EventBus:
-    def __init__(self) -> None:
-        import threading
-        self._q: "queue.Queue[dict]" = queue.Queue()
-        self._lock = threading.Lock()
-
-    def emit(self, type_: str, **payload: Any) -> None:
-        self._q.put({"type": type_, "payload": payload})
-
-    def next(self, block: bool = False, timeout: float = 0.0) -> dict:
-        try:
-            return self._q.get(block=block, timeout=timeout)
-        except queue.Empty:
-            return {"type": "NOP", "payload": {}}
+# Subscribers get bounded per-priority queues, so a flood of DETECTIONS or
+# TELEMETRY can't delay a SAFETY alert. PaneHost drains the bus once per frame
+# within events.frame_share of the frame time; bursts of NAVIGATE, partial
+# VOICE and STORE updates are coalesced so only the latest is handled.
+# Between frames the host sleeps on the bus's wakeup fd, so producer threads
+# (voice, notifications) don't wait for the next poll.
 
 
 # ------------------------------ ASSET LOADER ---------------------------------
@@ -203,6 +233,12 @@ def _import_or_none(modpath: str) -> Optional[Any]:
         return None
 
 
+def _boot_phase(name: str) -> Any:
+    """Time a make_services step when boot_profiler is around; no-op otherwise."""
+    bp = _import_or_none("aOS1.main_ui_layer.boot_profiler") or _import_or_none("boot_profiler")
+    return bp.profiler.phase(f"services: {name}") if bp else nullcontext()
+
+
 class CameraManager:
     """
     Wraps camera access. If aOS1.main_ui_layer.camera.CameraManager exists,
@@ -224,6 +260,18 @@ class CameraManager:
                 self._cv2 = None
                 self._cap = None
 
+    def set_mode(self, size: tuple[int, int], fps: int) -> None:
+        """Capture size (w, h) and frame rate (power profiles). Best effort."""
+        if self._impl:
+            if hasattr(self._impl, "set_mode"):
+                self._impl.set_mode(size, fps)
+            return
+        if self._cv2 and self._cap:
+            cv2 = self._cv2
+            self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, size[0])
+            self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, size[1])
+            self._cap.set(cv2.CAP_PROP_FPS, fps)
+
     def read(self):
         """Return (ok, frame). Always safe to call; will just return (False, None) if unavailable."""
         if self._impl:
@@ -242,23 +290,42 @@ class VoiceManager:
     def __init__(self, event_bus: EventBus, hotword: str) -> None:
         self.event_bus = event_bus
         self.hotword = hotword
+        self.mode = "push"      # "hotword": mic always open | "push": on request (power profile)
 
     def push_transcript(self, text: str) -> None:
-        """System/dev can call this to simulate voice input."""
+        """System/dev can call this to simulate voice input. Safe from any
+        thread (mic/STT thread): the bus wakes the host loop right away."""
         self.event_bus.emit("VOICE", text=text)
 
 
 class NotificationCenter:
-    """Simple wrapper so panes can show user feedback and we can also log."""
-    def __init__(self, overlay: Overlay) -> None:
+    """
+    Simple wrapper so panes can show user feedback and we can also log.
+    Callable from any thread: calls off the thread that built it (the host
+    loop's) are posted as NOTIFY events and shown when the host pumps them.
+    """
+    def __init__(self, overlay: Overlay, event_bus: Optional[EventBus] = None) -> None:
         self.overlay = overlay
+        self.event_bus = event_bus
+        self._owner = threading.get_ident()
+        if event_bus is not None:
+            event_bus.subscribe(["NOTIFY"], self._on_event, name="notify")
 
     def info(self, msg: str) -> None:
-        self.overlay.toast(msg)
+        self._show(msg)
 
     def error(self, msg: str) -> None:
         # We could style errors differently later
-        self.overlay.toast(f"Error: {msg}")
+        self._show(f"Error: {msg}")
+
+    def _show(self, text: str) -> None:
+        if self.event_bus is not None and threading.get_ident() != self._owner:
+            self.event_bus.emit("NOTIFY", text=text)
+        else:
+            self.overlay.toast(text)
+
+    def _on_event(self, ev: dict) -> None:
+        self.overlay.toast(ev["payload"].get("text", ""))
 
 
 # ---------------------------- OPTIONAL PROCESSORS ----------------------------
@@ -270,6 +337,8 @@ def simple_background_removal(frame, mode: str = "black"):
     Very basic placeholder: returns a frame with the background darkened/black.
     This is intentionally naive so it runs everywhere. Replace later as needed.
     """
+    if mode == "off":
+        return frame
     try:
         import cv2
         import numpy as np
@@ -298,33 +367,99 @@ def make_services(repo_root: Optional[str] = None) -> Any:
     Build and return the shared context (ctx). All panes receive this object
     in their `mount(ctx)` method.
     """
-    # 1) Load config
-    config = load_config(repo_root)
+    # 1) Load config into a typed, immutable Config; config.yaml is watched
+    #    and changes are pushed to subscribers (see config_service.py)
+    with _boot_phase("load_config"):
+        config_service = ConfigService(config_path(repo_root),
+                                       lambda strict=False: load_config(repo_root, strict))
+        config_service.watch()
+    config = config_service.config
 
     # 2) Build display profile
-    d = config["display"]
+    d = config.display
     display = DisplayProfile(
-        width=int(d.get("width", 800)),
-        height=int(d.get("height", 480)),
-        ppi=int(d.get("ppi", 220)),
-        safe_insets=tuple(d.get("safe_insets", [28, 12, 12, 12])),
-        fps=int(d.get("fps", 30)),
+        width=d.width,
+        height=d.height,
+        ppi=d.ppi,
+        safe_insets=d.safe_insets,
+        fps=d.fps,
     )
 
     # 3) Core services
     event_bus = EventBus()
-    assets = AssetLoader(config["assets_dir"])
-    overlay = Overlay(assets, display)
-    camera = CameraManager()
-    voice = VoiceManager(event_bus, config.get("voice_hotword", "hey vision"))
-    notify = NotificationCenter(overlay)
+    assets = AssetLoader(config.assets_dir)
+    with _boot_phase("overlay"):
+        overlay = Overlay(assets, display)
+    with _boot_phase("camera"):
+        camera = CameraManager()
+    voice = VoiceManager(event_bus, config.voice_hotword)
+    notify = NotificationCenter(overlay, event_bus)
+    budget = FrameBudget(display.fps)
 
     # 4) Optional placeholders (future wiring)
-    ocr = _import_or_none("aOS1.main_ui_layer.ocr_manager") or _import_or_none("ocr_manager")
-    detector = _import_or_none("aOS1.main_ui_layer.tpu_detector") or _import_or_none("tpu_detector")
-
-    # 5) Simple global key-value store for tiny bits of shared state
-    store = {"battery": 100, "net": "wifi", "gps": False}
+    with _boot_phase("ocr"):
+        ocr = _import_or_none("aOS1.main_ui_layer.ocr_manager") or _import_or_none("ocr_manager")
+    with _boot_phase("detector"):
+        detector = _import_or_none("aOS1.main_ui_layer.tpu_detector") or _import_or_none("tpu_detector")
+
+    # 5) Global key-value store for tiny bits of shared state.
+    #    With snapshot.py around it's saved on shutdown / every minute and
+    #    restored here on the next boot (fast resume).
+    #    A StateStore (state_store.py): still a dict, but versioned and
+    #    observable, so panes can skip redraws when their keys didn't change.
+    store = StateStore({"battery": 100, "net": "wifi", "gps": False}, event_bus)
+    snap = _import_or_none("aOS1.main_ui_layer.snapshot") or _import_or_none("snapshot")
+    snapshot = snap.snapshots if snap else None
+    if snapshot is not None:
+        snapshot.register("store", store.snapshot, store.update)
+
+    # 5b) Memory-pressure manager: PaneHost offers it hidden panes to hibernate
+    mem = _import_or_none("aOS1.main_ui_layer.memory_manager") or _import_or_none("memory_manager")
+    memory = mem.MemoryManager.from_config(config.get("memory", {})) if mem else None
+
+    # 5c) One asyncio loop for network / subprocess waits (async_runtime.py).
+    #     Blocking / CPU work goes to ctx.executors' fixed pools; both post
+    #     results back as CALL events, so callbacks run on the host loop
+    def post(fn: Any) -> None:
+        event_bus.emit("CALL", fn=fn)
+
+    executors = ExecutorService.from_config(dict(config.get("executors", {})), post=post)
+    aio = _import_or_none("aOS1.main_ui_layer.async_runtime") or _import_or_none("async_runtime")
+    loop = aio.AsyncRuntime(post=post) if aio else None
+    if loop is not None:
+        # in_thread() fallbacks share the io pool instead of asyncio's own
+        loop.loop.set_default_executor(executors.thread_pool("io"))
+
+    # 5d) ARIES_TRACE: record every bus event to a compact binary trace that
+    #     event_trace.py can replay into a headless instance
+    tr = _import_or_none("aOS1.main_ui_layer.event_trace") or _import_or_none("event_trace")
+    trace = tr.trace_from_env() if tr else None
+    if trace is not None:
+        trace.attach(event_bus)
+
+    # 5e) GUI stalls: PaneHost beats once per frame; when a frame doesn't come
+    #     round within ARIES_STALL_MS the host thread's stack is sampled and
+    #     the stall charged to its call site (stall_watchdog.py)
+    sw = _import_or_none("aOS1.main_ui_layer.stall_watchdog") or _import_or_none("stall_watchdog")
+    #     ("our code" = aOS1/, so main_ui_layer and ui_layer_apps both count)
+    aos1 = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    watchdog = sw.watchdog_from_env((aos1,)) if sw else None
+
+    # 5f) Battery-aware power profile (power_profiles.py): camera mode,
+    #     frame rate, background removal and voice mode switch together;
+    #     PaneHost calls ctx.power.check() each frame (rate-limited) and panes
+    #     read ctx.power.profile for their own cadences (detector_fps,
+    #     weather_s). config `power.profile` pins one.
+    pp = _import_or_none("aOS1.main_ui_layer.power_profiles") or _import_or_none("power_profiles")
+    power = pp.PowerManager.from_config(config.get("power", {})) if pp else None
+
+    def background_remove(frame, mode: Optional[str] = None):
+        """simple_background_removal, no dearer than the power profile allows."""
+        mode = mode or ctx.config.features.background_mode
+        allowed = power.profile.background if power is not None else "blur"
+        if allowed == "off":
+            return frame
+        return simple_background_removal(frame, "black" if allowed == "black" else mode)
 
     # 6) Return a single namespace with everything panes need
     ctx = SimpleNamespace(
@@ -334,15 +469,60 @@ def make_services(repo_root: Optional[str] = None) -> Any:
         assets=assets,
         display=display,
         config=config,
+        config_service=config_service,
         store=store,
+        snapshot=snapshot,
         # Devices/services
         camera=camera,
         voice=voice,
         notify=notify,
+        budget=budget,
+        memory=memory,
+        loop=loop,
+        executors=executors,
+        trace=trace,
+        watchdog=watchdog,
+        power=power,
         ocr=ocr,
         detector=detector,
         # Utilities
-        background_remove=simple_background_removal,
+        background_remove=background_remove,
     )
 
+    # 7) Live config: keep ctx in step with config.yaml / runtime overrides.
+    #    PaneHost reads ctx.display.fps every frame, so an fps change retunes
+    #    the loop on the next frame without a restart.
+    def _on_config(cfg: Config, changed: list) -> None:
+        ctx.config = cfg
+
+    def _fps(cfg: Config) -> int:
+        # the power profile caps the configured frame rate
+        if power is None:
+            return cfg.display.fps
+        return min(cfg.display.fps, power.profile.display_fps)
+
+    def _on_display(cfg: Config, changed: list) -> None:
+        d = cfg.display
+        display.width, display.height, display.ppi = d.width, d.height, d.ppi
+        display.safe_insets, display.fps = d.safe_insets, _fps(cfg)
+        budget.set_fps(display.fps)
+
+    def _on_power(p: Any) -> None:
+        display.fps = _fps(ctx.config)
+        budget.set_fps(display.fps)
+        camera.set_mode(p.camera_size, p.camera_fps)
+        voice.mode = p.voice
+
+    config_service.subscribe(["*"], _on_config)
+    config_service.subscribe(["display"], _on_display)
+    config_service.subscribe(["voice_hotword"],
+                             lambda cfg, changed: setattr(voice, "hotword", cfg.voice_hotword))
+    if memory is not None:
+        config_service.subscribe(["memory"],
+                                 lambda cfg, changed: memory.configure(cfg.get("memory", {})))
+    if power is not None:
+        power.bind(_on_power)
+        config_service.subscribe(["power"],
+                                 lambda cfg, changed: power.configure(cfg.get("power", {})))
+
     return ctx
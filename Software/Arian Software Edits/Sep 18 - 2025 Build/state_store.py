@@ -0,0 +1,277 @@
+# aOS1/main_ui_layer/state_store.py
+# =============================================================================
+# STATE STORE
+# -----------------------------------------------------------------------------
+# ctx.store: shared key/value state ("battery", "net", "wifi_connected", ...)
+# that any thread may write. Still a dict to old code (store["net"] = "lte",
+# store.get("gps")), plus:
+#
+#   versions     every real change bumps the global store.version and stamps
+#                the key with it; writing an equal value is a no-op
+#   atomic       store.mutate("volume", lambda v: min(100, v + 10), 50)
+#                with store.batch(): ...     (several keys, one version; if
+#                the body raises, its writes are undone and nobody hears)
+#   subscribe    store.subscribe(["battery", "wifi_*"], fn)  -> fn(changes, version)
+#                on the host thread (via STORE events on the bus), or on the
+#                writer's thread with sync=True; patterns are fnmatch-style
+#   change test  store.changed_since(v, "battery", "net")   -> bool, O(1) when
+#                nothing at all changed since v
+#                w = store.watch("battery", "net")          # for render()
+#                if w.changed(): ...redraw...
+#
+# Every change is also published as STORE {"key", "value", "version"} so the
+# bus coalesces bursts per key (last writer wins, event_bus.DEFAULT_COALESCE)
+# and PaneHost routes them to the active pane's on_action("STORE", ...).
+# =============================================================================
+
+from __future__ import annotations
+import fnmatch
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, MutableMapping, Optional, Tuple
+
+ChangeHandler = Callable[[Dict[str, Any], int], None]
+_MISSING = object()
+
+
+class Watch:
+    """Remembers the version it last saw for a set of keys / patterns."""
+    def __init__(self, store: "StateStore", keys: Tuple[str, ...]) -> None:
+        self.store = store
+        self.keys = keys
+        self.seen = -1          # first changed() is always True
+
+    def changed(self) -> bool:
+        """True (once) if any watched key changed since the last call."""
+        v = self.store.version
+        if v == self.seen:
+            return False
+        hit = self.store.changed_since(self.seen, *self.keys)
+        self.seen = v
+        return hit
+
+
+class _Subscription:
+    def __init__(self, patterns: Tuple[str, ...], handler: ChangeHandler, sync: bool) -> None:
+        self.patterns = patterns
+        self.handler = handler
+        self.sync = sync
+
+    def matches(self, key: str) -> bool:
+        return any(p == key or fnmatch.fnmatchcase(key, p) for p in self.patterns)
+
+
+class StateStore(MutableMapping):
+    def __init__(self, initial: Optional[Dict[str, Any]] = None, event_bus: Any = None) -> None:
+        self._data: Dict[str, Any] = {}
+        self._versions: Dict[str, int] = {}
+        self.version = 0
+        self._lock = threading.RLock()
+        self._subs: Tuple[_Subscription, ...] = ()
+        self._batch: Optional[Dict[str, Any]] = None     # key -> value / _MISSING
+        self._undo: List[Dict[str, Any]] = []             # per open batch(): value on entry
+        self._depth = 0
+        self._match_cache: Dict[str, List[str]] = {}     # pattern -> known keys
+        self.bus = event_bus
+        if event_bus is not None:
+            event_bus.subscribe(["STORE"], self._on_event, name="store")
+        if initial:
+            self.update(initial)
+
+    # ----- dict surface ------------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self.batch():
+            self._set(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        with self.batch():
+            if key not in self._data:
+                raise KeyError(key)
+            self._set(key, _MISSING)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """dict.update, as one atomic change."""
+        with self.batch():
+            for k, v in dict(*args, **kwargs).items():
+                self._set(k, v)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._data)
+
+    def __repr__(self) -> str:
+        return f"StateStore(v{self.version}, {self._data!r})"
+
+    # ----- atomic updates ----------------------------------------------------
+
+    @contextmanager
+    def batch(self) -> Iterator["StateStore"]:
+        """
+        Group writes: one version bump and one notification for all of them.
+        If the body raises, the writes made inside it are rolled back, with
+        no version bump and no notification, and the exception propagates.
+        """
+        fire = None
+        with self._lock:
+            self._depth += 1
+            if self._batch is None:
+                self._batch = {}
+            undo: Dict[str, Any] = {}
+            self._undo.append(undo)
+            try:
+                yield self
+            except BaseException:
+                for k, old in undo.items():
+                    if old is _MISSING:
+                        self._data.pop(k, None)
+                    else:
+                        self._data[k] = old
+                raise
+            finally:
+                self._undo.pop()
+                self._depth -= 1
+                if self._depth == 0:
+                    before, self._batch = self._batch, None
+                    fire = self._commit(before) if before else None
+        if fire is not None:
+            self._notify(*fire)
+
+    def mutate(self, key: str, fn: Callable[[Any], Any], default: Any = None) -> Any:
+        """Atomically store[key] = fn(store.get(key, default)); returns the new value."""
+        with self.batch():
+            value = fn(self._data.get(key, default))
+            self._set(key, value)
+        return value
+
+    def _set(self, key: str, value: Any) -> None:
+        # caller holds the lock, inside batch()
+        old = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            self._data.pop(key, None)
+        else:
+            self._data[key] = value
+        if key not in self._batch:
+            self._batch[key] = old          # pre-batch value, compared on commit
+        for undo in self._undo:
+            if key not in undo:
+                undo[key] = old             # for rolling back that batch()
+
+    def _commit(self, before: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], int]]:
+        # caller holds the lock
+        changes = {}
+        for k, old in before.items():
+            new = self._data.get(k, _MISSING)
+            if not _same(old, new):
+                changes[k] = None if new is _MISSING else new
+        if not changes:
+            return None
+        self.version += 1
+        for k in changes:
+            self._versions[k] = self.version            # deletions count too
+            if before[k] is _MISSING:
+                self._match_cache.clear()               # a new key for patterns
+        return changes, self.version
+
+    # ----- change queries ----------------------------------------------------
+
+    def version_of(self, key: str) -> int:
+        return self._versions.get(key, 0)
+
+    def changed_since(self, version: int, *keys: str) -> bool:
+        """Did any of `keys` (names or fnmatch patterns; none = any key) change after `version`?"""
+        if version >= self.version:
+            return False
+        if not keys:
+            return True
+        vs = self._versions
+        for k in keys:
+            if _is_pattern(k):
+                if any(vs.get(m, 0) > version for m in self._matching(k)):
+                    return True
+            elif vs.get(k, 0) > version:
+                return True
+        return False
+
+    def _matching(self, pattern: str) -> List[str]:
+        hit = self._match_cache.get(pattern)
+        if hit is None:
+            with self._lock:
+                hit = [k for k in self._versions if fnmatch.fnmatchcase(k, pattern)]
+                self._match_cache[pattern] = hit
+        return hit
+
+    def watch(self, *keys: str) -> Watch:
+        return Watch(self, keys)
+
+    # ----- subscriptions -----------------------------------------------------
+
+    def subscribe(self, patterns: Iterable[str], handler: ChangeHandler,
+                  sync: bool = False) -> _Subscription:
+        """
+        handler(changes, version) with the matching {key: value} (None when
+        deleted). Runs on the host loop, or on the writer's thread if sync
+        (keep those cheap and thread-safe).
+        """
+        patterns = tuple([patterns] if isinstance(patterns, str) else patterns)
+        sub = _Subscription(patterns, handler, sync or self.bus is None)
+        with self._lock:
+            self._subs += (sub,)
+        return sub
+
+    def unsubscribe(self, sub: _Subscription) -> None:
+        with self._lock:
+            self._subs = tuple(s for s in self._subs if s is not sub)
+
+    def _notify(self, changes: Dict[str, Any], version: int) -> None:
+        self._deliver(changes, version, sync=True)
+        if self.bus is not None:
+            for k, v in changes.items():
+                self.bus.emit("STORE", key=k, value=v, version=version)
+
+    def _on_event(self, ev: dict) -> None:
+        # host thread; several STORE events may have been coalesced into one
+        p = ev["payload"]
+        self._deliver({p["key"]: p.get("value")}, p.get("version", self.version), sync=False)
+
+    def _deliver(self, changes: Dict[str, Any], version: int, sync: bool) -> None:
+        for sub in self._subs:
+            if sub.sync != sync:
+                continue
+            mine = {k: v for k, v in changes.items() if sub.matches(k)}
+            if not mine:
+                continue
+            try:
+                sub.handler(mine, version)
+            except Exception as e:
+                print(f"[store] ⚠️  subscriber for {list(sub.patterns)} failed: {e}")
+
+
+def _is_pattern(key: str) -> bool:
+    return any(c in key for c in "*?[")
+
+
+def _same(a: Any, b: Any) -> bool:
+    if a is b:
+        return True
+    if a is _MISSING or b is _MISSING:
+        return False
+    try:
+        return bool(a == b)
+    except Exception:           # e.g. numpy arrays
+        return False
@@ -0,0 +1,103 @@
+# test_config_service.py
+"""ConfigService with an in-memory loader: diffing, overrides, failed reloads."""
+import copy
+
+from config_service import Config, ConfigService, DisplayConfig, diff
+
+BASE = {
+    "display": {"width": 640, "height": 400, "fps": 30},
+    "features": {"background_removal": False, "background_mode": "black"},
+    "voice_hotword": "hey vision",
+}
+
+
+class Loader:
+    """Stands in for services.load_config; `fail` makes strict reloads raise."""
+
+    def __init__(self, cfg):
+        self.cfg = cfg
+        self.fail = False
+
+    def __call__(self, strict=False):
+        if strict and self.fail:
+            raise ValueError("top level must be a mapping")
+        return copy.deepcopy(self.cfg)
+
+
+def _service(cfg=BASE):
+    loader = Loader(copy.deepcopy(cfg))
+    return ConfigService("/nonexistent/config.yaml", loader), loader
+
+
+def test_missing_display_keys_use_the_field_defaults():
+    assert DisplayConfig.from_dict({}) == DisplayConfig()
+    assert Config.from_dict({}).display == DisplayConfig()
+
+
+def test_diff_lists_changed_dotted_keys():
+    old = Config.from_dict(BASE)
+    new = Config.from_dict({**BASE, "display": {**BASE["display"], "fps": 60},
+                            "extra": {"a": 1}})
+    assert diff(old, new) == ["display.fps", "extra.a"]
+    assert diff(old, Config.from_dict(copy.deepcopy(BASE))) == []
+
+
+def test_dict_style_access_still_works():
+    cfg = Config.from_dict({**BASE, "features": {**BASE["features"], "gestures": True}})
+    assert cfg.get("features", {}).get("background_mode") == "black"
+    assert cfg.get("features.gestures") is True
+    assert cfg["display.width"] == 640
+    assert cfg.get("missing.key", "dflt") == "dflt"
+
+
+def test_set_overrides_and_notifies_matching_subscribers():
+    svc, _ = _service()
+    seen = []
+    svc.subscribe(["features"], lambda cfg, changed: seen.append(("features", changed)))
+    svc.subscribe(["display.fps"], lambda cfg, changed: seen.append(("fps", changed)))
+    assert svc.set("features.background_mode", "blur") == ["features.background_mode"]
+    assert svc.config.features.background_mode == "blur"
+    assert seen == [("features", ["features.background_mode"])]
+    # same value again: nothing changed, nobody called
+    assert svc.set("features.background_mode", "blur") == []
+    assert len(seen) == 1
+
+
+def test_override_survives_a_reload():
+    svc, loader = _service()
+    svc.set("voice_hotword", "hey aries")
+    loader.cfg["display"]["fps"] = 60
+    assert svc.reload() == ["display.fps"]
+    assert svc.config.voice_hotword == "hey aries"
+    assert svc.config.display.fps == 60
+
+
+def test_failed_reload_keeps_the_current_config():
+    svc, loader = _service()
+    before = svc.config
+    loader.cfg["display"]["fps"] = 60
+    loader.fail = True
+    assert svc.reload() == []
+    assert svc.config is before
+    loader.fail = False
+    assert svc.reload() == ["display.fps"]
+
+
+def test_invalid_value_keeps_the_current_config():
+    svc, _ = _service()
+    before = svc.config
+    assert svc.set("display.fps", "fast") == []
+    assert svc.config is before
+
+
+def test_failing_subscriber_does_not_stop_the_others():
+    svc, _ = _service()
+    seen = []
+
+    def boom(cfg, changed):
+        raise RuntimeError("subscriber bug")
+
+    svc.subscribe(["*"], boom)
+    svc.subscribe(["*"], lambda cfg, changed: seen.append(changed))
+    svc.set("display.fps", 15)
+    assert seen == [["display.fps"]]
@@ -0,0 +1,195 @@
+# test_event_bus.py
+"""EventBus without a GUI: priority lanes, overflow, coalescing, pump budget."""
+import threading
+
+import pytest
+
+from event_bus import (EventBus, CRITICAL, HIGH, NORMAL, LOW, DROP_NEWEST,
+                       BLOCK, SYNC, THREAD, add_counts)
+
+
+@pytest.fixture
+def bus():
+    b = EventBus()
+    yield b
+    b.close()
+
+
+def _host(bus, types=("*",), **kw):
+    got = []
+    sub = bus.subscribe(list(types), got.append, **kw)
+    return got, sub
+
+
+def test_pump_delivers_highest_lane_first_fifo_within_a_lane(bus):
+    got, _ = _host(bus)
+    bus.emit("TELEMETRY", n=1)
+    bus.emit("NOTIFY", n=2)
+    bus.emit("TELEMETRY", n=3)
+    bus.emit("GESTURE", n=4)
+    bus.emit("SAFETY", n=5)
+    assert bus.pump() == 5
+    assert [ev["payload"]["n"] for ev in got] == [5, 4, 2, 1, 3]
+
+
+def test_explicit_priority_overrides_the_type_default(bus):
+    got, _ = _host(bus)
+    bus.emit("TELEMETRY")
+    bus.publish("TELEMETRY", {"urgent": True}, priority=CRITICAL)
+    bus.pump()
+    assert got[0]["payload"] == {"urgent": True}
+
+
+def test_full_queue_drops_the_oldest_low_priority_event(bus):
+    got, sub = _host(bus, maxsize=3)
+    for n in range(3):
+        bus.emit("TELEMETRY", n=n)
+    bus.emit("NOTIFY", n=9)
+    assert sub.pending() == 3
+    assert sub.stats()["dropped"] == {"TELEMETRY": 1}
+    bus.pump()
+    assert [ev["payload"]["n"] for ev in got] == [9, 1, 2]
+
+
+def test_drop_newest_keeps_what_is_queued(bus):
+    got, sub = _host(bus, maxsize=2, overflow=DROP_NEWEST)
+    bus.emit("NOTIFY", n=1)
+    bus.emit("NOTIFY", n=2)
+    assert bus.publish("NOTIFY", {"n": 3}) == 0
+    assert bus.publish("TELEMETRY", {"n": 4}) == 0
+    # ...unless something strictly less important can go instead
+    assert bus.publish("VOICE", {"text": "stop"}) == 1
+    bus.pump()
+    assert [(ev["type"], ev["payload"]) for ev in got] == [
+        ("VOICE", {"text": "stop"}), ("NOTIFY", {"n": 2})]
+    assert sub.stats()["dropped"] == {"NOTIFY": 2, "TELEMETRY": 1}
+
+
+def test_critical_is_never_dropped(bus):
+    got, sub = _host(bus, maxsize=2)
+    bus.emit("SAFETY", n=1)
+    bus.emit("SAFETY", n=2)
+    bus.emit("SAFETY", n=3)
+    assert sub.pending() == 3            # over the bound rather than lose one
+    bus.pump()
+    assert [ev["payload"]["n"] for ev in got] == [1, 2, 3]
+
+
+def test_bursts_of_the_same_type_coalesce(bus):
+    got, sub = _host(bus)
+    for pane in ("maps", "music", "weather"):
+        bus.emit("NAVIGATE", pane=pane)
+    for key, v in (("a", 1), ("b", 1), ("a", 2)):
+        bus.emit("STORE", key=key, value=v)
+    bus.pump()
+    assert [(ev["type"], ev["payload"]) for ev in got] == [
+        ("NAVIGATE", {"pane": "weather"}),
+        ("STORE", {"key": "a", "value": 2}),
+        ("STORE", {"key": "b", "value": 1}),
+    ]
+    assert sub.stats()["coalesced"] == 3
+
+
+def test_coalescing_never_jumps_over_another_type(bus):
+    got, _ = _host(bus)
+    bus.emit("NAVIGATE", pane="maps")
+    bus.emit("VOICE", text="open music")
+    bus.emit("NAVIGATE", pane="music")
+    bus.pump()
+    assert [ev["type"] for ev in got] == ["NAVIGATE", "VOICE", "NAVIGATE"]
+
+
+def test_final_voice_results_are_kept_partials_collapse(bus):
+    got, _ = _host(bus)
+    bus.emit("VOICE", text="op", partial=True)
+    bus.emit("VOICE", text="open", partial=True)
+    bus.emit("VOICE", text="open maps")
+    bus.emit("VOICE", text="open maps")
+    bus.pump()
+    assert [ev["payload"]["text"] for ev in got] == ["open", "open maps", "open maps"]
+
+
+def test_custom_merge_sums_counters(bus):
+    got, _ = _host(bus)
+    bus.coalesce("SCROLL", merge=add_counts)
+    for _ in range(4):
+        bus.emit("SCROLL", dy=3, target="list")
+    bus.pump()
+    assert [ev["payload"] for ev in got] == [{"dy": 12, "target": "list"}]
+
+
+def test_max_events_defers_the_rest_but_not_critical(bus):
+    got, sub = _host(bus)
+    for n in range(3):
+        bus.emit("NOTIFY", n=n)
+    bus.emit("ALERT", n=98)
+    bus.emit("ALERT", n=99)
+    assert bus.pump(max_events=1) == 2          # both ALERTs, past the limit
+    assert [ev["payload"]["n"] for ev in got] == [98, 99]
+    assert sub.pending() == 3 and bus.last_pump["deferred"] == 3
+    bus.pump()
+    assert [ev["payload"]["n"] for ev in got[2:]] == [0, 1, 2]
+
+
+def test_zero_budget_still_delivers_one_event(bus):
+    got, _ = _host(bus)
+    bus.emit("NOTIFY", n=1)
+    bus.emit("NOTIFY", n=2)
+    assert bus.pump(budget_s=0.0) == 1
+    assert bus.pending() == 1
+
+
+def test_handlers_that_publish_do_not_extend_the_pump(bus):
+    seen = []
+
+    def echo(ev):
+        seen.append(ev["payload"]["n"])
+        bus.emit("NOTIFY", n=ev["payload"]["n"] + 1)
+
+    bus.subscribe(["NOTIFY"], echo)
+    bus.emit("NOTIFY", n=0)
+    assert bus.pump() == 1
+    assert bus.pump() == 1
+    assert seen == [0, 1]
+
+
+def test_wakeup_fd_signals_host_events_from_other_threads(bus):
+    got, _ = _host(bus, types=["NOTIFY"])
+    assert not bus.wait(0)
+    threading.Thread(target=bus.emit, args=("NOTIFY",), kwargs={"n": 1}).start()
+    assert bus.wait(2.0)
+    bus.pump()
+    assert len(got) == 1 and not bus.wait(0)
+
+
+def test_sync_and_thread_subscribers(bus):
+    sync = []
+    bus.subscribe(["NOTIFY"], sync.append, mode=SYNC)
+    done = threading.Event()
+    threaded = []
+
+    def on_thread(ev):
+        threaded.append(threading.current_thread().name)
+        done.set()
+
+    bus.subscribe(["NOTIFY"], on_thread, name="logger", mode=THREAD)
+    assert bus.publish("NOTIFY", {"n": 1}) == 2
+    assert len(sync) == 1                       # inline, before publish returned
+    assert done.wait(2.0) and threaded == ["bus:logger"]
+
+
+def test_block_needs_a_thread_subscriber(bus):
+    with pytest.raises(ValueError):
+        bus.subscribe(["NOTIFY"], print, overflow=BLOCK)
+
+
+def test_legacy_next_polls_and_returns_nop_when_empty(bus):
+    assert bus.next()["type"] == "NOP"
+    bus.emit("TELEMETRY", n=1)
+    bus.emit("VOICE", text="hi")
+    assert bus.next()["type"] == "VOICE"
+    assert bus.next()["type"] == "TELEMETRY"
+
+
+def test_lane_constants_are_ordered():
+    assert CRITICAL < HIGH < NORMAL < LOW
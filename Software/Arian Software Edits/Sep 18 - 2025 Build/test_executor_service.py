@@ -0,0 +1,122 @@
+# test_executor_service.py
+"""ExecutorService thread pools: results posted to the UI, owner cancellation, stats."""
+import threading
+
+import pytest
+
+from executor_service import Cancelled, CancelToken, ExecutorService
+
+
+class Posted:
+    """Stands in for the UI thread: collects posted callbacks, run() runs them."""
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, fn):
+        with self.lock:
+            self.calls.append(fn)
+
+    def run(self):
+        with self.lock:
+            calls, self.calls = self.calls, []
+        for fn in calls:
+            fn()
+        return len(calls)
+
+
+@pytest.fixture
+def ex():
+    posted = Posted()
+    svc = ExecutorService({"io": 1, "cpu": 2}, processes=0, post=posted)
+    svc.posted = posted
+    yield svc
+    svc.shutdown(wait=True)
+
+
+def test_results_and_errors_are_posted_not_called_inline(ex):
+    got = []
+    ex.submit(lambda x: x * 2, 21, on_result=got.append).result(2)
+    ex.submit(lambda: 1 / 0, on_error=lambda e: got.append(type(e))).exception(2)
+    assert got == []
+    assert ex.posted.run() == 2
+    assert got == [42, ZeroDivisionError]
+    st = ex.stats()["io"]
+    assert (st["submitted"], st["completed"], st["failed"]) == (2, 1, 1)
+
+
+def test_unknown_pool_is_rejected(ex):
+    with pytest.raises(ValueError):
+        ex.submit(print, pool="gpu")
+    with pytest.raises(ValueError):
+        ex.submit(print, pool="process")        # processes=0: no such pool
+
+
+def test_cancel_owner_skips_queued_work_and_drops_late_results(ex):
+    owner = object()
+    started, gate = threading.Event(), threading.Event()
+    ran, got = [], []
+
+    def busy():
+        started.set()
+        return gate.wait(2)
+
+    running = ex.submit(busy, owner=owner, on_result=got.append)
+    queued = ex.submit(ran.append, "queued", owner=owner)   # io has one worker
+    assert started.wait(2)
+    assert ex.cancel(owner) == 2
+    gate.set()
+    running.result(2)
+    assert queued.cancelled() and ran == []
+    ex.posted.run()
+    assert got == []                            # the pane is gone
+    assert ex.cancel(owner) == 0
+
+
+def test_long_running_loop_stops_on_its_token(ex):
+    owner = object()
+    tok = ex.token(owner)
+    assert ex.token(owner) is tok
+    laps = []
+
+    def loop(token):
+        while not token.wait(0.005):
+            laps.append(1)
+        token.check()
+
+    fut = ex.submit(loop, tok, owner=owner)
+    ex.cancel(owner)
+    assert isinstance(fut.exception(2), Cancelled)
+    assert ex.stats()["io"]["cancelled"] == 1
+    assert ex.token(owner) is not tok           # a fresh token for the next mount
+
+
+def test_token_callbacks_run_once():
+    tok = CancelToken()
+    calls = []
+    tok.on_cancel(lambda: calls.append("early"))
+    tok.cancel()
+    tok.cancel()
+    tok.on_cancel(lambda: calls.append("late"))
+    assert calls == ["early", "late"]
+
+
+def test_stats_count_queue_depth(ex):
+    gate = threading.Event()
+    futs = [ex.submit(gate.wait, 2) for _ in range(3)]
+    gate.set()
+    for f in futs:
+        f.result(2)
+    st = ex.stats()["io"]
+    assert st["queued_peak"] >= 2
+    assert (st["queued"], st["running"], st["completed"]) == (0, 0, 3)
+
+
+def test_from_config_sizes_the_pools():
+    svc = ExecutorService.from_config({"io": 3, "cpu": 1, "process": 0})
+    try:
+        assert svc.thread_count() == 4
+        assert "process" not in svc.stats()
+    finally:
+        svc.shutdown()
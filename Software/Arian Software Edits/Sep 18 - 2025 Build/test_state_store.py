@@ -0,0 +1,188 @@
+# test_state_store.py
+"""StateStore: versions, batches, change queries, subscribers with and without a bus."""
+import threading
+
+import pytest
+
+from event_bus import EventBus
+from state_store import StateStore
+
+
+@pytest.fixture
+def bus():
+    b = EventBus()
+    yield b
+    b.close()
+
+
+def test_still_a_dict():
+    store = StateStore({"net": "wifi"})
+    store["battery"] = 80
+    assert store.get("gps", False) is False
+    assert dict(store) == {"net": "wifi", "battery": 80}
+    del store["net"]
+    assert "net" not in store
+    with pytest.raises(KeyError):
+        del store["net"]
+
+
+def test_only_real_changes_bump_the_version():
+    store = StateStore({"battery": 100})
+    v = store.version
+    store["battery"] = 100
+    assert store.version == v
+    store["battery"] = 99
+    assert store.version == v + 1 and store.version_of("battery") == v + 1
+    assert store.version_of("never_set") == 0
+
+
+def test_batch_is_one_version_and_one_notification():
+    store = StateStore({"a": 0, "b": 0})
+    calls = []
+    store.subscribe(["*"], lambda changes, version: calls.append((changes, version)))
+    v = store.version
+    with store.batch():
+        store["a"] = 1
+        store["b"] = 2
+        store["b"] = 3
+        with store.batch():             # nested: still the outer batch
+            store["c"] = 4
+    assert store.version == v + 1
+    assert calls == [({"a": 1, "b": 3, "c": 4}, v + 1)]
+
+
+def test_batch_that_ends_where_it_started_is_not_a_change():
+    store = StateStore({"a": 0})
+    v = store.version
+    with store.batch():
+        store["a"] = 1
+        store["a"] = 0
+    assert store.version == v
+
+
+def test_batch_that_raises_is_rolled_back():
+    store = StateStore({"a": 0, "b": 0})
+    calls = []
+    store.subscribe(["*"], lambda changes, version: calls.append(changes))
+    v, va = store.version, store.version_of("a")
+    with pytest.raises(RuntimeError):
+        with store.batch():
+            store["a"] = 1
+            del store["b"]
+            store["c"] = 3
+            raise RuntimeError("half way")
+    assert dict(store) == {"a": 0, "b": 0}
+    assert store.version == v and store.version_of("a") == va
+    assert calls == []
+
+
+def test_update_and_mutate_are_all_or_nothing():
+    store = StateStore({"a": 0})
+    v = store.version
+    with pytest.raises(ValueError):
+        with store.batch():
+            store.update(a=1, b=2)                  # its own batch nests in this one
+            store.mutate("a", lambda n: int("x"))
+    assert dict(store) == {"a": 0} and store.version == v
+
+
+def test_inner_batch_that_raises_only_undoes_its_own_writes():
+    store = StateStore({"a": 0, "b": 0})
+    calls = []
+    store.subscribe(["*"], lambda changes, version: calls.append(changes))
+    with store.batch():
+        store["a"] = 1
+        try:
+            with store.batch():
+                store["a"] = 2
+                store["b"] = 2
+                raise KeyError("inner")
+        except KeyError:
+            pass
+    assert dict(store) == {"a": 1, "b": 0}
+    assert calls == [{"a": 1}]
+
+
+def test_mutate_is_atomic_across_threads():
+    store = StateStore()
+
+    def bump():
+        for _ in range(1000):
+            store.mutate("n", lambda n: n + 1, 0)
+
+    threads = [threading.Thread(target=bump) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert store["n"] == 4000 and store.version == 4000
+
+
+def test_changed_since_by_key_and_pattern():
+    store = StateStore({"battery": 100, "wifi_ssid": "home", "net": "wifi"})
+    v = store.version
+    assert not store.changed_since(v)
+    store["wifi_rssi"] = -60                    # a new key a pattern must pick up
+    assert store.changed_since(v)
+    assert store.changed_since(v, "wifi_*")
+    assert not store.changed_since(v, "battery", "net")
+    v = store.version
+    del store["battery"]                        # deletions count
+    assert store.changed_since(v, "battery")
+    assert not store.changed_since(v, "wifi_*")
+
+
+def test_watch_reports_each_change_once():
+    store = StateStore({"battery": 100, "net": "wifi"})
+    w = store.watch("battery")
+    assert w.changed()                          # first call: draw once
+    assert not w.changed()
+    store["net"] = "lte"
+    assert not w.changed()
+    store["battery"] = 90
+    assert w.changed() and not w.changed()
+
+
+def test_sync_subscribers_see_only_matching_keys():
+    store = StateStore()
+    got = []
+    store.subscribe(["wifi_*", "battery"], lambda changes, version: got.append(changes))
+    store.update(battery=50, wifi_ssid="cafe", gps=True)
+    store["gps"] = False
+    assert got == [{"battery": 50, "wifi_ssid": "cafe"}]
+
+
+def test_failing_subscriber_does_not_break_the_write():
+    store = StateStore()
+    got = []
+
+    def boom(changes, version):
+        raise RuntimeError("subscriber bug")
+
+    store.subscribe(["*"], boom)
+    store.subscribe(["*"], lambda changes, version: got.append(changes))
+    store["a"] = 1
+    assert store["a"] == 1 and got == [{"a": 1}]
+
+
+def test_bus_subscribers_run_on_pump_with_bursts_coalesced(bus):
+    store = StateStore({"battery": 100}, bus)
+    got = []
+    store.subscribe(["battery"], lambda changes, version: got.append((changes, version)))
+    for pct in (99, 98, 97):
+        store["battery"] = pct
+    assert got == []                            # nothing until the host loop pumps
+    bus.pump()
+    assert got == [({"battery": 97}, store.version)]
+
+
+def test_writes_from_a_worker_reach_the_host_loop(bus):
+    store = StateStore({}, bus)
+    got = []
+    store.subscribe(["net"], lambda changes, version: got.append(changes))
+    t = threading.Thread(target=store.__setitem__, args=("net", "lte"))
+    t.start()
+    t.join()
+    assert bus.wait(2.0)
+    bus.pump()
+    assert got == [{"net": "lte"}]
@@ -0,0 +1,226 @@
+# async_runtime.py
+"""
+One asyncio event loop for every I/O-bound service call (weather, LLM,
+translation, phone tether, nmcli), so waiting on the network or a child
+process costs no thread and never blocks the GUI thread.
+
+The loop runs on a single "aries-io" thread; results come back on the GUI
+thread. Panes get it as `loop` (deps["loop"] in main.py, ctx.loop in the
+ctx build):
+
+    self.loop.submit(fetch_json(url), on_result=self._show,
+                     on_error=self._fail, on_cancel=self._reset, owner=self)
+    ...
+    self.loop.cancel(self)          # pane hidden / closed: drop its requests
+
+PaneLoader does the cancel for a pane when it is switched away from,
+hibernated or unloaded (the ctx build's PaneHost when it unmounts one);
+on_cancel is where the pane undoes what it did while waiting (a disabled
+button, a spinner).
+
+on_result / on_error / on_cancel run on the thread that created the
+runtime: through a queued Qt signal when a QApplication exists, otherwise
+through the `post` callable passed in (the ctx build posts onto its
+EventBus host loop).
+
+Helpers for the common waits, all coroutines:
+
+    fetch_json(url, timeout)        aiohttp if installed, else stdlib streams
+    run_command(argv, timeout)      asyncio subprocess (nmcli, ...)
+    in_thread(fn, *args)            for libraries with no async API at all
+
+Qt-integrated loops (qasync) would need the app started through them; a
+loop thread plus queued callbacks gives the same UI behaviour with no new
+dependency. This module must stay free of a hard Qt import.
+"""
+import asyncio
+import json
+import ssl
+import threading
+import urllib.parse
+
+try:
+    import aiohttp
+except Exception:
+    aiohttp = None
+
+
+class AsyncRuntime:
+    def __init__(self, post=None, name="aries-io"):
+        self.post = post or _qt_post() or _direct
+        self.loop = asyncio.new_event_loop()
+        self._owned = {}                # id(owner) -> set of futures
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.failed = 0
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        self._ready.wait(2.0)
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._ready.set)
+        self.loop.run_forever()
+
+    # ----- submitting work --------------------------------------------------
+
+    def submit(self, coro, on_result=None, on_error=None, owner=None, on_cancel=None):
+        """Schedule `coro` on the loop; callbacks run on the GUI thread.
+        on_cancel() runs instead of on_result / on_error if it's cancelled.
+        Returns a concurrent.futures.Future (cancel() works from any thread)."""
+        fut = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        self.submitted += 1
+        key = id(owner) if owner is not None else None
+        if key is not None:
+            with self._lock:
+                self._owned.setdefault(key, set()).add(fut)
+        fut.add_done_callback(lambda f: self._done(f, key, on_result, on_error, on_cancel))
+        return fut
+
+    def _done(self, fut, key, on_result, on_error, on_cancel=None):
+        if key is not None:
+            with self._lock:
+                futs = self._owned.get(key)
+                if futs is not None:
+                    futs.discard(fut)
+                    if not futs:
+                        del self._owned[key]
+        if fut.cancelled():
+            if on_cancel is not None:
+                self.post(on_cancel)
+            return
+        exc = fut.exception()
+        if exc is not None:
+            self.failed += 1
+            if on_error is not None:
+                self.post(lambda: on_error(exc))
+            else:
+                print(f"[async] ⚠️  {type(exc).__name__}: {exc}")
+        elif on_result is not None:
+            res = fut.result()
+            self.post(lambda: on_result(res))
+
+    def call(self, coro, timeout=None):
+        """Run `coro` and block for the result. Not from the GUI thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def cancel(self, owner):
+        """Cancel everything submitted with owner=`owner`."""
+        with self._lock:
+            futs = self._owned.pop(id(owner), set())
+        for f in futs:
+            f.cancel()
+        return len(futs)
+
+    def pending(self):
+        with self._lock:
+            return sum(len(f) for f in self._owned.values())
+
+    def stats(self):
+        tasks = asyncio.all_tasks(self.loop) if self.loop.is_running() else ()
+        return {"submitted": self.submitted, "failed": self.failed,
+                "in_flight": len(tasks)}
+
+    def shutdown(self, timeout=1.0):
+        if self.loop.is_closed():
+            return
+
+        async def _cancel_all():
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self.loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(_cancel_all(), self.loop).result(timeout)
+            except Exception:
+                pass
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self.loop.close()
+
+
+def _direct(fn):
+    fn()
+
+
+def _qt_post():
+    """Queue callables onto the Qt GUI thread, or None without a QApplication."""
+    try:
+        from PyQt5.QtCore import QCoreApplication, QObject, pyqtSignal
+    except Exception:
+        return None
+    if QCoreApplication.instance() is None:
+        return None
+
+    class _Poster(QObject):
+        call = pyqtSignal(object)
+
+    poster = _Poster()
+    poster.call.connect(lambda fn: fn())
+    _qt_post.keep = poster          # lives as long as the process
+    return poster.call.emit
+
+
+# ----- service helpers --------------------------------------------------------
+
+_ssl_ctx = None
+
+
+async def fetch_json(url, timeout=5.0):
+    """GET `url` and decode its JSON body."""
+    if aiohttp is not None:
+        t = aiohttp.ClientTimeout(total=timeout)
+        async with aiohttp.ClientSession(timeout=t) as s:
+            async with s.get(url) as r:
+                r.raise_for_status()
+                return await r.json(content_type=None)
+    return json.loads(await asyncio.wait_for(_http_get(url), timeout))
+
+
+async def _http_get(url):
+    # HTTP/1.0 + Connection: close: the body is everything up to EOF, no
+    # chunked decoding needed for the small JSON APIs we call
+    global _ssl_ctx
+    u = urllib.parse.urlsplit(url)
+    https = u.scheme == "https"
+    if https and _ssl_ctx is None:
+        _ssl_ctx = ssl.create_default_context()
+    reader, writer = await asyncio.open_connection(
+        u.hostname, u.port or (443 if https else 80), ssl=_ssl_ctx if https else None)
+    try:
+        path = (u.path or "/") + (f"?{u.query}" if u.query else "")
+        writer.write(f"GET {path} HTTP/1.0\r\nHost: {u.hostname}\r\n"
+                     "Accept: application/json\r\nUser-Agent: AriesOS\r\n"
+                     "Connection: close\r\n\r\n".encode())
+        await writer.drain()
+        raw = await reader.read()
+    finally:
+        writer.close()
+    head, _, body = raw.partition(b"\r\n\r\n")
+    parts = head.split(None, 2)
+    status = int(parts[1]) if len(parts) > 1 else 0
+    if status != 200:
+        raise OSError(f"HTTP {status} from {u.hostname}")
+    return body
+
+
+async def run_command(argv, timeout=10.0):
+    """Run a child process; (returncode, stdout, stderr) as text."""
+    proc = await asyncio.create_subprocess_exec(
+        *argv, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+    try:
+        out, err = await asyncio.wait_for(proc.communicate(), timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, out.decode(errors="replace"), err.decode(errors="replace")
+
+
+async def in_thread(fn, *args):
+    """Last resort for blocking libraries: the loop's default thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
@@ -0,0 +1,176 @@
+# boot_profiler.py
+"""
+Boot profiling for main.py and services.make_services.
+
+    ARIES_BOOT_PROFILE=boot python main.py
+
+records wall + CPU time for every top-level import and every named phase
+(pane constructors, CameraFeed open, model loads, splash, ...) and, once
+the first frame is up, writes:
+
+    boot.txt          phases sorted by wall time
+    boot.trace.json   Chrome trace (chrome://tracing or ui.perfetto.dev)
+
+Budgets: ARIES_BOOT_BUDGETS=budgets.yaml (or .json) maps phase names, or
+fnmatch patterns like "pane:*", to milliseconds. Violations are printed;
+tests call profiler.assert_budgets(), and ARIES_BOOT_PROFILE_EXIT=1 makes
+main.py quit after boot with a non-zero status if any budget was blown.
+"""
+import builtins
+import fnmatch
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+class BootBudgetExceeded(AssertionError):
+    pass
+
+
+class BootProfiler:
+    def __init__(self, enabled=False, output=None, budgets=None):
+        self.enabled = enabled
+        self.output = output
+        self.budgets = budgets or {}
+        self.t0 = time.perf_counter()
+        self.records = []       # dicts: name, cat, start, wall, cpu, tid
+        self._local = threading.local()
+        self._orig_import = None
+        self._finished = False
+
+    # ----- recording ------------------------------------------------------
+
+    def _record(self, name, cat, start, wall, cpu):
+        self.records.append({
+            "name": name, "cat": cat,
+            "start": start - self.t0, "wall": wall, "cpu": cpu,
+            "tid": threading.get_ident(),
+        })
+
+    @contextmanager
+    def phase(self, name, cat="phase"):
+        """Time a block: `with profiler.phase("camera.open"): ...`"""
+        if not self.enabled:
+            yield
+            return
+        start, c0 = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            self._record(name, cat, start,
+                         time.perf_counter() - start, time.thread_time() - c0)
+
+    def instrument_imports(self):
+        """Time every outermost import of a module that isn't loaded yet."""
+        if self._orig_import is not None:
+            return
+        orig = self._orig_import = builtins.__import__
+        local = self._local
+
+        def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if getattr(local, "depth", 0) or (level == 0 and name in sys.modules):
+                return orig(name, globals, locals, fromlist, level)
+            local.depth = 1
+            start, c0 = time.perf_counter(), time.thread_time()
+            try:
+                return orig(name, globals, locals, fromlist, level)
+            finally:
+                local.depth = 0
+                self._record(f"import {name or ','.join(fromlist)}", "import", start,
+                             time.perf_counter() - start, time.thread_time() - c0)
+
+        builtins.__import__ = _timed_import
+
+    def stop_imports(self):
+        if self._orig_import is not None:
+            builtins.__import__ = self._orig_import
+            self._orig_import = None
+
+    # ----- reporting ------------------------------------------------------
+
+    def report(self):
+        total = time.perf_counter() - self.t0
+        lines = [f"boot: {total * 1000:.1f} ms wall, {time.process_time() * 1000:.1f} ms CPU (process)",
+                 f"{'wall ms':>10} {'cpu ms':>10}  phase"]
+        for r in sorted(self.records, key=lambda r: r["wall"], reverse=True):
+            lines.append(f"{r['wall'] * 1000:10.1f} {r['cpu'] * 1000:10.1f}  {r['name']}")
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        pid = os.getpid()
+        events = [{
+            "name": r["name"], "cat": r["cat"], "ph": "X",
+            "ts": round(r["start"] * 1e6), "dur": round(r["wall"] * 1e6),
+            "pid": pid, "tid": r["tid"],
+            "args": {"cpu_ms": round(r["cpu"] * 1000, 3)},
+        } for r in self.records]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, prefix):
+        with open(f"{prefix}.txt", "w", encoding="utf-8") as f:
+            f.write(self.report() + "\n")
+        with open(f"{prefix}.trace.json", "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+
+    # ----- budgets --------------------------------------------------------
+
+    @staticmethod
+    def load_budgets(path):
+        with open(path, "r", encoding="utf-8") as f:
+            if path.endswith(".json") or yaml is None:
+                return json.load(f)
+            return yaml.safe_load(f) or {}
+
+    def check_budgets(self, budgets=None):
+        """[(phase, ms, limit_ms)] for every record over its budget."""
+        budgets = self.budgets if budgets is None else budgets
+        over = []
+        for r in self.records:
+            ms = r["wall"] * 1000
+            for pattern, limit in budgets.items():
+                if fnmatch.fnmatchcase(r["name"], pattern) and ms > float(limit):
+                    over.append((r["name"], ms, float(limit)))
+                    break
+        return over
+
+    def assert_budgets(self, budgets=None):
+        over = self.check_budgets(budgets)
+        if over:
+            msg = "; ".join(f"{n}: {ms:.1f} ms > {lim:.0f} ms" for n, ms, lim in over)
+            raise BootBudgetExceeded(msg)
+
+    def finish(self):
+        """Stop import timing, write the report; returns budget violations."""
+        if not self.enabled or self._finished:
+            return []
+        self._finished = True
+        self.stop_imports()
+        if self.output:
+            self.write(self.output)
+            print(f"[boot] profile written to {self.output}.txt / .trace.json")
+        over = self.check_budgets()
+        for name, ms, limit in over:
+            print(f"[boot] ⚠️  over budget: {name} {ms:.1f} ms > {limit:.0f} ms")
+        return over
+
+
+def _from_env():
+    out = os.getenv("ARIES_BOOT_PROFILE")
+    budgets_path = os.getenv("ARIES_BOOT_BUDGETS")
+    budgets = BootProfiler.load_budgets(budgets_path) if budgets_path else {}
+    p = BootProfiler(enabled=bool(out), output=out, budgets=budgets)
+    if p.enabled:
+        p.instrument_imports()
+    return p
+
+
+# Shared instance; import this module first so it sees the other imports.
+profiler = _from_env()
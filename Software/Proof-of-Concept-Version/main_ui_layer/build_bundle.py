@@ -0,0 +1,325 @@
+# build_bundle.py
+"""
+Build aries.pyz: a single-file, precompiled bundle for fast cold start.
+
+On an SD card most of cold start is the import system, not our code: every
+`import x` walks sys.path stat()ing candidate files, then stats each .py
+against its __pycache__ entry. The bundle removes both:
+
+  * main_ui_layer/*.py (top-level modules), ui_layer_apps/ (as package
+    `apps`) and any --extra dirs are compiled to unchecked-hash .pyc in one
+    zip, so nothing is stat'ed or recompiled at import time;
+  * a traced boot records every module the UI imports (the frozen module
+    list, in import order). Pure-Python stdlib modules go into the zip too;
+    extension modules and third-party packages stay on disk but their exact
+    paths go into manifest.json, so bundle_boot.ManifestFinder resolves
+    them with one dict lookup instead of a sys.path walk.
+
+Usage (from main_ui_layer/):
+    python build_bundle.py                              # -> aries.pyz
+    python build_bundle.py --extra "../../Arian Software Edits/Sep 18 - 2025 Build"
+    python build_bundle.py --zip-deps requests,urllib3,idna
+    python aries.pyz                                    # run it
+    python build_bundle.py --measure 5 --cold           # source vs bundle boot
+
+--measure boots both ways with ARIES_BOOT_PROFILE_EXIT=1 (exit once the
+first frame is up) and reports wall time; --cold drops the page cache
+before each run (needs root) so the numbers match a fresh power-on.
+Rebuild after changing code or upgrading Python: the bundle refuses to load
+under a different bytecode magic.
+"""
+import os
+import sys
+import argparse
+import importlib.util
+import json
+import marshal
+import platform
+import statistics
+import subprocess
+import sysconfig
+import tempfile
+import time
+import zipfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APPS_DIR = os.path.join(os.path.dirname(HERE), "ui_layer_apps")
+MANIFEST = "manifest.json"
+MODULE_LIST = "modules.txt"
+BOOT_MODULE = "bundle_boot"
+
+MAIN_PY = f"""\
+import sys
+import {BOOT_MODULE}
+finder = {BOOT_MODULE}.install(sys.path[0])
+import runpy
+runpy.run_module(finder.manifest["entry"], run_name="__main__", alter_sys=True)
+"""
+
+# Runs in a child interpreter: boot the UI offscreen like main.py would,
+# let warm-up finish, then report what got imported and from where.
+TRACE_PY = """\
+import importlib.util, json, os, sys, time
+here, apps_dir, extras, out, settle = sys.argv[1:6]
+sys.path[:0] = [here] + json.loads(extras)
+spec = importlib.util.spec_from_file_location(
+    "apps", os.path.join(apps_dir, "__init__.py"), submodule_search_locations=[apps_dir])
+apps = importlib.util.module_from_spec(spec)
+sys.modules["apps"] = apps
+spec.loader.exec_module(apps)
+from PyQt5.QtWidgets import QApplication
+app = QApplication(sys.argv[:1])
+import main
+win = main.VisionAriesUI()
+end = time.monotonic() + float(settle)
+while time.monotonic() < end:
+    app.processEvents()
+    time.sleep(0.01)
+mods = []
+for name, m in list(sys.modules.items()):
+    s = getattr(m, "__spec__", None)
+    if s is not None:
+        mods.append([name, s.origin, list(s.submodule_search_locations or []) or None])
+with open(out, "w") as f:
+    json.dump(mods, f)
+os._exit(0)
+"""
+
+
+# ----- sources ----------------------------------------------------------------
+
+def _entry(name, package):
+    base = name.replace(".", "/")
+    return f"{base}/__init__.pyc" if package else f"{base}.pyc"
+
+
+def _walk_package(pkg, root):
+    """{module name: (source path, is_package)} for a package directory."""
+    out = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames
+                       if d != "__pycache__" and os.path.exists(os.path.join(dirpath, d, "__init__.py"))]
+        rel = os.path.relpath(dirpath, root)
+        prefix = pkg if rel == "." else f"{pkg}.{rel.replace(os.sep, '.')}"
+        for fn in filenames:
+            if not fn.endswith(".py") or fn.startswith("test_"):
+                continue
+            path = os.path.join(dirpath, fn)
+            if fn == "__init__.py":
+                out[prefix] = (path, True)
+            else:
+                out[f"{prefix}.{fn[:-3]}"] = (path, False)
+    return out
+
+
+def _top_level(root):
+    return {fn[:-3]: (os.path.join(root, fn), False)
+            for fn in sorted(os.listdir(root))
+            if fn.endswith(".py") and fn != "__init__.py" and not fn.startswith("test_")}
+
+
+def own_sources(extras=()):
+    """Our code: main_ui_layer + extras as top-level modules, ui_layer_apps as `apps`."""
+    sources = {}
+    for root in extras:
+        sources.update(_top_level(root))
+    sources.update(_top_level(HERE))
+    sources.update(_walk_package("apps", APPS_DIR))
+    sources.pop(os.path.splitext(os.path.basename(__file__))[0], None)
+    return sources
+
+
+# ----- boot trace -------------------------------------------------------------
+
+def trace_boot(extras=(), settle_s=5.0, python=sys.executable):
+    """[(name, origin, search locations)] in import order, or [] if the UI can't boot here."""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    env.setdefault("ARIES_CAMERA_SOURCE", "synthetic")
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, "modules.json")
+        cmd = [python, "-c", TRACE_PY, HERE, APPS_DIR,
+               json.dumps([os.path.abspath(e) for e in extras]), out, str(settle_s)]
+        proc = subprocess.run(cmd, env=env, cwd=HERE, capture_output=True, text=True)
+        if proc.returncode != 0 or not os.path.exists(out):
+            tail = (proc.stderr or "").strip().splitlines()[-1:]
+            print(f"[bundle] ⚠️  boot trace failed ({' '.join(tail) or proc.returncode}); "
+                  f"bundling our own code only")
+            return []
+        with open(out, encoding="utf-8") as f:
+            return [tuple(m) for m in json.load(f)]
+
+
+def _classify(traced, own, zip_deps=()):
+    """Split traced modules into {name: manifest entry} plus {name: source} to compile."""
+    stdlib = os.path.realpath(sysconfig.get_paths()["stdlib"])
+    site = tuple(os.path.realpath(p) for p in {sysconfig.get_paths()["purelib"],
+                                               sysconfig.get_paths()["platlib"]})
+    modules, compile_ = {}, {}
+    for name, origin, search in traced:
+        if name in own or name == "__main__" or not origin or not os.path.isabs(origin):
+            continue    # built-in / frozen / namespace packages need no lookup
+        package = search is not None
+        real = os.path.realpath(origin)
+        pure = origin.endswith(".py")
+        in_stdlib = real.startswith(stdlib + os.sep) and not real.startswith(site)
+        wanted = name.split(".")[0] in zip_deps
+        if pure and (in_stdlib or wanted):
+            compile_[name] = (origin, package)
+        else:
+            modules[name] = {"kind": "file", "path": origin, "package": package,
+                             "search": search}
+    return modules, compile_
+
+
+# ----- build ------------------------------------------------------------------
+
+def _pyc(path, optimize):
+    """Unchecked-hash pyc: valid without the source, never compared to it."""
+    with open(path, "rb") as f:
+        src = f.read()
+    code = compile(src, path, "exec", dont_inherit=True, optimize=optimize)
+    return (importlib.util.MAGIC_NUMBER + (0b01).to_bytes(4, "little")
+            + importlib.util.source_hash(src) + marshal.dumps(code))
+
+
+def build(out, extras=(), entry="main", zip_deps=(), trace=True,
+          settle_s=5.0, optimize=0, compress=False):
+    own = own_sources(extras)
+    traced = trace_boot(extras, settle_s) if trace else []
+    modules, deps = _classify(traced, own, set(zip_deps))
+    to_compile = dict(deps)
+    to_compile.update(own)
+
+    order = [name for name, _, _ in traced if name in own or name in deps or name in modules]
+    order += sorted(n for n in to_compile if n not in order)
+
+    method = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    tmp = out + ".tmp"
+    failed = []
+    with zipfile.ZipFile(tmp, "w", method) as z:
+        for name in order:
+            if name not in to_compile:
+                continue
+            path, package = to_compile[name]
+            try:
+                data = _pyc(path, optimize)
+            except SyntaxError as e:
+                failed.append(name)
+                print(f"[bundle] ⚠️  {name}: {e}; left out")
+                continue
+            arc = _entry(name, package)
+            z.writestr(arc, data)
+            modules[name] = {"kind": "zip", "entry": arc, "origin": path, "package": package}
+        z.writestr("__main__.py", MAIN_PY)
+        manifest = {
+            "version": 1,
+            "python": platform.python_version(),
+            "magic": importlib.util.MAGIC_NUMBER.hex(),
+            "entry": entry,
+            "built": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "traced": bool(traced),
+            "order": [n for n in order if n in modules],
+            "modules": modules,
+        }
+        z.writestr(MANIFEST, json.dumps(manifest, indent=1))
+        listing = "\n".join(f"{n}\t{modules[n]['kind']}\t{modules[n].get('path') or modules[n]['entry']}"
+                            for n in manifest["order"])
+        z.writestr(MODULE_LIST, listing + "\n")
+    os.replace(tmp, out)
+    with open(os.path.splitext(out)[0] + "." + MODULE_LIST, "w", encoding="utf-8") as f:
+        f.write(listing + "\n")
+
+    kinds = [m["kind"] for m in modules.values()]
+    print(f"[bundle] wrote {out} ({os.path.getsize(out) / 1024:.0f} KB): "
+          f"{kinds.count('zip')} precompiled, {kinds.count('file')} pinned to disk"
+          + (f", {len(failed)} skipped" if failed else ""))
+    return manifest
+
+
+# ----- measurement ------------------------------------------------------------
+
+def _drop_caches():
+    os.sync()
+    try:
+        with open("/proc/sys/vm/drop_caches", "w") as f:
+            f.write("3\n")
+        return True
+    except OSError:
+        return False
+
+
+def _time_boot(cmd, env, cwd, runs, cold):
+    samples = []
+    for _ in range(runs):
+        if cold and not _drop_caches():
+            print("[bundle] ⚠️  can't drop the page cache (not root?); timing warm starts")
+            cold = False
+        t0 = time.perf_counter()
+        proc = subprocess.run(cmd, env=env, cwd=cwd, capture_output=True)
+        dt = time.perf_counter() - t0
+        if proc.returncode not in (0, 1):     # 1 = boot profile over budget; still a boot
+            raise RuntimeError(f"{' '.join(cmd)} exited {proc.returncode}: "
+                               f"{proc.stderr.decode(errors='replace').strip()[-300:]}")
+        samples.append(dt)
+    return {"runs_s": [round(s, 3) for s in samples],
+            "median_s": round(statistics.median(samples), 3),
+            "min_s": round(min(samples), 3),
+            "cold": cold}
+
+
+def measure(bundle, source_cmd, runs=5, cold=False):
+    """Cold-start wall time (process start -> first frame -> exit), source vs bundle."""
+    env = dict(os.environ, ARIES_BOOT_PROFILE_EXIT="1")
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env.setdefault("ARIES_CAMERA_SOURCE", "synthetic")
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "source": _time_boot(source_cmd, env, HERE, runs, cold),
+        "bundle": _time_boot([sys.executable, os.path.abspath(bundle)], env, HERE, runs, cold),
+    }
+    report["speedup"] = round(report["source"]["median_s"] / report["bundle"]["median_s"], 2)
+    return report
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--out", default="aries.pyz", help="bundle path")
+    ap.add_argument("--extra", action="append", default=[],
+                    help="directory of top-level modules to bundle too (repeatable)")
+    ap.add_argument("--entry", default="main", help="module run as __main__")
+    ap.add_argument("--zip-deps", default="",
+                    help="comma list of pure-Python third-party packages to precompile "
+                         "into the bundle (default: leave them on disk, pinned by path)")
+    ap.add_argument("--no-trace", action="store_true",
+                    help="skip the boot trace; bundle our own code only")
+    ap.add_argument("--settle", type=float, default=5.0,
+                    help="seconds to let warm-up run during the boot trace")
+    ap.add_argument("--optimize", type=int, default=0, choices=(0, 1, 2),
+                    help="compile optimization level (2 strips docstrings)")
+    ap.add_argument("--compress", action="store_true",
+                    help="deflate entries (smaller file, more CPU at import)")
+    ap.add_argument("--measure", type=int, default=0, metavar="N",
+                    help="after building, time N boots from source and from the bundle")
+    ap.add_argument("--cold", action="store_true", help="drop the page cache before each timed boot")
+    ap.add_argument("--report", default=None, help="write the --measure results as JSON")
+    args = ap.parse_args(argv)
+
+    build(args.out, extras=args.extra, entry=args.entry,
+          zip_deps=[d for d in args.zip_deps.split(",") if d],
+          trace=not args.no_trace, settle_s=args.settle,
+          optimize=args.optimize, compress=args.compress)
+
+    if args.measure:
+        report = measure(args.out, [sys.executable, os.path.join(HERE, "main.py")],
+                         runs=args.measure, cold=args.cold)
+        print(f"[bundle] boot: source {report['source']['median_s']:.2f} s, "
+              f"bundle {report['bundle']['median_s']:.2f} s ({report['speedup']}x)")
+        if args.report:
+            with open(args.report, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
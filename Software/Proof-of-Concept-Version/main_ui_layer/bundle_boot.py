@@ -0,0 +1,90 @@
+# bundle_boot.py
+"""
+Runtime side of build_bundle.py: imports straight out of aries.pyz.
+
+The bundle's manifest.json maps every module seen during a traced boot to
+where it lives:
+
+    "zip"   precompiled bytecode inside the bundle (our code + pure-Python
+            stdlib); read with one open zip, never stat'ed or recompiled.
+            __file__ stays the source path the entry was built from, so
+            tracebacks, memory_audit roots and HERE-relative lookups behave
+            as they do when running from source
+    "file"  an exact path on disk (extension modules, third-party packages
+            that need their data files next to them)
+
+ManifestFinder goes first on sys.meta_path, so a boot import is one dict
+lookup instead of a walk over every sys.path entry (the stat storm that
+makes cold start slow on an SD card). Anything not in the manifest falls
+through to the normal finders.
+"""
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import json
+import marshal
+import sys
+import zipfile
+
+MANIFEST = "manifest.json"
+PYC_HEADER = 16     # magic, flags, source hash
+
+
+class BundleLoader(importlib.abc.Loader):
+    def __init__(self, bundle):
+        self.bundle = bundle
+
+    def create_module(self, spec):
+        return None     # default module creation
+
+    def exec_module(self, module):
+        entry = module.__spec__.loader_state
+        code = marshal.loads(self.bundle.zip.read(entry)[PYC_HEADER:])
+        exec(code, module.__dict__)
+
+    def get_code(self, fullname):
+        entry = self.bundle.modules[fullname]["entry"]
+        return marshal.loads(self.bundle.zip.read(entry)[PYC_HEADER:])
+
+    def get_source(self, fullname):
+        return None     # bytecode only
+
+
+class ManifestFinder(importlib.abc.MetaPathFinder):
+    def __init__(self, path):
+        self.path = path
+        self.zip = zipfile.ZipFile(path)
+        self.manifest = json.loads(self.zip.read(MANIFEST))
+        if self.manifest.get("magic") != importlib.util.MAGIC_NUMBER.hex():
+            raise ImportError(f"{path} was built for a different Python "
+                              f"({self.manifest.get('python')})")
+        self.modules = self.manifest["modules"]
+        self.loader = BundleLoader(self)
+        self.hits = 0
+
+    def find_spec(self, fullname, path=None, target=None):
+        info = self.modules.get(fullname)
+        if info is None:
+            return None
+        self.hits += 1
+        if info["kind"] == "zip":
+            entry = info["entry"]
+            spec = importlib.machinery.ModuleSpec(
+                fullname, self.loader, origin=info.get("origin") or f"{self.path}/{entry}",
+                is_package=info.get("package", False))
+            spec.loader_state = entry
+            spec.has_location = True
+            if spec.submodule_search_locations is not None:
+                pkgdir = entry.rsplit("/", 1)[0]
+                spec.submodule_search_locations.append(f"{self.path}/{pkgdir}")
+            return spec
+        return importlib.util.spec_from_file_location(
+            fullname, info["path"],
+            submodule_search_locations=info.get("search") if info.get("package") else None)
+
+
+def install(path):
+    """Put the bundle's finder in front of the normal import machinery."""
+    finder = ManifestFinder(path)
+    sys.meta_path.insert(0, finder)
+    return finder
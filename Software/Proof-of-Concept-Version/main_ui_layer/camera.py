@@ -1,13 +1,77 @@
+import os
 import cv2
 import numpy as np
 from PyQt5.QtWidgets import QLabel
 from PyQt5.QtGui import QImage, QPixmap, QPainter
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtCore import Qt
+
+from timer_wheel import wheel
+
+class SyntheticCapture:
+    """
+    Stand-in for cv2.VideoCapture that produces a moving gradient, so the UI
+    can run headless (benchmarks, CI) without a camera.
+    """
+    def __init__(self, width=960, height=540):
+        self.width, self.height = width, height
+        self._t = 0
+        self._ramp = None
+
+    def isOpened(self):
+        return True
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return self.width
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return self.height
+        return 0
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            self.width = int(value)
+        elif prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            self.height = int(value)
+        self._ramp = None
+        return True
+
+    def read(self):
+        if self._ramp is None:
+            row = np.linspace(0, 255, self.width, dtype=np.uint8)
+            self._ramp = np.broadcast_to(row, (self.height, self.width))
+        self._t = (self._t + 4) % 256
+        frame = np.empty((self.height, self.width, 3), np.uint8)
+        frame[..., 0] = self._ramp
+        frame[..., 1] = self._ramp + np.uint8(self._t)
+        frame[..., 2] = self._t
+        return True, frame
+
+    def release(self):
+        pass
+
 
 class CameraFeed(QLabel):
-    def __init__(self, parent=None):
+    """
+    Live camera label. `source` (or ARIES_CAMERA_SOURCE) picks the input:
+    unset/index -> device, "synthetic" -> SyntheticCapture, anything else is
+    treated as a video file and replayed in a loop.
+
+    `publish`, if set, is called with every raw BGR frame (see worker_hub:
+    frames go to the vision worker process through shared memory).
+    """
+    def __init__(self, parent=None, source=None):
         super().__init__(parent)
-        self.cap = cv2.VideoCapture(0)
+        source = source if source is not None else os.getenv("ARIES_CAMERA_SOURCE", "")
+        self._replay = False
+        self.publish = None
+        self._timer = None
+        if source == "synthetic":
+            self.cap = SyntheticCapture()
+        elif source and not source.isdigit():
+            self.cap = cv2.VideoCapture(source)
+            self._replay = True
+        else:
+            self.cap = cv2.VideoCapture(int(source or 0))
         if not self.cap.isOpened():
             print("Error: Could not open camera at index 0. Trying index 1...")
             self.cap = cv2.VideoCapture(1)
@@ -15,17 +79,30 @@ class CameraFeed(QLabel):
                 print("Error: No camera available.")
                 self.image = QImage()
                 return
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 960)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 540)
         self.image = QImage()
 
-        timer = QTimer(self)
-        timer.timeout.connect(self.update_frame)
-        timer.start(1000 // 30)
+        # 30 fps, riding the 16 ms frame ticks (timer_wheel.py)
+        self._timer = wheel.timer(self.update_frame, slack_ms=16, owner=self)
+        self.set_mode((960, 540), 30)
+
+    def set_mode(self, size, fps):
+        """Capture size (w, h) and frame rate, e.g. from a power profile."""
+        if self._timer is None:
+            return
+        w, h = size
+        current = (int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                   int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        if current != (w, h):
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, w)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, h)
+        self.cap.set(cv2.CAP_PROP_FPS, fps)     # lets the sensor itself slow down, where supported
+        self._timer.start(1000 / fps)
 
     def update_frame(self):
         ret, frame = self.cap.read()
         if ret:
+            if self.publish is not None:
+                self.publish(frame)
             frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             h, w, ch = frame.shape
             bytes_per_line = ch * w
@@ -35,6 +112,9 @@ class CameraFeed(QLabel):
                 self.setPixmap(pixmap.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
             else:
                 print("Error: Failed to convert QImage to QPixmap")
+        elif self._replay:
+            # end of the recording: loop
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
         else:
             print("Error: Failed to capture frame.")
 
@@ -3,9 +3,11 @@ import sys
 import threading
 import time
 
-from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSignal
 from PyQt5.QtGui import QPixmap
 
+from timer_wheel import wheel
+
 class ContextualAssistant(QObject):
     # emits every time we want to overlay a new camera frame
     frameOverlay = pyqtSignal(QPixmap)
@@ -22,9 +24,7 @@ class ContextualAssistant(QObject):
         self.camera = camera_widget
 
         # fire a timer to grab whatever pixmap the camera is currently showing
-        self._timer = QTimer(self)
-        self._timer.setInterval(100)   # 10fps
-        self._timer.timeout.connect(self._grab_and_emit)
+        self._timer = wheel.timer(self._grab_and_emit, 100, slack_ms=16, owner=self)   # 10fps
         # note: .start() is called in main.py
 
     def _grab_and_emit(self):
@@ -54,6 +54,7 @@ class ContextualAssistant(QObject):
         cmd = "Aries, hello"
         resp = "Hello, visionary."
         # emit exactly after a brief pause to simulate work
-        QTimer.singleShot(200, lambda: self.voiceCommandProcessed.emit(cmd, resp))
+        wheel.after(0.2, lambda: self.voiceCommandProcessed.emit(cmd, resp), owner=self)
         # also surface a suggestion
-        QTimer.singleShot(400, lambda: self.suggestionReady.emit("Tip: say “Aries, open Maps”"))
\ No newline at end of file
+        wheel.after(0.4, lambda: self.suggestionReady.emit("Tip: say “Aries, open Maps”"),
+                    owner=self)
\ No newline at end of file
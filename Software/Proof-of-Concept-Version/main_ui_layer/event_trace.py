@@ -0,0 +1,406 @@
+# event_trace.py
+"""
+Compact binary trace of bus events and Qt signals, cheap enough to leave on
+in the field, plus a replayer that re-injects a trace into a headless
+instance at 1x, Nx or max speed for load tests.
+
+    ARIES_TRACE=/data/traces python main.py          # record (dir: rotating files)
+    ARIES_TRACE=shift.aevt python main.py            # record to one file
+
+    python event_trace.py info shift.aevt
+    python event_trace.py replay shift.aevt --speed 10 --json load.json
+    python event_trace.py replay shift.aevt --max
+
+Recording: record() only appends (monotonic t, type, priority, payload) to a
+deque on the caller's thread; a writer thread encodes batches and appends
+them as zlib blocks, so a crash or power cut loses at most the last block.
+If the writer can't keep up the deque is capped and further events are
+counted as dropped rather than growing memory. On the EventBus the recorder
+is a SYNC "*" subscriber; Qt signals go through record_signal(), which
+flattens arguments straight away (frames become "<QImage>" placeholders
+instead of being kept alive until the next flush).
+
+File layout:
+    header   "AEVT", u16 version, f64 wall-clock start
+    blocks   u32 compressed size, u32 raw size, zlib(records)
+    record   varint dt_us (since the previous record), varint type id,
+             varint priority, varint size, marshal(payload)
+Type id 0 defines the next type name (utf-8 payload), so names are stored
+once per file.
+
+This module must stay free of Qt: the ctx build and the CLI import it.
+"""
+import argparse
+import collections
+import json
+import marshal
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+
+MAGIC = b"AEVT"
+VERSION = 1
+_HEADER = struct.Struct("<4sHxxd")      # magic, version, wall-clock start
+_BLOCK = struct.Struct("<II")           # compressed size, raw size
+NORMAL = 2                              # event_bus.NORMAL
+_PLAIN = (type(None), bool, int, float, str, bytes)
+
+
+def _varint(n, out):
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(buf, pos):
+    n = shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+def _flatten(v, depth=0):
+    """Marshal-safe copy: plain values kept, anything else by type name."""
+    if isinstance(v, _PLAIN):
+        return v
+    if depth < 4:
+        if isinstance(v, dict):
+            return {str(k): _flatten(x, depth + 1) for k, x in v.items()}
+        if isinstance(v, (list, tuple)):
+            return [_flatten(x, depth + 1) for x in v]
+    return f"<{type(v).__name__}>"
+
+
+class TraceRecorder:
+    def __init__(self, path, flush_s=1.0, max_pending=50_000, max_mb=64, keep=8,
+                 exclude=("CALL",)):
+        """`path`: a file, or a directory for rotating trace-<time>.aevt files
+        of up to max_mb each, keeping the newest `keep`."""
+        self.path = path
+        self.rotate = os.path.isdir(path)
+        self.flush_s = flush_s
+        self.max_pending = max_pending
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.keep = keep
+        self.exclude = set(exclude)
+        self.recorded = 0
+        self.dropped = 0
+        self.bytes = 0
+        self._pending = collections.deque()
+        self._wake = threading.Event()
+        self._closed = False
+        self._sub = None
+        self._open()
+        self._thread = threading.Thread(target=self._run, name="trace-writer", daemon=True)
+        self._thread.start()
+
+    # ----- files ----------------------------------------------------------
+
+    def _open(self):
+        if self.rotate:
+            name = time.strftime("trace-%Y%m%d-%H%M%S.aevt")
+            self.file = os.path.join(self.path, name)
+            old = sorted(f for f in os.listdir(self.path)
+                         if f.startswith("trace-") and f.endswith(".aevt"))
+            for f in old[:max(0, len(old) - self.keep + 1)]:
+                try:
+                    os.remove(os.path.join(self.path, f))
+                except OSError:
+                    pass
+        else:
+            self.file = self.path
+        self._f = open(self.file, "wb")
+        self._f.write(_HEADER.pack(MAGIC, VERSION, time.time()))
+        self._types = {}
+        self._last_t = None
+        self._file_bytes = _HEADER.size
+
+    # ----- recording (any thread) -----------------------------------------
+
+    def record(self, type_, payload=None, priority=NORMAL, t=None):
+        if len(self._pending) >= self.max_pending or self._closed:
+            self.dropped += 1
+            return
+        self._pending.append((time.monotonic() if t is None else t, type_, priority, payload or {}))
+
+    def attach(self, bus):
+        """Record everything published on an event_bus.EventBus."""
+        self._sub = bus.subscribe(["*"], self._on_event, name="trace", mode="sync")
+        return self._sub
+
+    def _on_event(self, ev):
+        if ev["type"] not in self.exclude:
+            self.record(ev["type"], ev["payload"], ev["priority"], ev["t"])
+
+    def record_signal(self, signal, type_, names=None, priority=NORMAL):
+        """Record a Qt signal as `type_` events: {names[i]: arg} or {"args": [...]}."""
+        def slot(*args):
+            if names:
+                payload = {n: _flatten(a) for n, a in zip(names, args)}
+            else:
+                payload = {"args": _flatten(list(args))}
+            self.record(type_, payload, priority)
+        signal.connect(slot)
+        return slot
+
+    # ----- writer thread --------------------------------------------------
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_s)
+            self._wake.clear()
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        raw = bytearray()
+        n = 0
+        while self._pending and n < 8192:
+            t, type_, prio, payload = self._pending.popleft()
+            self._encode(raw, t, type_, prio, payload)
+            n += 1
+        data = zlib.compress(bytes(raw), 6)
+        self._f.write(_BLOCK.pack(len(data), len(raw)))
+        self._f.write(data)
+        self._f.flush()
+        size = _BLOCK.size + len(data)
+        self.bytes += size
+        self._file_bytes += size
+        self.recorded += n
+        if self._pending:
+            self._wake.set()            # more than one block's worth queued
+        if self.rotate and self._file_bytes >= self.max_bytes:
+            self._f.close()
+            self._open()
+
+    def _encode(self, out, t, type_, prio, payload):
+        tid = self._types.get(type_)
+        if tid is None:
+            tid = self._types[type_] = len(self._types) + 1
+            name = type_.encode()
+            _varint(0, out)
+            _varint(0, out)
+            _varint(0, out)
+            _varint(len(name), out)
+            out += name
+        try:
+            body = marshal.dumps(payload)
+        except ValueError:
+            body = marshal.dumps(_flatten(payload))
+        if self._last_t is None:
+            self._last_t = t
+        dt = max(0, int((t - self._last_t) * 1e6))
+        self._last_t += dt / 1e6        # no rounding drift over a long trace
+        _varint(dt, out)
+        _varint(tid, out)
+        _varint(prio, out)
+        _varint(len(body), out)
+        out += body
+
+    def stats(self):
+        return {"file": self.file, "recorded": self.recorded, "pending": len(self._pending),
+                "dropped": self.dropped, "bytes": self.bytes}
+
+    def close(self):
+        if self._closed:
+            return
+        if self._sub is not None:
+            self._sub.bus.unsubscribe(self._sub)
+            self._sub = None
+        self._closed = True
+        self._wake.set()
+        self._thread.join(2.0)
+        while self._pending:
+            self._flush()
+        self._f.close()
+
+
+def trace_from_env():
+    """TraceRecorder for ARIES_TRACE (file or directory), or None."""
+    path = os.getenv("ARIES_TRACE")
+    if not path:
+        return None
+    return TraceRecorder(path, max_mb=float(os.getenv("ARIES_TRACE_MB", "64")))
+
+
+# ----- reading / replay -------------------------------------------------------
+
+def read_trace(path):
+    """Yield (t_s since the first event, type, priority, payload) from a trace."""
+    with open(path, "rb") as f:
+        head = f.read(_HEADER.size)
+        if len(head) < _HEADER.size or head[:4] != MAGIC:
+            raise ValueError(f"{path}: not an event trace")
+        _, version, _ = _HEADER.unpack(head)
+        if version != VERSION:
+            raise ValueError(f"{path}: trace version {version}, expected {VERSION}")
+        names, t = [None], 0
+        while True:
+            bh = f.read(_BLOCK.size)
+            if len(bh) < _BLOCK.size:
+                return
+            size, _ = _BLOCK.unpack(bh)
+            data = f.read(size)
+            if len(data) < size:
+                return                  # cut off mid-block (power loss)
+            buf, pos = zlib.decompress(data), 0
+            while pos < len(buf):
+                dt, pos = _read_varint(buf, pos)
+                tid, pos = _read_varint(buf, pos)
+                prio, pos = _read_varint(buf, pos)
+                n, pos = _read_varint(buf, pos)
+                body, pos = buf[pos:pos + n], pos + n
+                if tid == 0:
+                    names.append(body.decode())
+                    continue
+                t += dt
+                yield t / 1e6, names[tid], prio, marshal.loads(body)
+
+
+def trace_info(path):
+    counts = collections.Counter()
+    first = last = None
+    for t, type_, _, _ in read_trace(path):
+        counts[type_] += 1
+        first = t if first is None else first
+        last = t
+    with open(path, "rb") as f:
+        _, _, wall = _HEADER.unpack(f.read(_HEADER.size))
+    total = sum(counts.values())
+    span = (last or 0.0) - (first or 0.0)
+    return {"file": path, "started": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(wall)),
+            "events": total, "seconds": round(span, 3),
+            "rate_ev_s": round(total / span, 1) if span > 0 else 0.0,
+            "bytes": os.path.getsize(path),
+            "bytes_per_event": round(os.path.getsize(path) / total, 1) if total else 0.0,
+            "types": dict(counts.most_common())}
+
+
+def replay(path, publish, speed=1.0, types=None, stop=None):
+    """
+    Re-inject a trace through publish(type, payload, priority), keeping the
+    recorded spacing divided by `speed` (None or 0 = as fast as possible).
+    Returns how far behind schedule publishing ran (late = over 1 ms).
+    """
+    lag, n = [], 0
+    t_start = time.monotonic()
+    for t, type_, prio, payload in read_trace(path):
+        if types and type_ not in types:
+            continue
+        if stop is not None and stop.is_set():
+            break
+        if speed:
+            due = t_start + t / speed
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+                delay = due - time.monotonic()
+            lag.append(max(0.0, -delay))
+        publish(type_, payload, prio)
+        n += 1
+    wall = time.monotonic() - t_start
+    lag.sort()
+    pct = lambda p: round(1000 * lag[min(len(lag) - 1, int(p * len(lag)))], 3) if lag else 0.0
+    return {"events": n, "seconds": round(wall, 3), "rate_ev_s": round(n / wall, 1) if wall else 0.0,
+            "late_events": sum(1 for x in lag if x > 0.001), "lag_p50_ms": pct(0.5), "lag_p99_ms": pct(0.99),
+            "lag_max_ms": round(1000 * lag[-1], 3) if lag else 0.0}
+
+
+# ----- CLI --------------------------------------------------------------------
+
+# the ctx build (services / PaneHost) when it isn't installed as aOS1.main_ui_layer
+CTX_BUILD = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)))), "Arian Software Edits", "Sep 18 - 2025 Build")
+
+
+def _ctx_modules():
+    """(services, pane_host, pane_base): aOS1.main_ui_layer, else the ctx build dir."""
+    try:
+        from aOS1.main_ui_layer import services, pane_host, pane_base
+    except ImportError:
+        if os.path.isdir(CTX_BUILD) and CTX_BUILD not in sys.path:
+            sys.path.append(CTX_BUILD)
+        import services
+        import pane_host
+        import pane_base
+    return services, pane_host, pane_base
+
+
+def _headless_replay(args):
+    """Replay into make_services() + PaneHost with a probe pane, no display."""
+    services, pane_host, pane_base = _ctx_modules()
+    make_services, PaneHost, Pane = services.make_services, pane_host.PaneHost, pane_base.Pane
+
+    ctx = make_services()
+    handled = collections.Counter()
+
+    class ProbePane(Pane):
+        id = ctx.config.get("default_pane", "assistant")
+
+        def render(self):
+            pass
+
+        def on_voice(self, text):
+            handled["VOICE"] += 1
+
+        def on_gesture(self, name, data=None):
+            handled["GESTURE"] += 1
+
+        def on_action(self, name, **payload):
+            handled[name] += 1
+
+    host = PaneHost(ctx, [ProbePane()])
+    done = threading.Event()
+    result = {}
+
+    def feed():
+        time.sleep(0.2)                 # let the host mount its pane
+        result.update(replay(args.trace, ctx.event_bus.publish,
+                             None if args.max else args.speed,
+                             set(args.types.split(",")) if args.types else None))
+        time.sleep(0.5)                 # drain
+        done.set()
+        host._running = False
+
+    threading.Thread(target=feed, name="replay", daemon=True).start()
+    host.run()
+    host.stop()
+    return {"replay": result, "handled": dict(handled),
+            "bus": ctx.event_bus.stats(), "frame_budget": ctx.budget.report()}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Inspect or replay an event trace")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("info", help="event counts, span, rate")
+    p.add_argument("trace")
+    p = sub.add_parser("replay", help="re-inject into a headless instance")
+    p.add_argument("trace")
+    p.add_argument("--speed", type=float, default=1.0, help="time scale (10 = ten times faster)")
+    p.add_argument("--max", action="store_true", help="no pacing: as fast as possible")
+    p.add_argument("--types", default=None, help="only these event types (comma separated)")
+    p.add_argument("--json", default=None, help="write the full report here")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "info":
+        print(json.dumps(trace_info(args.trace), indent=2))
+        return 0
+    report = _headless_replay(args)
+    print(json.dumps({"replay": report["replay"], "handled": report["handled"]}, indent=2))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, default=str)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,23 @@
 from PyQt5.QtWidgets import QWidget, QLabel, QGraphicsDropShadowEffect, QGraphicsBlurEffect
 from PyQt5.QtGui import QPainter, QColor, QFont
-from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer
+from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal
+
+from sprite_cache import sprites, live_effects
+from timer_wheel import wheel
 
 class FloatingCard(QWidget):
     """
     A translucent, frosted notification card with drop shadow,
     fade-in/out, and optional blur-behind effect.
+
+    One fade animation and one hold timer are reused for every message,
+    driven by a small state machine, so a new message can never be hidden
+    by the fade-out of an older one.
     """
+    dismissed = pyqtSignal()
+
+    HIDDEN, FADING_IN, SHOWING, FADING_OUT = range(4)
+
     def __init__(self, text="", parent=None, radius=20, blur_behind=False):
         super().__init__(parent)
         self.setAttribute(Qt.WA_TranslucentBackground)
@@ -24,12 +35,11 @@ class FloatingCard(QWidget):
         self._radius = radius
         self._blur = None
 
-        # Drop shadow
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 150))
-        shadow.setOffset(0, 0)
-        self.setGraphicsEffect(shadow)
+        # Drop shadow: live effect, or a cached sprite drawn in a margin
+        self._shadow_blur = 20
+        self._shadow_color = QColor(0, 0, 0, 150)
+        self._margin = 0
+        self.applyEffectsMode(live_effects())
 
         # Optional blur-behind
         if blur_behind:
@@ -37,15 +47,45 @@ class FloatingCard(QWidget):
             blur.setBlurRadius(12)
             self._blur = blur
 
+        # Reused for every message (see showMessage)
+        self._state = self.HIDDEN
+        self._fade = QPropertyAnimation(self, b"windowOpacity", self)
+        self._fade.finished.connect(self._onFadeFinished)
+        self._hold = wheel.timer(self._fadeOut, single_shot=True, slack_ms=100, owner=self)
+
         self.hide()
 
+    def applyEffectsMode(self, live):
+        if live:
+            shadow = QGraphicsDropShadowEffect(self)
+            shadow.setBlurRadius(self._shadow_blur)
+            shadow.setColor(self._shadow_color)
+            shadow.setOffset(0, 0)
+            self.setGraphicsEffect(shadow)
+            margin = 0
+        else:
+            self.setGraphicsEffect(None)
+            margin = self._shadow_blur
+        # keep the card itself where it was when the margin changes
+        delta = margin - self._margin
+        self._margin = margin
+        self.setGeometry(self.geometry().adjusted(-delta, -delta, delta, delta))
+        self.label.move(12 + margin, 8 + margin)
+        self.update()
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
+        m = self._margin
+        card = self.rect().adjusted(m, m, -m, -m)
+        if m:
+            halo = sprites.rounded_glow(card.width(), card.height(), self._radius,
+                                        self._shadow_blur, self._shadow_color)
+            painter.drawPixmap(0, 0, halo)
         # Frosted white background
         painter.setBrush(QColor(255, 255, 255, 200))
         painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(self.rect(), self._radius, self._radius)
+        painter.drawRoundedRect(card, self._radius, self._radius)
         painter.end()
 
     def showMessage(self, text, duration=3000):
@@ -55,31 +95,53 @@ class FloatingCard(QWidget):
         self.label.setText(text)
         # Resize to fit content + padding
         self.label.adjustSize()
-        w = self.label.width() + 24
-        h = self.label.height() + 16
+        m = self._margin
+        w = self.label.width() + 24 + 2 * m
+        h = self.label.height() + 16 + 2 * m
         self.resize(w, h)
-        self.label.move(12, 8)
+        self.label.move(12 + m, 8 + m)
 
-        # Initial state
-        self.setWindowOpacity(0.0)
-        self.show()
+        self._hold.setInterval(duration)
 
-        # Fade in
-        fade_in = QPropertyAnimation(self, b"windowOpacity", self)
-        fade_in.setDuration(250)
-        fade_in.setStartValue(0.0)
-        fade_in.setEndValue(1.0)
-        fade_in.setEasingCurve(QEasingCurve.OutCubic)
-        fade_in.start()
+        if self._state == self.SHOWING:
+            # Already up: swap the text and restart the hold
+            self._hold.start()
+            return
+        if self._state == self.FADING_IN:
+            # hold starts when the fade-in finishes
+            return
 
-        # Schedule fade out
-        QTimer.singleShot(duration, self._fadeOut)
+        # HIDDEN, or FADING_OUT (reverse from wherever the fade got to)
+        start = self.windowOpacity() if self._state == self.FADING_OUT else 0.0
+        self._fade.stop()
+        self.setWindowOpacity(start)
+        self.show()
+        self._state = self.FADING_IN
+        self._fade.setDuration(250)
+        self._fade.setStartValue(start)
+        self._fade.setEndValue(1.0)
+        self._fade.setEasingCurve(QEasingCurve.OutCubic)
+        self._fade.start()
+
+    def isBusy(self):
+        return self._state != self.HIDDEN
 
     def _fadeOut(self):
-        fade_out = QPropertyAnimation(self, b"windowOpacity", self)
-        fade_out.setDuration(400)
-        fade_out.setStartValue(1.0)
-        fade_out.setEndValue(0.0)
-        fade_out.setEasingCurve(QEasingCurve.InCubic)
-        fade_out.start()
-        fade_out.finished.connect(self.hide)
+        if self._state != self.SHOWING:
+            return
+        self._state = self.FADING_OUT
+        self._fade.stop()
+        self._fade.setDuration(400)
+        self._fade.setStartValue(self.windowOpacity())
+        self._fade.setEndValue(0.0)
+        self._fade.setEasingCurve(QEasingCurve.InCubic)
+        self._fade.start()
+
+    def _onFadeFinished(self):
+        if self._state == self.FADING_IN:
+            self._state = self.SHOWING
+            self._hold.start()
+        elif self._state == self.FADING_OUT:
+            self._state = self.HIDDEN
+            self.hide()
+            self.dismissed.emit()
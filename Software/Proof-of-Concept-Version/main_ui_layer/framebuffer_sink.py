@@ -0,0 +1,214 @@
+# framebuffer_sink.py
+import mmap
+import os
+import re
+import struct
+
+import numpy as np
+from PyQt5.QtGui import QImage
+from PyQt5.QtCore import Qt
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# bytes per pixel for the formats the micro-display / fbdev drivers use
+FORMATS = {"RGB565": 2, "RGB888": 3, "XRGB8888": 4}
+_BPP_TO_FORMAT = {16: "RGB565", 24: "RGB888", 32: "XRGB8888"}
+
+SYSFS = "/sys/class/graphics"
+DEFAULT_SIZE = (800, 480)           # when config.yaml has no display size
+FBIOGET_VSCREENINFO = 0x4600
+_VAR_SCREENINFO = struct.Struct("<7I")  # xres, yres, xres_virtual, yres_virtual, xoffset, yoffset, bpp
+_VAR_SCREENINFO_SIZE = 160              # sizeof(struct fb_var_screeninfo)
+
+
+def _read_sysfs(path):
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _var_screeninfo(path):
+    """fb_var_screeninfo's leading fields via FBIOGET_VSCREENINFO, or None."""
+    try:
+        import fcntl
+        fd = os.open(path, os.O_RDONLY)
+    except (ImportError, OSError):
+        return None
+    try:
+        buf = fcntl.ioctl(fd, FBIOGET_VSCREENINFO, bytes(_VAR_SCREENINFO_SIZE))
+    except OSError:
+        return None         # not a framebuffer device (e.g. a regular file)
+    finally:
+        os.close(fd)
+    return _VAR_SCREENINFO.unpack_from(buf)
+
+
+def fb_geometry(path):
+    """
+    (width, height, format, stride, map_rows, row_offset) for a /dev/fbN
+    device, or None if `path` is not a framebuffer (e.g. a plain file for
+    testing).
+
+    width x height is the visible mode (FBIOGET_VSCREENINFO xres/yres, else
+    the first line of sysfs `modes`). `virtual_size` is only the panning
+    area -- double-buffered drivers report twice the height there -- so it
+    just sizes the mapping (map_rows); row_offset is the panned-to row the
+    panel is showing.
+    """
+    name = os.path.basename(path)
+    base = os.path.join(SYSFS, name)
+    if not name.startswith("fb") or not os.path.isdir(base):
+        return None
+    virtual = _read_sysfs(os.path.join(base, "virtual_size"))
+    bpp = _read_sysfs(os.path.join(base, "bits_per_pixel"))
+    stride = _read_sysfs(os.path.join(base, "stride"))
+    info = _var_screeninfo(path)
+    if info is not None:
+        w, h, _, map_rows, _, row_offset, info_bpp = info
+        bpp = bpp or str(info_bpp)
+    else:
+        if not virtual:
+            return None
+        w, map_rows = (int(v) for v in virtual.split(","))
+        h, row_offset = map_rows, 0
+        # e.g. "U:800x480p-60"; without it, assume no panning
+        mode = re.search(r"(\d+)x(\d+)", _read_sysfs(os.path.join(base, "modes")) or "")
+        if mode:
+            w, h = int(mode.group(1)), int(mode.group(2))
+    if not bpp:
+        return None
+    fmt = _BPP_TO_FORMAT.get(int(bpp))
+    if fmt is None:
+        return None
+    map_rows = max(map_rows, row_offset + h)
+    return w, h, fmt, int(stride) if stride else w * FORMATS[fmt], map_rows, row_offset
+
+
+def configured_size(path=None):
+    """
+    (width, height) from config.yaml's `display:` (ARIES_CONFIG or
+    ./config.yaml, as apps.registry reads it), else DEFAULT_SIZE.
+    """
+    path = path or os.getenv("ARIES_CONFIG", "config.yaml")
+    if yaml is None or not os.path.exists(path):
+        return DEFAULT_SIZE
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            display = (yaml.safe_load(f) or {}).get("display") or {}
+        return (int(display.get("width", DEFAULT_SIZE[0])),
+                int(display.get("height", DEFAULT_SIZE[1])))
+    except Exception as e:
+        print(f"⚠️ framebuffer: failed to read display size from {path}: {e}")
+        return DEFAULT_SIZE
+
+
+class FramebufferSink:
+    """
+    Writes composed UI frames straight into a memory-mapped framebuffer
+    (/dev/fb*, or any regular file so it can be tested anywhere).
+
+    Conversion from Qt's ARGB32 to the panel format is vectorised numpy, and
+    only rows that changed since the previous frame are copied into the map.
+    """
+    def __init__(self, path, width=800, height=480, fmt="RGB565", stride=None):
+        geo = fb_geometry(path)
+        map_rows, row_offset = height, 0
+        if geo:
+            width, height, fmt, stride, map_rows, row_offset = geo
+        if fmt not in FORMATS:
+            raise ValueError(f"unsupported framebuffer format {fmt!r}")
+
+        self.path = path
+        self.width, self.height, self.fmt = width, height, fmt
+        self.row_bytes = width * FORMATS[fmt]
+        self.stride = stride or self.row_bytes
+        size = self.stride * map_rows
+
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if geo is None and os.fstat(fd).st_size < size:
+                os.ftruncate(fd, size)
+            self._mm = mmap.mmap(fd, size, mmap.MAP_SHARED,
+                                 mmap.PROT_READ | mmap.PROT_WRITE)
+        finally:
+            os.close(fd)
+        self._fb = np.frombuffer(self._mm, np.uint8).reshape(
+            map_rows, self.stride)[row_offset:row_offset + height]
+        self._prev = None
+
+        self.frames = 0
+        self.rows_written = 0
+
+    def size(self):
+        return self.width, self.height
+
+    def convert(self, image):
+        """QImage -> (height, row_bytes) uint8 array in the panel format."""
+        if image.width() != self.width or image.height() != self.height:
+            image = image.scaled(self.width, self.height,
+                                 Qt.IgnoreAspectRatio, Qt.FastTransformation)
+        if image.format() != QImage.Format_RGB32:
+            image = image.convertToFormat(QImage.Format_RGB32)
+        w, h = image.width(), image.height()
+        ptr = image.constBits()
+        ptr.setsize(image.byteCount())
+        # Format_RGB32 is 0xffRRGGBB, i.e. B,G,R,X bytes on little-endian
+        bgrx = np.frombuffer(ptr, np.uint8).reshape(h, image.bytesPerLine())
+        bgrx = bgrx[:, :w * 4].reshape(h, w, 4)
+
+        if self.fmt == "XRGB8888":
+            return bgrx.reshape(h, w * 4).copy()
+        if self.fmt == "RGB888":
+            return np.ascontiguousarray(bgrx[..., :3]).reshape(h, w * 3)
+
+        b = bgrx[..., 0].astype(np.uint16)
+        g = bgrx[..., 1].astype(np.uint16)
+        r = bgrx[..., 2].astype(np.uint16)
+        rgb565 = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+        return rgb565.astype("<u2").view(np.uint8).reshape(h, w * 2)
+
+    def write(self, image):
+        """Push one frame; returns the number of rows actually written."""
+        rows = self.convert(image)
+        if self._prev is None:
+            changed = np.arange(self.height)
+        else:
+            changed = np.flatnonzero(np.any(rows != self._prev, axis=1))
+        self._prev = rows
+        self.frames += 1
+        if changed.size == 0:
+            return 0
+
+        # copy contiguous runs of dirty rows as single slices
+        breaks = np.flatnonzero(np.diff(changed) != 1) + 1
+        for run in np.split(changed, breaks):
+            a, b = run[0], run[-1] + 1
+            self._fb[a:b, :self.row_bytes] = rows[a:b]
+        self.rows_written += changed.size
+        return int(changed.size)
+
+    def close(self):
+        if self._mm is not None:
+            self._fb = None
+            self._mm.close()
+            self._mm = None
+
+
+def sink_from_env():
+    """
+    ARIES_FB=/dev/fb1 (or a file path) enables the sink.
+    ARIES_FB_SIZE (e.g. 800x480) defaults to config.yaml's display size,
+    ARIES_FB_FORMAT to RGB565; a real /dev/fb* reports its own geometry and
+    overrides both.
+    """
+    path = os.getenv("ARIES_FB")
+    if not path:
+        return None
+    size = os.getenv("ARIES_FB_SIZE")
+    w, h = (int(v) for v in size.lower().split("x")) if size else configured_size()
+    return FramebufferSink(path, w, h, os.getenv("ARIES_FB_FORMAT", "RGB565"))
@@ -2,35 +2,43 @@
 import sys
 import os
 import time
-import inspect
-import requests
+# first, so a boot profile (ARIES_BOOT_PROFILE) also times the imports below
+from boot_profiler import profiler
 import psutil
+from collections import deque
 from datetime import datetime
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QSplashScreen, QWidget, QStackedWidget,
     QGraphicsView, QGraphicsScene, QGraphicsBlurEffect, QLabel, QVBoxLayout
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
-from PyQt5.QtGui import QPixmap, QPainter, QColor, QPainterPath, QFont
-from PyQt5.QtWidgets import QGraphicsObject, QGraphicsDropShadowEffect
+from PyQt5.QtCore import Qt, QTimer, QEvent, QEventLoop, pyqtSignal
+from PyQt5.QtGui import QPixmap, QImage, QPainter, QColor, QPainterPath, QFont, QKeySequence
+from PyQt5.QtWidgets import QGraphicsObject, QGraphicsDropShadowEffect, QShortcut
 from PyQt5.QtCore import QPointF, QRectF, pyqtProperty, QPropertyAnimation, QEasingCurve
+from PyQt5.QtCore import QAbstractAnimation
 
 # core modules
 from camera import CameraFeed
 from floating_card import FloatingCard
+from notification_presenter import NotificationPresenter
 from assistant_pill import AssistantPillIcon
-
-# panepackage
-from apps import (
-    BasePane,
-    SettingsPane, MapsPane, AssistantPane, BluetoothPane,
-    PhotoPane, VideoPane, TranslatorPane, NavPane,
-    MusicPane, MusicPaneUnavailable, CallPane,
-    DrawingPane, PersonTrackerPane, GestureCanvasPane,
-    LLMPane, ThemeManager, SharedARPane,
-    SpatialAudioManager, LiveStreamPane
-)
+from sprite_cache import sprites, frosted, live_effects, set_live_effects
+from framebuffer_sink import sink_from_env
+from warmup import warmup
+from snapshot import snapshots
+from worker_hub import hub_from_env
+from async_runtime import AsyncRuntime, fetch_json
+from event_trace import trace_from_env
+from stall_watchdog import watchdog_from_env
+from timer_wheel import wheel
+from memory_manager import MemoryManager
+from memory_audit import audit_from_env
+from power_profiles import power_from_env
+
+# panepackage (panes themselves are imported lazily, see pane_loader)
+from apps import PANES, enabled_panes
+from pane_loader import PaneLoader
 
 # AR & AI
 from contextual_assistant import ContextualAssistant
@@ -51,48 +59,98 @@ if not hasattr(FloatingCard, "setText"):
             self._text = txt
     FloatingCard.setText = _fc_setText
 
+ASSETS_DIR = "VisionAriesAssets"
+
+# panes that sit in a "warming" state until their warm-up job is done
+WARM_GATES = {"draw": "mediapipe", "gesture": "mediapipe"}
+
 # ------------------------------------------------------------------
 # IconItem + CoverFlowLauncher (with labels)
 # ------------------------------------------------------------------
+GLOW_BLUR = 40
+GLOW_COLOR = QColor(255, 255, 255, 200)
+# room for the glow plus the 1.4x selected scale around the 128px icon
+ICON_MARGIN = 88
+
+
+ICON_RADIUS = 32
+
+
+def render_icon(image_path, size=128, radius=ICON_RADIUS):
+    """Scaled, rounded icon as a QImage (QImage, not QPixmap: warm-up threads)."""
+    img = QImage(image_path)
+    if img.isNull():
+        print(f"⚠️ Missing icon: {image_path}")
+    out = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    out.fill(Qt.transparent)
+    if not img.isNull():
+        base = img.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        p = QPainter(out)
+        p.setRenderHint(QPainter.Antialiasing)
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(0, 0, size, size), radius, radius)
+        p.setClipPath(path)
+        p.drawImage(0, 0, base)
+        p.end()
+    return out
+
+
+def render_icon_atlas(paths):
+    """{path: QImage} for every launcher icon; runs as the "icons" warm-up job."""
+    return {path: render_icon(path) for path in paths}
+
+
 class IconItem(QGraphicsObject):
-    def __init__(self, image_path, label, index):
+    def __init__(self, image_path, label, index, image=None):
         super().__init__()
         self.index = index
         self.label = label
         self._scale = 1.0
         self._shine = 0.0
-        self.radius = 32
-
-        pix = QPixmap(image_path)
-        if pix.isNull():
-            print(f"⚠️ Missing icon: {image_path}")
-            pix = QPixmap(128, 128)
-            pix.fill(Qt.transparent)
-        base = pix.scaled(128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-
-        w = h = 128
-        self._pixmap = QPixmap(w, h)
-        self._pixmap.fill(Qt.transparent)
-        p = QPainter(self._pixmap)
-        p.setRenderHint(QPainter.Antialiasing)
-        path = QPainterPath()
-        path.addRoundedRect(QRectF(0, 0, w, h), self.radius, self.radius)
-        p.setClipPath(path)
-        p.drawPixmap(0, 0, base)
-        p.end()
+        self.radius = ICON_RADIUS
+
+        self._pixmap = QPixmap.fromImage(image if image is not None
+                                         else render_icon(image_path))
 
-        glow = QGraphicsDropShadowEffect(self)
-        glow.setBlurRadius(40)
-        glow.setColor(QColor(255, 255, 255, 200))
-        glow.setOffset(0, 0)
-        glow.setEnabled(False)
-        self.setGraphicsEffect(glow)
+        self._glow = False
+        self.applyEffectsMode(live_effects())
 
         self.setAcceptHoverEvents(True)
         self.setCursor(Qt.PointingHandCursor)
 
+    def applyEffectsMode(self, live):
+        """Live drop-shadow effect, or the cached glow sprite painted inline."""
+        if live:
+            glow = QGraphicsDropShadowEffect(self)
+            glow.setBlurRadius(GLOW_BLUR)
+            glow.setColor(GLOW_COLOR)
+            glow.setOffset(0, 0)
+            glow.setEnabled(self._glow)
+            self.setGraphicsEffect(glow)
+        else:
+            self.setGraphicsEffect(None)
+        self.update()
+
+    def setWarming(self, on):
+        """Dimmed while the pane's models are still loading in the background."""
+        self.setOpacity(0.45 if on else 1.0)
+        self.setToolTip(f"{self.label} (warming up…)" if on else "")
+
+    def setGlow(self, on):
+        self._glow = on
+        if self.graphicsEffect() is not None:
+            self.graphicsEffect().setEnabled(on)
+        self.update()
+
     def boundingRect(self):
-        return QRectF(0, 0, 128, 128)
+        m = ICON_MARGIN
+        return QRectF(-m, -m, 128 + 2 * m, 128 + 2 * m)
+
+    def shape(self):
+        # keep hover/click on the icon itself, not the glow margin
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(0, 0, 128, 128), self.radius, self.radius)
+        return path
 
     def paint(self, painter, *_):
         painter.setRenderHint(QPainter.Antialiasing)
@@ -100,6 +158,9 @@ class IconItem(QGraphicsObject):
         painter.translate(64, 64)
         painter.scale(self._scale, self._scale)
         painter.translate(-64, -64)
+        if self._glow and self.graphicsEffect() is None:
+            halo = sprites.rounded_glow(128, 128, self.radius, GLOW_BLUR, GLOW_COLOR)
+            painter.drawPixmap(-GLOW_BLUR, -GLOW_BLUR, halo)
         painter.drawPixmap(0, 0, self._pixmap)
         painter.restore()
         if self._shine > 0:
@@ -136,7 +197,9 @@ class IconItem(QGraphicsObject):
 
 
 class CoverFlowLauncher(QGraphicsView):
-    def __init__(self, icons, parent=None):
+    indexChanged = pyqtSignal(int)
+
+    def __init__(self, icons, parent=None, atlas=None):
         super().__init__(parent)
         self.setStyleSheet("background:transparent;")
         self.setAlignment(Qt.AlignCenter)
@@ -148,20 +211,27 @@ class CoverFlowLauncher(QGraphicsView):
         self.items = []
         self.index = 0
 
+        atlas = atlas or {}
         for i, (path, name) in enumerate(icons):
-            it = IconItem(path, name, i)
+            it = IconItem(path, name, i, image=atlas.get(path))
             self.scene.addItem(it)
             self.items.append(it)
 
         self.update_icons(animated=False)
 
+    def applyEffectsMode(self, live):
+        for it in self.items:
+            it.applyEffectsMode(live)
+
     def keyPressEvent(self, ev):
         if ev.key() == Qt.Key_Right:
             self.index = (self.index + 1) % len(self.items)
             self.update_icons(animated=True)
+            self.indexChanged.emit(self.index)
         elif ev.key() == Qt.Key_Left:
             self.index = (self.index - 1) % len(self.items)
             self.update_icons(animated=True)
+            self.indexChanged.emit(self.index)
 
     def resizeEvent(self, ev):
         super().resizeEvent(ev)
@@ -175,7 +245,7 @@ class CoverFlowLauncher(QGraphicsView):
         for i, it in enumerate(self.items):
             x = (i - self.index) * spacing + mid_x
             sel = (i == self.index)
-            it.graphicsEffect().setEnabled(sel)
+            it.setGlow(sel)
 
             if sel and animated:
                 shine = QPropertyAnimation(it, b"shine", self)
@@ -207,7 +277,7 @@ class CoverFlowLauncher(QGraphicsView):
 class StatusBar(QWidget):
     LAT, LON = 37.7749, -122.4194
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, loop=None):
         super().__init__(parent)
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.setFixedHeight(48)
@@ -219,36 +289,55 @@ class StatusBar(QWidget):
         self.lbl.setGeometry(8, 0, parent.width() - 16, 48)
 
         self._console = []
-        self._update()
-        t = QTimer(self)
-        t.timeout.connect(self._update)
-        t.start(30_000)
+        self.loop = loop                # weather is fetched on the async runtime
+        self._fetching = False
+        self.weather = None
+        # last known weather from the previous run, until the first fetch
+        snapshots.register("weather", lambda: self.weather, self._restore_weather)
+        self._update(fetch=True)
+        self._timer = wheel.every(30, self._update, slack_s=5, owner=self)
+
+    def set_refresh(self, seconds):
+        """Weather / status refresh interval (power profiles)."""
+        self._timer.slack_s = seconds / 6
+        self._timer.setInterval(seconds * 1000)
 
     def append(self, line):
         self._console.append(line)
         if len(self._console) > 3:
             self._console.pop(0)
-        self._update()
-
-    def _get_weather(self):
-        try:
-            url = (
-                f"https://api.open-meteo.com/v1/forecast"
-                f"?latitude={self.LAT}&longitude={self.LON}"
-                "&current_weather=true&timezone=auto"
-            )
-            j = requests.get(url, timeout=2).json()["current_weather"]
-            ft = round(j["temperature"] * 9 / 5 + 32)
-            icon = "☀️" if j["weathercode"] < 3 else "☁️"
-            return f"{ft}°F {icon}"
-        except:
-            return "–°F"
-
-    def _update(self):
+        self._update(fetch=False)
+
+    async def _get_weather(self):
+        url = (
+            f"https://api.open-meteo.com/v1/forecast"
+            f"?latitude={self.LAT}&longitude={self.LON}"
+            "&current_weather=true&timezone=auto"
+        )
+        j = (await fetch_json(url, timeout=2))["current_weather"]
+        ft = round(j["temperature"] * 9 / 5 + 32)
+        icon = "☀️" if j["weathercode"] < 3 else "☁️"
+        return f"{ft}°F {icon}"
+
+    def _restore_weather(self, weather):
+        self.weather = weather
+
+    def _set_weather(self, weather):
+        self._fetching = False
+        self.weather = weather
+        self._update(fetch=False)
+
+    def _update(self, fetch=True):
+        if fetch and self.loop is not None and not self._fetching:
+            # shows the last known weather until the answer comes back
+            self._fetching = True
+            self.loop.submit(self._get_weather(), on_result=self._set_weather,
+                             on_error=lambda e: self._set_weather(self.weather or "–°F"),
+                             owner=self)
         now = datetime.now().strftime("%-I:%M %p")
         batt = psutil.sensors_battery()
         bp = f"{int(batt.percent)}%" if batt else "–%"
-        weather = self._get_weather()
+        weather = self.weather or "–°F"
         cpu = psutil.cpu_percent()
         ram = psutil.virtual_memory().percent
         build = "Aries OS 1.0 α·Bld1 · May 21 2025"
@@ -286,37 +375,73 @@ class OverlayLabel(QLabel):
         self.setText(text)
         self.adjustSize()
         self.show()
-        QTimer.singleShot(timeout, self.hide)
+        wheel.after(timeout / 1000, self.hide, slack_s=0.1, owner=self)
 
 # ------------------------------------------------------------------
 # Main Window
 # ------------------------------------------------------------------
 class VisionAriesUI(QMainWindow):
-    def __init__(self, icons):
+    def __init__(self, specs=None):
         super().__init__()
+        self._frame_ms = deque(maxlen=120)      # paint time per frame (see event())
+        with profiler.phase("VisionAriesUI.__init__"):
+            self._build(specs)
+
+    def _build(self, specs):
         self.setWindowTitle("Vision Aries OS")
         self.setGeometry(50, 50, 960, 540)
 
-        # Splash
-        logo = QPixmap("VisionAriesAssets/VisionAriesLogo.png")
-        if logo.isNull():
-            logo = QPixmap(960, 540)
-            logo.fill(Qt.black)
-        sp = QSplashScreen(logo)
-        sp.showMessage("Empowering Visionaries",
-                       Qt.AlignBottom | Qt.AlignCenter, Qt.white)
-        sp.show(); QApplication.processEvents()
-        time.sleep(0.5)
-        sp.close()
+        # Periodic work shares one timer and its wakeups (see timer_wheel.py)
+        wheel.attach_qt(self)
+
+        # Optional direct output to the micro-display framebuffer
+        self.fb = sink_from_env()
+        if self.fb:
+            self.resize(*self.fb.size())
+            self._fb_frame = QImage(self.fb.width, self.fb.height, QImage.Format_RGB32)
+
+        # Splash; stays up (with warm-up progress) until the launcher is ready
+        with profiler.phase("splash"):
+            logo = QPixmap("VisionAriesAssets/VisionAriesLogo.png")
+            if logo.isNull():
+                logo = QPixmap(960, 540)
+                logo.fill(Qt.black)
+            self._splash = QSplashScreen(logo)
+            self._splash.showMessage("Empowering Visionaries",
+                                     Qt.AlignBottom | Qt.AlignCenter, Qt.white)
+            self._splash.show(); QApplication.processEvents()
+
+        # Vision + voice worker processes (see workers.py), started first so
+        # their models load on the other cores while the splash is up
+        self.workers = hub_from_env()
+        if self.workers is not None:
+            self.workers.start()
+
+        # One asyncio loop for network / subprocess waits (see async_runtime.py)
+        self.loop = AsyncRuntime()
+
+        # Heavy resources load in the background from here on (see warmup.py)
+        self.specs = specs if specs is not None else enabled_panes(PANES)
+        icons = [(os.path.join(ASSETS_DIR, s.icon), s.label) for s in self.specs]
+        warmup.progress.connect(self._on_warmup_progress)
+        warmup.start(self._warmup_jobs([path for path, _ in icons], self.workers))
 
         # Central Camera
-        self.camera = CameraFeed()
+        with profiler.phase("CameraFeed open"):
+            self.camera = CameraFeed()
         self.setCentralWidget(self.camera)
+        if self.workers is not None:
+            self.camera.publish = self.workers.publish
+
+        # Battery-aware power profile; applied once the frame loop exists
+        # (see _apply_power / power_profiles.py)
+        self.power = power_from_env(wheel=wheel)
 
         # Contextual AI
         self.ctx = ContextualAssistant(self.camera)
         self.ctx.frameOverlay.connect(self.update_camera_feed)
-        self.ctx.suggestionReady.connect(lambda m: self.notif.showMessage(m, 3000))
+        self.ctx.suggestionReady.connect(
+            lambda m: self.presenter.post(m, 3000, source="assistant"))
         self.ctx.start()
 
         # Speech / object overlay
@@ -325,44 +450,38 @@ class VisionAriesUI(QMainWindow):
             lambda cmd, resp: self.speech_ol.show_timed(f"> {cmd}\n{resp}", 3000)
         )
 
-        # Cover-flow launcher
-        self.launcher = CoverFlowLauncher(icons, self)
+        # Cover-flow launcher, one icon per enabled registry entry
+        with profiler.phase("launcher"):
+            atlas = self._wait_for("icons")
+            self.launcher = CoverFlowLauncher(icons, self, atlas=atlas)
         self.launcher.setGeometry(self.rect())
         self.launcher.raise_()
+        for it, spec in zip(self.launcher.items, self.specs):
+            job = WARM_GATES.get(spec.id)
+            if job and warmup.is_warming(job):
+                it.setWarming(True)
+                warmup.when_ready(job, lambda _, it=it: it.setWarming(False))
 
-        # Stacked panes
-        self.pages = QStackedWidget(self)
-        pane_classes = [
-            SettingsPane, MapsPane, AssistantPane, BluetoothPane,
-            PhotoPane, VideoPane, TranslatorPane, NavPane,
-            MusicPane, CallPane,
-            DrawingPane, PersonTrackerPane, GestureCanvasPane,
-            LLMPane, ThemeManager, SharedARPane,
-            SpatialAudioManager, LiveStreamPane
-        ]
+        if self.workers is not None:
+            self.workers.voiceText.connect(self._on_voice_text)
 
-        for cls in pane_classes:
-            sig = inspect.signature(cls.__init__)
-            params = set(sig.parameters) - {"self"}
-            args, kwargs = [], {}
-            if "camera_feed" in params:
-                args.append(self.camera)
-            if "ctx_assistant" in params:
-                args.append(self.ctx)
-            if "parent" in params:
-                kwargs["parent"] = self
-
-            try:
-                page = cls(*args, **kwargs)
-            except Exception as e:
-                print(f"⚠️ failed to instantiate {cls.__name__}: {e}")
-                continue
-
-            # wire up Home button
-            if hasattr(page, "goHomeRequested"):
-                page.goHomeRequested.connect(lambda _=None: self.launch_app(0))
-
-            self.pages.addWidget(page)
+        # Stacked panes: placeholders now, real panes on first launch
+        self.pages = QStackedWidget(self)
+        self.loader = PaneLoader(
+            self.pages, self.specs,
+            deps={"camera_feed": self.camera, "ctx_assistant": self.ctx,
+                  "parent": self, "vision": self.workers, "loop": self.loop,
+                  "timers": wheel, "power": self.power},
+            on_home=lambda: self.launch_app(0),
+            gates=WARM_GATES)
+        # build the panes either side of the focused icon ahead of time
+        self.launcher.indexChanged.connect(self.loader.prefetch)
+
+        # Under memory pressure: drop unopened prefetches, then hibernate
+        # hidden panes least recently used first
+        self.memory = MemoryManager(log=self._log_memory)
+        self.memory.add_source(self.loader.memory_candidates)
+        self._memTimer = wheel.every(self.memory.interval_s, self.memory.check, owner=self)
 
         self.pages.setGeometry(self.rect())
         self.pages.lower()
@@ -374,13 +493,14 @@ class VisionAriesUI(QMainWindow):
         # System notifications
         self.notif = FloatingCard(parent=self, blur_behind=True)
         self.notif.raise_()
+        self.presenter = NotificationPresenter(self.notif, parent=self)
         self.sys_notif = NotificationCenter(self)
         self.sys_notif.notificationReceived.connect(
-            lambda m: self.notif.showMessage(m, 5000))
+            lambda m: self.presenter.post(m, 5000, source="system"))
         self.sys_notif.start()
 
         # Status bar
-        self.status = StatusBar(self)
+        self.status = StatusBar(self, loop=self.loop)
         self.status.raise_()
 
         # Mic pill
@@ -394,12 +514,196 @@ class VisionAriesUI(QMainWindow):
         self.pill.installEventFilter(self)
         self.pill_bg.raise_()
 
+        # Pre-rendered "listening" frost over the camera (see sprite_cache)
+        self._frost = QLabel(self)
+        self._frost.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self._frost.hide()
+
+        # F2: live QGraphicsEffects vs cached sprites, to compare frame times
+        QShortcut(QKeySequence(Qt.Key_F2), self, self.toggle_live_effects)
+
+        # GUI stalls: the frame tick below is the heartbeat; the stack is
+        # sampled while it's stuck (stall_watchdog.py); F4 shows the worst call sites
+        import apps
+        self.watchdog = watchdog_from_env((os.path.dirname(os.path.abspath(__file__)),
+                                           os.path.dirname(os.path.abspath(apps.__file__))))
+        if self.watchdog is not None:
+            QShortcut(QKeySequence(Qt.Key_F4), self, self.show_stalls)
+
         # 60FPS update loop
-        self._upd = QTimer(self)
-        self._upd.timeout.connect(self.update)
-        self._upd.start(16)
+        # (slack 0: everything else lines up on these ticks)
+        self._upd = wheel.every(0.016, self._tick, slack_s=0, owner=self)
+        QShortcut(QKeySequence(Qt.Key_F5), self, self.show_timers)
+
+        # Camera, detector cadence, frame rate, weather and voice follow the
+        # battery together; the user's choice in Settings survives restarts
+        # unless ARIES_POWER pins one
+        self.power.bind(self._apply_power)
+        self._powerTimer = wheel.every(self.power.interval_s,
+                                       lambda: self.power.check(force=True),
+                                       slack_s=2, owner=self)
+        if not os.getenv("ARIES_POWER"):
+            snapshots.register("power", lambda: self.power.override, self.power.set_override)
+        QShortcut(QKeySequence(Qt.Key_F6), self, self.show_power)
+
+        # ARIES_MEM_AUDIT: per-subsystem memory accounting (memory_audit.py)
+        self._setup_memory_audit()
+
+        # ARIES_TRACE: record assistant / notification traffic for replay
+        # load tests (event_trace.py)
+        self.trace = trace_from_env()
+        if self.trace is not None:
+            self.trace.record_signal(self.ctx.voiceCommandProcessed, "VOICE_CMD", ("cmd", "resp"))
+            self.trace.record_signal(self.ctx.suggestionReady, "SUGGESTION", ("text",))
+            self.trace.record_signal(self.ctx.frameOverlay, "FRAME_OVERLAY", ("frame",), priority=3)
+            self.trace.record_signal(self.sys_notif.notificationReceived, "NOTIFY", ("text",))
+            if self.workers is not None:
+                self.trace.record_signal(self.workers.voiceText, "VOICE", ("text",), priority=1)
+
+        # Fast resume: back to the pane / launcher position of the last run
+        snapshots.register("ui", self._snapshot_ui, self._restore_ui)
+        self._autosave = wheel.every(snapshots.autosave_s, snapshots.save, owner=self)
 
         self.show()
+        self._splash.finish(self)
+        if warmup.busy():
+            warmup.allDone.connect(self._on_warmup_done)
+        else:
+            self._on_warmup_done()
+
+    @staticmethod
+    def _warmup_jobs(icon_paths, workers=None):
+        # with worker processes these just wait for the worker to come up,
+        # and only load in-process if it can't (missing module/model)
+        def vosk():
+            if workers is not None and workers.wait_ready("voice"):
+                return None
+            from voice_manager import load_model
+            return load_model()
+
+        def mediapipe():
+            if workers is not None and workers.wait_ready("vision"):
+                return None
+            # import + build one Hands graph so the Draw/Gesture panes open fast
+            import mediapipe as mp
+            mp.solutions.hands.Hands(static_image_mode=False, max_num_hands=1).close()
+            return mp
+
+        return {
+            "icons": lambda: render_icon_atlas(icon_paths),
+            "vosk": vosk,
+            "mediapipe": mediapipe,
+        }
+
+    def _wait_for(self, job):
+        """Spin the event loop (splash stays live) until warm-up job `job` is done."""
+        if warmup.is_warming(job):
+            loop = QEventLoop()
+            warmup.when_ready(job, lambda _: loop.quit())
+            loop.exec_()
+        return warmup.get(job)
+
+    def _on_warmup_progress(self, name, done, total):
+        if self._splash.isVisible():
+            what = f" · {name}" if name else ""
+            self._splash.showMessage(
+                f"Empowering Visionaries\nWarming up {done}/{total}{what}",
+                Qt.AlignBottom | Qt.AlignCenter, Qt.white)
+
+    def _on_warmup_done(self):
+        # models are in; now it's worth prefetching around the focused icon
+        self.loader.prefetch(self.launcher.index)
+        failed = warmup.failed_jobs()
+        self.status.append("Warm-up done" + (f" ({', '.join(failed)} unavailable)"
+                                             if failed else ""))
+
+    def _setup_memory_audit(self):
+        import apps
+        rules = [(f"{os.sep}{s.module}.py", f"pane:{s.id}") for s in PANES if s.module]
+        rules += [
+            (f"{os.sep}camera.py", "camera"),
+            (f"{os.sep}floating_card.py", "notifications"),
+            (f"{os.sep}notification_presenter.py", "notifications"),
+            (f"{os.sep}sprite_cache.py", "launcher"),
+            (f"{os.sep}voice_manager.py", "models"),
+            (f"{os.sep}tpu_detector.py", "models"),
+            (f"{os.sep}warmup.py", "models"),
+        ]
+        roots = (os.path.dirname(os.path.abspath(__file__)),
+                 os.path.dirname(os.path.abspath(apps.__file__)))
+        self.audit, interval = audit_from_env(roots, rules)
+        if self.audit is None:
+            return
+        a = self.audit
+
+        def pixmap_bytes(pm):
+            return 0 if pm is None or pm.isNull() else pm.width() * pm.height() * pm.depth() // 8
+
+        def animations(owner):
+            anims = owner.findChildren(QAbstractAnimation)
+            return len(anims) * 200, len(anims)     # QObject overhead, roughly
+
+        a.probe("camera.frame", lambda: pixmap_bytes(self.camera.pixmap()))
+        a.probe("launcher.icons", lambda: (sum(pixmap_bytes(it._pixmap) for it in self.launcher.items),
+                                           len(self.launcher.items)))
+        a.probe("launcher.sprites", lambda: (sum(pixmap_bytes(p) for p in sprites.pixmaps()),
+                                             len(sprites.pixmaps())))
+        a.probe("launcher.animations", lambda: animations(self.launcher))
+        a.probe("notifications.animations", lambda: animations(self.notif))
+        self.loader.paneLoaded.connect(self._audit_pane)
+        for pid, page in self.loader.widgets.items():
+            self._audit_pane(pid, page)
+
+        self._auditTimer = wheel.every(interval, a.sample, owner=self)
+        QShortcut(QKeySequence(Qt.Key_F3), self, self.show_memory_audit)
+
+    def _audit_pane(self, pid, page):
+        if hasattr(page, "memoryProbes"):
+            for name, fn in page.memoryProbes().items():
+                self.audit.probe(f"pane:{pid}.{name}", fn)
+
+    def show_memory_audit(self):
+        """F3: top growers into the console, full table to <prefix>.txt."""
+        self.audit.write_report()
+        for key, now, rate in self.audit.growth()[:3]:
+            self.status.append(f"mem {key}: {now:.1f} MB, {rate:+.2f} MB/h")
+
+    def show_timers(self):
+        """F5: timer wheel wakeups vs callbacks, full table to the console."""
+        print(wheel.report())
+        st = wheel.stats()
+        self.status.append(f"timers: {st['wakeups_s']} wakeups/s for "
+                           f"{st['callbacks_s']} callbacks/s")
+
+    def show_power(self):
+        """F6: per-profile CPU time and wakeups, full table to the console."""
+        print(self.power.report())
+        self.status.append(f"power: {self.power.active}"
+                           + (" (override)" if self.power.override else " (auto)"))
+
+    def show_stalls(self):
+        """F4: worst GUI stalls into the console, full table to <prefix>.txt."""
+        self.watchdog.write_report()
+        for site, n, total, worst, _ in self.watchdog.ranked()[:3]:
+            self.status.append(f"stall {site}: {n}x, {total:.1f} s (max {worst * 1000:.0f} ms)")
+
+    def _log_memory(self, line):
+        print(line)
+        if hasattr(self, "status"):
+            self.status.append(line)
+
+    def _snapshot_ui(self):
+        return {"pane": self.specs[self.pages.currentIndex()].id,
+                "launcher": self.launcher.index}
+
+    def _restore_ui(self, state):
+        idx = state.get("launcher", 0)
+        if 0 <= idx < len(self.launcher.items):
+            self.launcher.index = idx
+            self.launcher.update_icons(animated=False)
+        pane = self.loader.index_of(state.get("pane", ""))
+        if pane > 0:
+            self.launch_app(pane)
 
     def resizeEvent(self, ev):
         super().resizeEvent(ev)
@@ -417,52 +721,116 @@ class VisionAriesUI(QMainWindow):
 
     def launch_app(self, idx):
         """Switch to page idx; hide icons on any pane, show on home."""
-        self.pages.setCurrentIndex(idx)
+        self.loader.show(idx)
         if idx == 0:
             self.launcher.show()
         else:
             self.launcher.hide()
 
+    def _tick(self):
+        if self.watchdog is not None:
+            self.watchdog.beat()
+        if self.fb:
+            t0 = time.perf_counter()
+            self.render(self._fb_frame)
+            self.fb.write(self._fb_frame)
+            self._frame_ms.append((time.perf_counter() - t0) * 1000)
+        else:
+            self.update()       # coalesced by Qt; timed where it's painted
+
+    def event(self, ev):
+        # the window and all its children paint while Qt handles the
+        # window's UpdateRequest, so that's one frame's paint time
+        if ev.type() != QEvent.UpdateRequest:
+            return super().event(ev)
+        t0 = time.perf_counter()
+        handled = super().event(ev)
+        self._frame_ms.append((time.perf_counter() - t0) * 1000)
+        return handled
+
+    def _apply_power(self, p):
+        self.camera.set_mode(p.camera_size, p.camera_fps)
+        self._upd.setInterval(1000 // p.display_fps)
+        self.status.set_refresh(p.weather_s)
+        if self.workers is not None:
+            self.workers.set_cadence(p.detector_fps)
+            self.workers.set_voice_mode(p.voice)
+        # no background removal in this build: p.background is for the ctx
+        # build's features.background_mode (services.py)
+        self.status.append(f"Power: {p.name}")
+
+    def toggle_live_effects(self):
+        avg = sum(self._frame_ms) / len(self._frame_ms) if self._frame_ms else 0.0
+        was = "live" if live_effects() else "sprites"
+        set_live_effects(not live_effects())
+        self.launcher.applyEffectsMode(live_effects())
+        self.notif.applyEffectsMode(live_effects())
+        self._frame_ms.clear()
+        self.status.append(
+            f"Effects: {'live' if live_effects() else 'sprites'} "
+            f"(was {was}, {avg:.1f} ms/frame)")
+
+    def _flash_listening(self):
+        if live_effects():
+            self.camera.setGraphicsEffect(QGraphicsBlurEffect())
+            wheel.after(0.2, lambda: self.camera.setGraphicsEffect(None), owner=self)
+            return
+        self._frost.setGeometry(self.camera.geometry())
+        self._frost.setPixmap(frosted(self.camera.grab()))
+        self._frost.stackUnder(self.launcher)
+        self._frost.show()
+        wheel.after(0.2, self._frost.hide, owner=self)
+
     def update_camera_feed(self, pix):
         if pix and not pix.isNull():
             self.camera.setPixmap(pix)
 
     def eventFilter(self, obj, ev):
         if obj is self.pill and ev.type() == ev.MouseButtonPress:
-            self.camera.setGraphicsEffect(QGraphicsBlurEffect())
-            self.ctx.process_voice_command()
-            QTimer.singleShot(200, lambda: self.camera.setGraphicsEffect(None))
+            if warmup.is_warming("vosk"):
+                self.speech_ol.show_timed("🎙️ Voice is warming up…", 1500)
+                return super().eventFilter(obj, ev)
+            self._flash_listening()
+            if self.workers is not None and self.workers.ready("voice"):
+                self.speech_ol.show_timed("🎙️ Listening…", 1500)
+                self.workers.listen()
+            else:
+                self.ctx.process_voice_command()
         return super().eventFilter(obj, ev)
 
+    def _on_voice_text(self, text):
+        self.speech_ol.show_timed(f"> {text}" if text else "🎙️ Didn't catch that", 3000)
+
     def closeEvent(self, ev):
         self.ctx.stop()
+        warmup.shutdown()
+        self.loader.shutdown()
+        self.loop.shutdown()
+        if self.workers is not None:
+            self.workers.shutdown()
+        snapshots.close()
+        if self.audit is not None:
+            self.audit.close()
+        if self.trace is not None:
+            self.trace.close()
+        if self.watchdog is not None:
+            self.watchdog.close()
+        if self.fb:
+            self.fb.close()
         super().closeEvent(ev)
 
 
 if __name__ == "__main__":
+    if os.getenv("ARIES_FB"):
+        # frames go straight to the framebuffer; skip the window system
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
     app = QApplication(sys.argv)
 
-    icons = [
-        ("VisionAriesAssets/camera.png",   "Camera"),
-        ("VisionAriesAssets/gps.png",      "Maps"),
-        ("VisionAriesAssets/gpt.png",      "Assistant"),
-        ("VisionAriesAssets/settings.png", "Settings"),
-        ("VisionAriesAssets/bluetooth.png","Tether"),
-        ("VisionAriesAssets/photo.png",    "Photos"),
-        ("VisionAriesAssets/video.png",    "Video"),
-        ("VisionAriesAssets/translate.png","Translate"),
-        ("VisionAriesAssets/nav.png",      "Nav"),
-        ("VisionAriesAssets/music.png",    "Music"),
-        ("VisionAriesAssets/call.png",     "Call"),
-        ("VisionAriesAssets/draw.png",     "Draw"),
-        ("VisionAriesAssets/person.png",   "Track"),
-        ("VisionAriesAssets/gesture.png",  "Gesture"),
-        ("VisionAriesAssets/llm.png",      "LLM"),
-        ("VisionAriesAssets/theme.png",    "Theme"),
-        ("VisionAriesAssets/sharear.png",  "ShareAR"),
-        ("VisionAriesAssets/spatialaudio.png","SpatialAudio"),
-        ("VisionAriesAssets/livestream.png","LiveStream"),
-    ]
-
-    win = VisionAriesUI(icons)
-    sys.exit(app.exec_())
\ No newline at end of file
+    win = VisionAriesUI()
+
+    def _boot_done():
+        over = profiler.finish()
+        if os.getenv("ARIES_BOOT_PROFILE_EXIT") == "1":
+            app.exit(1 if over else 0)
+    QTimer.singleShot(0, _boot_done)   # runs once the first frame is up
+    sys.exit(app.exec_())
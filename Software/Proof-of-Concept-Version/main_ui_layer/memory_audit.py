@@ -0,0 +1,190 @@
+# memory_audit.py
+"""
+Per-subsystem memory accounting for long shifts.
+
+    ARIES_MEM_AUDIT=memaudit python main.py          # sample every 60 s
+    ARIES_MEM_AUDIT_S=600 ARIES_MEM_AUDIT=... ...    # or every 10 min
+
+Every sample records, per subsystem:
+
+  * Python/numpy heap from a tracemalloc snapshot, each trace charged to the
+    innermost frame that lives in our own code (camera.py -> "camera",
+    ui_layer_apps/drawing_pane.py -> "pane:draw", ...), so allocations made
+    inside numpy/cv2/Qt wrappers land on the subsystem that asked for them;
+  * explicit probes for things tracemalloc can't see or can't split out:
+    DrawingPane.path, GestureCanvasPane.canvas, launcher/sprite QPixmaps,
+    the camera frame, live FloatingCard animations (see probe());
+  * process RSS, and "native" = RSS - traced heap (models, Qt, drivers).
+
+Samples go to <prefix>.jsonl as they're taken; report() / <prefix>.txt
+rank subsystems by growth rate (least-squares slope, MB/hour) so a leak
+shows up as the one line that keeps climbing hours into a shift.
+"""
+import json
+import os
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import psutil
+
+MB = 1024 * 1024
+HERE = os.path.dirname(os.path.abspath(__file__))
+TRACE_FRAMES = 12
+
+
+def _slope_per_hour(points):
+    """Least-squares slope of [(t, bytes)] in MB/hour."""
+    n = len(points)
+    if n < 2:
+        return 0.0
+    mt = sum(t for t, _ in points) / n
+    mb = sum(b for _, b in points) / n
+    var = sum((t - mt) ** 2 for t, _ in points)
+    if var == 0:
+        return 0.0
+    cov = sum((t - mt) * (b - mb) for t, b in points)
+    return cov / var * 3600 / MB
+
+
+class MemoryAudit:
+    def __init__(self, output=None, roots=(), rules=None, history=720):
+        """
+        roots:  directories whose files count as "our code"
+        rules:  [(path fragment, subsystem)], first match wins; files under a
+                root with no rule are charged to their module name
+        """
+        self.output = output
+        self.roots = tuple(os.path.abspath(r) for r in roots) or (os.path.dirname(HERE),)
+        self.rules = list(rules or [])
+        self.history = history
+        self.t0 = time.time()
+        self.series = {}            # subsystem -> [(t, bytes)]
+        self.counts = {}            # probe name -> last count (objects, points...)
+        self._probes = {}           # name -> fn() -> bytes or (bytes, count)
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(1, thread_name_prefix="memaudit")
+        self._owner_cache = {}
+        self._proc = psutil.Process()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+
+    # ----- attribution ----------------------------------------------------
+
+    def add_rule(self, fragment, subsystem):
+        self.rules.append((fragment, subsystem))
+        self._owner_cache.clear()
+
+    def probe(self, name, fn):
+        """fn() -> bytes, or (bytes, count); a probe that raises is dropped."""
+        self._probes[name] = fn
+
+    def unprobe(self, prefix):
+        for name in [n for n in self._probes if n.startswith(prefix)]:
+            del self._probes[name]
+
+    def _owner(self, filename):
+        owner = self._owner_cache.get(filename)
+        if owner is None:
+            owner = ""
+            path = os.path.abspath(filename)
+            if not filename.startswith("<") and path.startswith(self.roots):
+                owner = next((sub for frag, sub in self.rules if frag in path),
+                             os.path.splitext(os.path.basename(path))[0])
+            self._owner_cache[filename] = owner
+        return owner
+
+    def _attribute(self, snapshot):
+        sizes = {}
+        for stat in snapshot.statistics("traceback"):
+            owner = ""
+            for frame in reversed(stat.traceback):     # innermost first
+                owner = self._owner(frame.filename)
+                if owner:
+                    break
+            owner = owner or "other"
+            sizes[owner] = sizes.get(owner, 0) + stat.size
+        return sizes
+
+    # ----- sampling -------------------------------------------------------
+
+    def sample(self):
+        """
+        Run probes and read RSS now (call from the GUI thread: probes touch
+        widgets); the tracemalloc snapshot is grouped on a worker thread.
+        """
+        t = time.time() - self.t0
+        values = {"rss": self._proc.memory_info().rss}
+        for name, fn in list(self._probes.items()):
+            try:
+                v = fn()
+            except Exception as e:
+                print(f"[memaudit] dropping probe {name}: {e}")
+                del self._probes[name]
+                continue
+            if isinstance(v, tuple):
+                v, self.counts[name] = v
+            values[f"probe:{name}"] = int(v)
+        traced = tracemalloc.get_traced_memory()[0]
+        values["native"] = max(0, values["rss"] - traced)
+        snap = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)])
+        self._pool.submit(self._finish, t, values, snap)
+
+    def _finish(self, t, values, snap):
+        for owner, size in self._attribute(snap).items():
+            values[f"heap:{owner}"] = size
+        with self._lock:
+            for key, v in values.items():
+                pts = self.series.setdefault(key, [])
+                pts.append((t, v))
+                if len(pts) > self.history:
+                    del pts[0]
+        if self.output:
+            with open(f"{self.output}.jsonl", "a", encoding="utf-8") as f:
+                f.write(json.dumps({"t": round(t, 1), "mb": {
+                    k: round(v / MB, 3) for k, v in values.items()}}) + "\n")
+
+    # ----- reporting ------------------------------------------------------
+
+    def growth(self, window_s=None):
+        """[(subsystem, MB now, MB/hour)] fastest-growing first."""
+        with self._lock:
+            series = {k: list(v) for k, v in self.series.items()}
+        out = []
+        for key, pts in series.items():
+            if window_s is not None and pts:
+                pts = [p for p in pts if p[0] >= pts[-1][0] - window_s]
+            if pts:
+                out.append((key, pts[-1][1] / MB, _slope_per_hour(pts)))
+        out.sort(key=lambda r: r[2], reverse=True)
+        return out
+
+    def report(self, window_s=None):
+        hours = (time.time() - self.t0) / 3600
+        lines = [f"memory audit: {hours:.2f} h, {len(self.series.get('rss', []))} samples",
+                 f"{'MB/hour':>9} {'MB now':>9}  subsystem"]
+        for key, now, rate in self.growth(window_s):
+            n = self.counts.get(key[len("probe:"):]) if key.startswith("probe:") else None
+            extra = f"  ({n} items)" if n is not None else ""
+            lines.append(f"{rate:9.3f} {now:9.2f}  {key}{extra}")
+        return "\n".join(lines)
+
+    def write_report(self):
+        if self.output:
+            with open(f"{self.output}.txt", "w", encoding="utf-8") as f:
+                f.write(self.report() + "\n")
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+        self.write_report()
+
+
+def audit_from_env(roots=(), rules=None):
+    """(MemoryAudit, interval_s) when ARIES_MEM_AUDIT is set, else (None, 0)."""
+    out = os.getenv("ARIES_MEM_AUDIT")
+    if not out:
+        return None, 0
+    interval = float(os.getenv("ARIES_MEM_AUDIT_S", "60"))
+    return MemoryAudit(output=out, roots=roots, rules=rules), interval
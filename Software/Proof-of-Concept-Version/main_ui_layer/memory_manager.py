@@ -0,0 +1,144 @@
+# memory_manager.py
+"""
+Memory-pressure manager: hibernate idle panes before the Zero 2W hits swap.
+
+check() (cheap; call it from a timer or the frame loop) compares process RSS
+and system available memory against watermarks:
+
+    level      RSS >= rss_high_mb   or available <= avail_low_mb
+    critical   RSS >= rss_critical_mb or available <= avail_critical_mb
+
+On "high" one hidden pane is reclaimed per check, least recently used first;
+on "critical" it keeps going until memory is back under the high watermark.
+Panes are offered by hosts (PaneHost, PaneLoader) registered with
+add_source(fn), where fn() returns [(name, release_fn), ...] oldest first;
+release_fn drops MediaPipe graphs, canvases, interpreters, decoded assets...
+(Pane.hibernate / BasePane.hibernate) and the host wakes the pane on its next
+show. Every reclaim is logged with the RSS it gave back.
+"""
+import ctypes
+import ctypes.util
+import gc
+import time
+from collections import deque
+
+import psutil
+
+MB = 1024 * 1024
+
+DEFAULTS = {
+    "rss_high_mb": 300,
+    "rss_critical_mb": 380,
+    "avail_low_mb": 80,
+    "avail_critical_mb": 40,
+    "interval_s": 2.0,
+}
+
+OK, HIGH, CRITICAL = "ok", "high", "critical"
+
+
+def _malloc_trim():
+    """Hand freed heap back to the OS (glibc); otherwise RSS barely moves."""
+    try:
+        ctypes.CDLL(ctypes.util.find_library("c") or None).malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+
+class MemoryManager:
+    def __init__(self, rss_high_mb=DEFAULTS["rss_high_mb"],
+                 rss_critical_mb=DEFAULTS["rss_critical_mb"],
+                 avail_low_mb=DEFAULTS["avail_low_mb"],
+                 avail_critical_mb=DEFAULTS["avail_critical_mb"],
+                 interval_s=DEFAULTS["interval_s"], log=print):
+        self.set_watermarks(rss_high_mb, rss_critical_mb,
+                            avail_low_mb, avail_critical_mb, interval_s)
+        self.log = log
+        self.level = OK
+        self.events = deque(maxlen=100)     # (time, name, bytes freed, level)
+        self._sources = []
+        self._proc = psutil.Process()
+        self._next = 0.0
+
+    def set_watermarks(self, rss_high_mb, rss_critical_mb,
+                       avail_low_mb, avail_critical_mb, interval_s):
+        self.rss_high = rss_high_mb * MB
+        self.rss_critical = rss_critical_mb * MB
+        self.avail_low = avail_low_mb * MB
+        self.avail_critical = avail_critical_mb * MB
+        self.interval_s = interval_s
+
+    @staticmethod
+    def _opts(cfg):
+        return {k: type(v)(cfg.get(k, v)) for k, v in DEFAULTS.items()}
+
+    @classmethod
+    def from_config(cls, cfg, **kw):
+        """cfg: mapping with any of DEFAULTS' keys (config.yaml `memory:`)."""
+        return cls(**cls._opts(cfg), **kw)
+
+    def configure(self, cfg):
+        """Apply new watermarks (config hot-reload)."""
+        self.set_watermarks(**self._opts(cfg))
+
+    def add_source(self, fn):
+        self._sources.append(fn)
+
+    # ----- sampling -------------------------------------------------------
+
+    def rss(self):
+        return self._proc.memory_info().rss
+
+    def sample(self):
+        rss = self.rss()
+        avail = psutil.virtual_memory().available
+        if rss >= self.rss_critical or avail <= self.avail_critical:
+            level = CRITICAL
+        elif rss >= self.rss_high or avail <= self.avail_low:
+            level = HIGH
+        else:
+            level = OK
+        return level, rss, avail
+
+    def check(self, now=None):
+        """Rate-limited to `interval_s`; returns the current level."""
+        now = time.monotonic() if now is None else now
+        if now < self._next:
+            return self.level
+        self._next = now + self.interval_s
+        level, rss, avail = self.sample()
+        if level != self.level:
+            self.log(f"[memory] {self.level} -> {level} "
+                     f"(RSS {rss / MB:.0f} MB, available {avail / MB:.0f} MB)")
+            self.level = level
+        if level != OK:
+            self.reclaim(level)
+        return level
+
+    # ----- reclaiming -----------------------------------------------------
+
+    def candidates(self):
+        out = []
+        for fn in self._sources:
+            out.extend(fn())
+        return out
+
+    def reclaim(self, level=HIGH):
+        """Release hidden panes LRU-first; returns total bytes freed."""
+        total = 0
+        for name, release in self.candidates():
+            before = self.rss()
+            try:
+                release()
+            except Exception as e:
+                self.log(f"[memory] ⚠️  releasing {name} failed: {e}")
+                continue
+            gc.collect()
+            _malloc_trim()
+            freed = max(0, before - self.rss())
+            total += freed
+            self.events.append((time.time(), name, freed, level))
+            self.log(f"[memory] {level}: hibernated {name}, freed {freed / MB:.1f} MB")
+            if level != CRITICAL or self.sample()[0] == OK:
+                break
+        return total
@@ -1,10 +1,15 @@
 # notification_center.py
-import time
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSignal
 
-class NotificationCenter(QThread):
+from timer_wheel import wheel
+
+class NotificationCenter(QObject):
     notificationReceived = pyqtSignal(str)
 
+    # a wheel timer rather than a thread sleeping 15 s at a time: no extra
+    # thread, and the poll shares a wakeup with whatever else is due
+    INTERVAL_S = 15
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.notifications = [
@@ -14,10 +19,15 @@ class NotificationCenter(QThread):
             "📍 Arrival at GPS: 2 min"
         ]
         self.idx = 0
+        self._timer = wheel.timer(self._next, slack_ms=2000, owner=self)
+
+    def start(self):
+        self._timer.start(self.INTERVAL_S * 1000)
+
+    def stop(self):
+        self._timer.stop()
 
-    def run(self):
-        while True:
-            time.sleep(15)
-            msg = self.notifications[self.idx % len(self.notifications)]
-            self.idx += 1
-            self.notificationReceived.emit(msg)
+    def _next(self):
+        msg = self.notifications[self.idx % len(self.notifications)]
+        self.idx += 1
+        self.notificationReceived.emit(msg)
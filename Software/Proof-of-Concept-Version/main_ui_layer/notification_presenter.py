@@ -0,0 +1,156 @@
+# notification_presenter.py
+import heapq
+import itertools
+import time
+
+from PyQt5.QtCore import QObject
+
+from timer_wheel import wheel
+
+# Lower number = more important
+ALERT, NORMAL, LOW = 0, 1, 2
+
+
+class _Entry:
+    __slots__ = ("priority", "seq", "text", "duration", "source", "count")
+
+    def __init__(self, priority, seq, text, duration, source):
+        self.priority = priority
+        self.seq = seq
+        self.text = text
+        self.duration = duration
+        self.source = source
+        self.count = 1
+
+    def __lt__(self, other):
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+    def label(self):
+        return f"{self.text}  ×{self.count}" if self.count > 1 else self.text
+
+
+class NotificationPresenter(QObject):
+    """
+    Single funnel for everything that wants the FloatingCard
+    (NotificationCenter, ContextualAssistant.suggestionReady, FeedbackOverlay).
+
+    - priority queue: ALERT > NORMAL > LOW; an ALERT preempts whatever is up
+    - duplicates (same source + text) are coalesced into one card with a count
+    - at most one new card every `min_interval_ms`
+    - when a backlog builds up, NORMAL/LOW entries are folded into a summary
+      card, so a burst of 50 notifications costs a couple of cards, not 50
+    """
+    def __init__(self, card, min_interval_ms=1200, summarize_after=3,
+                 max_queue=32, parent=None):
+        super().__init__(parent)
+        self.card = card
+        self.min_interval = min_interval_ms / 1000.0
+        self.summarize_after = summarize_after
+        self.max_queue = max_queue
+
+        self._heap = []
+        self._pending = {}          # (source, text) -> queued _Entry
+        self._seq = itertools.count()
+        self._current = None
+        self._next_allowed = 0.0
+        self.dropped = 0
+
+        self._pump_timer = wheel.timer(self._pump, single_shot=True, slack_ms=20, owner=self)
+        # in-place count bumps are batched into one relayout
+        self._bump_timer = wheel.timer(self._refreshCurrent, single_shot=True, slack_ms=30,
+                                       owner=self)
+        self.card.dismissed.connect(self._onDismissed)
+
+    def post(self, text, duration=3000, priority=NORMAL, source=None):
+        key = (source, text)
+
+        # Same thing already on screen: bump the count in place
+        cur = self._current
+        if cur is not None and (cur.source, cur.text) == key and self.card.isBusy():
+            cur.count += 1
+            if not self._bump_timer.isActive():
+                self._bump_timer.start(150)
+            return
+
+        # Same thing already waiting: coalesce
+        queued = self._pending.get(key)
+        if queued is not None:
+            queued.count += 1
+            if priority < queued.priority:
+                queued.priority = priority
+                heapq.heapify(self._heap)
+            return
+
+        e = _Entry(priority, next(self._seq), text, duration, source)
+        heapq.heappush(self._heap, e)
+        self._pending[key] = e
+        if len(self._heap) > self.max_queue:
+            self._dropLeastImportant()
+
+        if priority == ALERT and (cur is None or cur.priority != ALERT):
+            self._pump(force=True)
+        else:
+            self._pump()
+
+    def pending(self):
+        return len(self._heap)
+
+    def _dropLeastImportant(self):
+        worst = max(self._heap)
+        if worst.priority == ALERT:
+            return
+        self._heap.remove(worst)
+        heapq.heapify(self._heap)
+        self._pending.pop((worst.source, worst.text), None)
+        self.dropped += worst.count
+
+    def _pump(self, force=False):
+        if not self._heap:
+            return
+        if not force:
+            if self.card.isBusy():
+                return  # _onDismissed will call us back
+            wait = self._next_allowed - time.monotonic()
+            if wait > 0:
+                self._pump_timer.start(int(wait * 1000) + 1)
+                return
+
+        e = heapq.heappop(self._heap)
+        self._pending.pop((e.source, e.text), None)
+        if e.priority != ALERT and len(self._heap) + 1 >= self.summarize_after:
+            e = self._summarize(e)
+
+        self._current = e
+        self._next_allowed = time.monotonic() + self.min_interval
+        self.card.showMessage(e.label(), e.duration)
+
+    def _summarize(self, first):
+        """Fold every queued non-alert entry into one summary card."""
+        folded = [first]
+        keep = []
+        for e in self._heap:
+            (keep if e.priority == ALERT else folded).append(e)
+            if e.priority != ALERT:
+                self._pending.pop((e.source, e.text), None)
+        self._heap = keep
+        heapq.heapify(self._heap)
+
+        total = sum(e.count for e in folded) + self.dropped
+        self.dropped = 0
+        folded.sort(key=lambda e: (-e.count, e.seq))
+        lines = [e.label() for e in folded[:2]]
+        more = total - sum(e.count for e in folded[:2])
+        if more > 0:
+            lines.append(f"+{more} more")
+        summary = _Entry(first.priority, first.seq,
+                         f"{total} notifications\n" + "\n".join(lines),
+                         max(e.duration for e in folded), "summary")
+        return summary
+
+    def _refreshCurrent(self):
+        if self._current is not None and self.card.isBusy():
+            self.card.showMessage(self._current.label(), self._current.duration)
+
+    def _onDismissed(self):
+        self._current = None
+        self._pump()
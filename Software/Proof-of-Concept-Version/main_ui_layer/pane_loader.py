@@ -0,0 +1,304 @@
+# pane_loader.py
+import inspect
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import psutil
+
+from PyQt5.QtWidgets import QLabel
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal
+from PyQt5.QtGui import QFont
+
+from boot_profiler import profiler
+from warmup import warmup
+from snapshot import snapshots
+
+# Neighbour prefetch (see PaneLoader.prefetch)
+PREFETCH_RADIUS = 1
+PREFETCH_BUDGET_MB = int(os.getenv("ARIES_PREFETCH_MB", "96"))
+PREFETCH_DEBOUNCE_MS = 250
+# below this much free RAM, drop every prefetched pane nobody has opened
+PRESSURE_FREE_MB = 150
+MB = 1024 * 1024
+
+
+class PanePlaceholder(QLabel):
+    """Cheap stand-in shown while a pane is imported/constructed."""
+    def __init__(self, spec, parent=None):
+        super().__init__(parent)
+        self.spec = spec
+        self.setAlignment(Qt.AlignCenter)
+        self.setStyleSheet("background:#121212;color:#BBBBBB;")
+        self.setFont(QFont("Arial", 16))
+        self.setText(f"Loading {spec.label}…" if spec.module else "")
+        if spec.module is None:
+            # home page: let the camera show through
+            self.setAttribute(Qt.WA_TransparentForMouseEvents)
+            self.setStyleSheet("background:transparent;")
+
+
+class PaneLoader(QObject):
+    """
+    Owns the page stack. Every registry entry starts as a PanePlaceholder;
+    the real pane is imported and constructed the first time it's shown.
+
+    gates: {spec id: warm-up job}. Showing a gated pane while its job is
+    still running leaves the placeholder up in a "warming" state and builds
+    the pane once the job finishes.
+
+    prefetch(idx) is fed the launcher's focused index: once scrolling
+    settles, the panes next to it are imported on a worker thread and then
+    constructed on the GUI thread, so launching them is just a page flip.
+    Prefetched panes that haven't been opened yet are evicted (back to a
+    placeholder), oldest first, to stay within PREFETCH_BUDGET_MB of RSS or
+    when the system runs low on memory.
+
+    memory_candidates() feeds memory_manager.MemoryManager: first prefetched
+    panes nobody opened (unloaded outright), then hidden panes with
+    onHibernate() in least-recently-shown order. A hibernated pane gets
+    onWake() before it's shown again.
+
+    A pane's requests on the shared asyncio loop (deps["loop"], owner=pane)
+    are cancelled when it's switched away from, hibernated or unloaded.
+
+    Panes with snapshotState() / restoreState(state) are registered with
+    snapshot.snapshots as "pane:<id>", so their state survives a reboot (and
+    an eviction) and comes back when they're next constructed.
+    """
+    paneLoaded = pyqtSignal(str, object)    # spec id, widget
+    _imported = pyqtSignal(int)             # from the import thread
+
+    def __init__(self, pages, specs, deps, on_home, gates=None):
+        super().__init__(pages)
+        self.pages = pages
+        self.specs = list(specs)
+        self.deps = deps            # constructor arg name -> object
+        self.on_home = on_home
+        self.gates = gates or {}
+        self.widgets = {}           # spec id -> constructed pane
+        self.failed = set()
+        for spec in self.specs:
+            self.pages.addWidget(PanePlaceholder(spec))
+
+        self.lastShown = OrderedDict()  # spec id -> None, least recent first
+        self.hibernated = set()
+        self.cost = {}                  # spec id -> RSS growth on construct
+        self.prefetched = OrderedDict() # spec id -> None, built but never shown
+        self._center = 0
+        self._importer = ThreadPoolExecutor(1, thread_name_prefix="prefetch")
+        self._importing = set()
+        self._imported.connect(self._onImported)
+        self._prefetchTimer = QTimer(self)
+        self._prefetchTimer.setSingleShot(True)
+        self._prefetchTimer.setInterval(PREFETCH_DEBOUNCE_MS)
+        self._prefetchTimer.timeout.connect(self._runPrefetch)
+
+    def index_of(self, pane_id):
+        for i, spec in enumerate(self.specs):
+            if spec.id == pane_id:
+                return i
+        return -1
+
+    def show(self, idx):
+        prev = self.pages.currentIndex()
+        if prev != idx and prev >= 0:
+            self._cancelWork(self.widgets.get(self.specs[prev].id))
+        self.pages.setCurrentIndex(idx)
+        spec = self.specs[idx]
+        self.prefetched.pop(spec.id, None)      # opened: no longer evictable
+        self.lastShown.pop(spec.id, None)
+        self.lastShown[spec.id] = None
+        if spec.id in self.hibernated:
+            self.hibernated.discard(spec.id)
+            self.widgets[spec.id].onWake()
+        if spec.module is None or spec.id in self.widgets or spec.id in self.failed:
+            return
+        job = self.gates.get(spec.id)
+        if job and warmup.is_warming(job):
+            self.pages.widget(idx).setText(f"{spec.label}\nwarming up…")
+            warmup.when_ready(job, lambda _: self._gateOpened(idx))
+            return
+        # let the placeholder paint first, then do the heavy lifting
+        QTimer.singleShot(0, lambda: self.ensure(idx))
+
+    def _gateOpened(self, idx):
+        # only build it if the user is still looking at it
+        if self.pages.currentIndex() == idx:
+            self.ensure(idx)
+
+    def ensure(self, idx):
+        """Import + construct pane `idx` if needed; returns the widget or None."""
+        spec = self.specs[idx]
+        if spec.id in self.widgets:
+            return self.widgets[spec.id]
+        if spec.module is None or spec.id in self.failed:
+            return None
+
+        placeholder = self.pages.widget(idx)
+        rss0 = _rss()
+        try:
+            with profiler.phase(f"pane:{spec.id} import", "pane"):
+                cls = spec.load()
+            with profiler.phase(f"pane:{spec.id} construct", "pane"):
+                page = self._construct(cls)
+        except Exception as e:
+            print(f"⚠️ failed to load {spec.cls}: {e}")
+            self.failed.add(spec.id)
+            placeholder.setText(f"{spec.label} unavailable\n{e}")
+            return None
+
+        # wire up Home button
+        if hasattr(page, "goHomeRequested"):
+            page.goHomeRequested.connect(lambda _=None: self.on_home())
+
+        was_current = self.pages.currentIndex() == idx
+        self.pages.insertWidget(idx, page)
+        self.pages.removeWidget(placeholder)
+        placeholder.deleteLater()
+        if was_current:
+            self.pages.setCurrentIndex(idx)
+
+        self.widgets[spec.id] = page
+        self.cost[spec.id] = max(0, _rss() - rss0)
+        if hasattr(page, "snapshotState"):
+            snapshots.register(f"pane:{spec.id}", page.snapshotState,
+                               getattr(page, "restoreState", None))
+        self.paneLoaded.emit(spec.id, page)
+        return page
+
+    # ----- neighbour prefetch ---------------------------------------------
+
+    def prefetch(self, center):
+        """Launcher focus moved to `center`; prefetch around it once it settles."""
+        self._center = center
+        self._prefetchTimer.start()
+
+    def _neighbours(self, center):
+        n = len(self.specs)
+        for d in range(1, PREFETCH_RADIUS + 1):
+            for idx in ((center + d) % n, (center - d) % n):
+                yield idx
+        yield center
+
+    def _wanted(self, idx):
+        spec = self.specs[idx]
+        if spec.module is None or spec.id in self.widgets or spec.id in self.failed:
+            return False
+        job = self.gates.get(spec.id)
+        return not (job and warmup.is_warming(job))
+
+    def _runPrefetch(self):
+        if self._underPressure():
+            self._evict(everything=True)
+            return
+        # focused icon first, then its neighbours
+        order = [self._center] + [i for i in self._neighbours(self._center)
+                                  if i != self._center]
+        for idx in order:
+            if not self._wanted(idx) or idx in self._importing:
+                continue
+            self._importing.add(idx)
+            self._importer.submit(self._importInBackground, idx)
+
+    def _importInBackground(self, idx):
+        try:
+            self.specs[idx].load()      # just the import; widgets need the GUI thread
+        except Exception:
+            pass                        # ensure() reports it if the pane is opened
+        self._imported.emit(idx)
+
+    def _onImported(self, idx):
+        self._importing.discard(idx)
+        near = set(self._neighbours(self._center))
+        if idx not in near or not self._wanted(idx):
+            return
+        spec = self.specs[idx]
+        self._evict(need=self.cost.get(spec.id, 0))
+        if self._underPressure():
+            return
+        if self.ensure(idx) is not None and self.pages.currentIndex() != idx:
+            self.prefetched[spec.id] = None
+            self._evict()
+
+    def _prefetchedBytes(self):
+        return sum(self.cost.get(pid, 0) for pid in self.prefetched)
+
+    def _underPressure(self):
+        return psutil.virtual_memory().available < PRESSURE_FREE_MB * MB
+
+    def _evict(self, need=0, everything=False):
+        """Drop least recently prefetched, never-opened panes to fit `need` bytes."""
+        budget = PREFETCH_BUDGET_MB * MB
+        while self.prefetched and (everything or self._prefetchedBytes() + need > budget):
+            pid, _ = self.prefetched.popitem(last=False)
+            self.unload(self.index_of(pid))
+
+    # ----- memory pressure ------------------------------------------------
+
+    def memory_candidates(self):
+        """[(name, release)] cheapest first, for MemoryManager.add_source()."""
+        out = [(f"prefetched:{pid}", lambda i=self.index_of(pid): self.unload(i))
+               for pid in self.prefetched]
+        current = self.specs[self.pages.currentIndex()].id
+        for pid in self.lastShown:
+            page = self.widgets.get(pid)
+            if (page is None or pid == current or pid in self.hibernated
+                    or not hasattr(page, "onHibernate")):
+                continue
+            out.append((f"pane:{pid}", lambda pid=pid: self._hibernate(pid)))
+        return out
+
+    def _hibernate(self, pid):
+        self._cancelWork(self.widgets[pid])
+        self.widgets[pid].onHibernate()
+        self.hibernated.add(pid)
+
+    def _cancelWork(self, page):
+        """Drop what `page` still has in flight on the asyncio loop."""
+        loop = self.deps.get("loop")
+        if loop is not None and page is not None:
+            loop.cancel(page)
+
+    def shutdown(self):
+        self._prefetchTimer.stop()
+        self._importer.shutdown(wait=False, cancel_futures=True)
+
+    def unload(self, idx):
+        """Destroy pane `idx` and put a placeholder back; it rebuilds on next show."""
+        spec = self.specs[idx]
+        page = self.widgets.pop(spec.id, None)
+        if page is None:
+            return
+        self._cancelWork(page)          # before deleteLater: on_cancel still has a widget
+        self.prefetched.pop(spec.id, None)
+        self.hibernated.discard(spec.id)
+        snapshots.unregister(f"pane:{spec.id}")
+        placeholder = PanePlaceholder(spec)
+        self.pages.insertWidget(idx, placeholder)
+        self.pages.removeWidget(page)
+        page.deleteLater()
+        print(f"[prefetch] evicted {spec.id} (~{self.cost.get(spec.id, 0) / MB:.1f} MB)")
+
+    def _construct(self, cls):
+        params = set(inspect.signature(cls.__init__).parameters) - {"self"}
+        args, kwargs = [], {}
+        if "camera_feed" in params:
+            args.append(self.deps["camera_feed"])
+        if "ctx_assistant" in params:
+            args.append(self.deps["ctx_assistant"])
+        if "parent" in params:
+            kwargs["parent"] = self.deps["parent"]
+        if "vision" in params:
+            kwargs["vision"] = self.deps.get("vision")
+        if "loop" in params:
+            kwargs["loop"] = self.deps.get("loop")
+        if "timers" in params:
+            kwargs["timers"] = self.deps.get("timers")
+        if "power" in params:
+            kwargs["power"] = self.deps.get("power")
+        return cls(*args, **kwargs)
+
+
+def _rss():
+    return psutil.Process().memory_info().rss
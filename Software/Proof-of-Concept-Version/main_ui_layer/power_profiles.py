@@ -0,0 +1,255 @@
+# power_profiles.py
+"""
+Battery-aware power profiles: one bundle of knobs for the whole pipeline,
+switched together so the camera, detector, display and voice never disagree
+about how much power they may spend.
+
+                  camera         detector  display  background  weather  voice
+    performance   960x540 @30    15 fps    60 fps   blur        30 s     hotword
+    balanced      960x540 @20     8 fps    30 fps   black      120 s     push
+    saver         640x360 @10     2 fps    15 fps   off        900 s     push
+
+check() (cheap; call it from a timer or the frame loop, rate-limited to
+interval_s) reads psutil.sensors_battery() and picks the profile:
+
+    plugged in / charging, or no battery       performance
+    on battery                                 balanced
+    on battery at <= saver_pct                 saver, until back over
+                                               saver_pct + hysteresis_pct
+
+A user override (set_override("saver"), config `power.profile`, or
+ARIES_POWER=saver) pins a profile regardless of the battery; None / "auto"
+hands control back. Whoever owns a knob registers bind(fn): fn(profile) runs
+once straight away and again on every switch.
+
+While a profile is active its power proxies are charged to it: CPU seconds
+of this process and its workers, timer-wheel wakeups and voluntary context
+switches. rows() / report() give them per minute / per second, so the
+settings pane can show what each profile actually costs on this device.
+This module must stay free of Qt.
+"""
+import os
+import time
+
+import psutil
+
+PERFORMANCE, BALANCED, SAVER = "performance", "balanced", "saver"
+AUTO = "auto"
+
+
+class Profile:
+    def __init__(self, name, camera_size, camera_fps, detector_fps, display_fps,
+                 background, weather_s, voice):
+        self.name = name
+        self.camera_size = camera_size      # (w, h)
+        self.camera_fps = camera_fps
+        self.detector_fps = detector_fps    # vision worker cadence
+        self.display_fps = display_fps
+        self.background = background        # background removal: "blur" | "black" | "off"
+        self.weather_s = weather_s          # weather refresh interval
+        self.voice = voice                  # "hotword" (mic always open) | "push" (pill only)
+
+    def as_dict(self):
+        return dict(vars(self))
+
+    def __repr__(self):
+        return f"Profile({self.name})"
+
+
+PROFILES = {
+    PERFORMANCE: Profile(PERFORMANCE, (960, 540), 30, 15, 60, "blur", 30, "hotword"),
+    BALANCED: Profile(BALANCED, (960, 540), 20, 8, 30, "black", 120, "push"),
+    SAVER: Profile(SAVER, (640, 360), 10, 2, 15, "off", 900, "push"),
+}
+
+DEFAULTS = {
+    "profile": AUTO,            # or a PROFILES key: user override
+    "saver_pct": 20,
+    "hysteresis_pct": 5,
+    "interval_s": 10.0,
+}
+
+
+class PowerManager:
+    def __init__(self, profile=DEFAULTS["profile"], saver_pct=DEFAULTS["saver_pct"],
+                 hysteresis_pct=DEFAULTS["hysteresis_pct"],
+                 interval_s=DEFAULTS["interval_s"], wheel=None, log=print):
+        """wheel: the timer_wheel.TimerWheel whose wakeups count as a proxy"""
+        self.saver_pct = saver_pct
+        self.hysteresis_pct = hysteresis_pct
+        self.interval_s = interval_s
+        self.wheel = wheel
+        self.log = log
+        self.override = None
+        self.battery = None             # (percent, plugged) at the last check
+        self.active = None
+        self.usage = {name: {"wall_s": 0.0, "cpu_s": 0.0, "wakeups": 0, "switches": 0}
+                      for name in PROFILES}
+        self._sinks = []
+        self._proc = psutil.Process()
+        self._next = 0.0
+        self._mark = self._counters()
+        self.set_override(profile)
+
+    @staticmethod
+    def _opts(cfg):
+        return {k: type(v)(cfg.get(k, v)) for k, v in DEFAULTS.items()}
+
+    @classmethod
+    def from_config(cls, cfg, **kw):
+        """cfg: mapping with any of DEFAULTS' keys (config.yaml `power:`)."""
+        return cls(**cls._opts(cfg), **kw)
+
+    def configure(self, cfg):
+        """Apply new thresholds / override (config hot-reload)."""
+        opts = self._opts(cfg)
+        self.saver_pct = opts["saver_pct"]
+        self.hysteresis_pct = opts["hysteresis_pct"]
+        self.interval_s = opts["interval_s"]
+        self.set_override(opts["profile"])
+
+    @property
+    def profile(self):
+        return PROFILES[self.active]
+
+    def bind(self, fn):
+        """fn(profile) now and on every switch; returns fn."""
+        self._sinks.append(fn)
+        self._call(fn)
+        return fn
+
+    # ----- choosing -------------------------------------------------------
+
+    def set_override(self, name):
+        """Pin a profile, or None / "auto" to follow the battery again."""
+        name = None if name in (None, "", AUTO) else name
+        if name is not None and name not in PROFILES:
+            raise ValueError(f"unknown power profile {name!r}")
+        self.override = name
+        self.check(force=True)
+
+    def check(self, now=None, force=False):
+        """Rate-limited to `interval_s`; returns the active profile name."""
+        now = time.monotonic() if now is None else now
+        if not force and now < self._next:
+            return self.active
+        self._next = now + self.interval_s
+        self._account()
+        self.battery = self._read_battery()
+        self._switch(self.override or self._auto())
+        return self.active
+
+    def _read_battery(self):
+        try:
+            batt = psutil.sensors_battery()
+        except (AttributeError, NotImplementedError, OSError):
+            batt = None
+        if batt is None:
+            return None
+        return batt.percent, bool(batt.power_plugged)
+
+    def _auto(self):
+        if self.battery is None or self.battery[1]:
+            return PERFORMANCE
+        pct = self.battery[0]
+        if self.active == SAVER:
+            # stay until clearly recovered, so it doesn't flap at the threshold
+            return SAVER if pct < self.saver_pct + self.hysteresis_pct else BALANCED
+        return SAVER if pct <= self.saver_pct else BALANCED
+
+    def _switch(self, name):
+        if name == self.active:
+            return
+        was, self.active = self.active, name
+        if was is not None:
+            batt = ("no battery" if self.battery is None else
+                    f"{self.battery[0]:.0f}%{' charging' if self.battery[1] else ''}")
+            how = "override" if self.override else batt
+            self.log(f"[power] {was} -> {name} ({how})")
+        for fn in list(self._sinks):
+            self._call(fn)
+
+    def _call(self, fn):
+        try:
+            fn(self.profile)
+        except Exception as e:
+            self.log(f"[power] ⚠️  applying {self.active} failed: {e}")
+
+    # ----- measuring ------------------------------------------------------
+
+    def _counters(self):
+        cpu = 0.0
+        procs = [self._proc]
+        try:
+            procs += self._proc.children(recursive=True)
+        except psutil.Error:
+            pass
+        for p in procs:
+            try:
+                t = p.cpu_times()
+                cpu += t.user + t.system
+            except psutil.Error:
+                pass        # worker exited between listing and reading
+        try:
+            switches = self._proc.num_ctx_switches().voluntary
+        except (psutil.Error, AttributeError):
+            switches = 0
+        wakeups = self.wheel.wakeups if self.wheel is not None else 0
+        return time.monotonic(), cpu, wakeups, switches
+
+    def _account(self):
+        """Charge everything since the last sample to the active profile."""
+        mark = self._counters()
+        if self.active is not None:
+            u = self.usage[self.active]
+            t0, cpu0, wk0, sw0 = self._mark
+            t1, cpu1, wk1, sw1 = mark
+            u["wall_s"] += t1 - t0
+            # a worker that exited takes its CPU time with it: never go negative
+            u["cpu_s"] += max(0.0, cpu1 - cpu0)
+            u["wakeups"] += max(0, wk1 - wk0)
+            u["switches"] += max(0, sw1 - sw0)
+        self._mark = mark
+
+    def rows(self):
+        """[(profile, minutes active, CPU s/min, wakeups/s, ctx switches/s)]; None = not measured yet."""
+        if time.monotonic() - self._mark[0] >= 1.0:     # cheap enough to call per frame
+            self._account()
+        out = []
+        for name in PROFILES:
+            u = self.usage[name]
+            wall = u["wall_s"]
+            if wall < 1.0:
+                out.append((name, wall / 60, None, None, None))
+                continue
+            out.append((name, wall / 60, u["cpu_s"] * 60 / wall,
+                        u["wakeups"] / wall if self.wheel is not None else None,
+                        u["switches"] / wall))
+        return out
+
+    def stats(self):
+        return {"profile": self.active, "override": self.override,
+                "battery": self.battery}
+
+    def report(self):
+        batt = ("no battery" if self.battery is None else
+                f"battery {self.battery[0]:.0f}%{', charging' if self.battery[1] else ''}")
+        mode = f"override {self.override}" if self.override else "auto"
+        lines = [f"Power profile: {self.active} ({mode}, {batt})",
+                 f"{'profile':<12} {'min':>6} {'CPU s/min':>10} {'wakeups/s':>10} {'ctxsw/s':>8}"]
+
+        def num(v, width, digits):
+            return f"{v:{width}.{digits}f}" if v is not None else "–".rjust(width)
+
+        for name, mins, cpu, wakeups, switches in self.rows():
+            lines.append(f"{name:<12} {mins:6.1f} {num(cpu, 10, 2)} "
+                         f"{num(wakeups, 10, 1)} {num(switches, 8, 1)}")
+        return "\n".join(lines)
+
+
+def power_from_env(wheel=None, log=print):
+    """PowerManager with ARIES_POWER (auto | performance | balanced | saver) as the override."""
+    name = os.getenv("ARIES_POWER", AUTO).strip().lower()
+    if name not in PROFILES:
+        name = AUTO
+    return PowerManager(profile=name, wheel=wheel, log=log)
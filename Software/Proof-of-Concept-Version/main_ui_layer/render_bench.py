@@ -0,0 +1,181 @@
+# render_bench.py
+"""
+Headless render benchmark for VisionAriesUI.
+
+Boots the UI under QT_QPA_PLATFORM=offscreen with a synthetic (or replayed)
+camera, drives a scripted sequence and writes per-scene stats as JSON:
+
+    launcher_scroll -> every pane in turn -> notification burst -> voice overlay
+
+For each scene we record per-frame paint time (a synchronous grab() of the
+whole window), event-loop latency (how late a 0 ms timer fires) and Python
+allocations (tracemalloc delta / peak).
+
+Usage (from main_ui_layer/):
+    python render_bench.py --out bench.json
+    python render_bench.py --panes settings,draw --frames 60
+    python render_bench.py --camera shift.mp4 --dump-dir frames/
+"""
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt, QTimer, QEvent, QEventLoop, QT_VERSION_STR
+from PyQt5.QtGui import QKeyEvent
+
+FRAME_MS = 16
+
+
+def _stats(samples):
+    if not samples:
+        return {}
+    s = sorted(samples)
+    return {
+        "mean": round(statistics.fmean(s), 3),
+        "p50": round(s[len(s) // 2], 3),
+        "p95": round(s[min(len(s) - 1, int(len(s) * 0.95))], 3),
+        "max": round(s[-1], 3),
+    }
+
+
+class RenderBench:
+    def __init__(self, app, win, frames=30, dump_dir=None):
+        self.app = app
+        self.win = win
+        self.frames = frames
+        self.dump_dir = dump_dir
+        self.scenes = {}
+        if dump_dir:
+            os.makedirs(dump_dir, exist_ok=True)
+
+    # --- measurement primitives -----------------------------------------
+
+    def _pump(self, ms):
+        deadline = time.perf_counter() + ms / 1000.0
+        while time.perf_counter() < deadline:
+            self.app.processEvents(QEventLoop.AllEvents, 5)
+
+    def _loop_latency_ms(self):
+        fired = []
+        t0 = time.perf_counter()
+        QTimer.singleShot(0, lambda: fired.append(time.perf_counter()))
+        while not fired:
+            self.app.processEvents(QEventLoop.AllEvents, 50)
+        return (fired[0] - t0) * 1000
+
+    def run_scene(self, name, setup=None, per_frame=None):
+        if setup:
+            setup()
+        tracemalloc.reset_peak()
+        mem0, _ = tracemalloc.get_traced_memory()
+        paint, latency = [], []
+        for i in range(self.frames):
+            if per_frame:
+                per_frame(i)
+            self._pump(FRAME_MS)
+            latency.append(self._loop_latency_ms())
+            t0 = time.perf_counter()
+            img = self.win.grab()
+            paint.append((time.perf_counter() - t0) * 1000)
+            if self.dump_dir:
+                img.save(os.path.join(self.dump_dir, f"{name}_{i:03d}.png"))
+        mem1, peak = tracemalloc.get_traced_memory()
+        self.scenes[name] = {
+            "frames": self.frames,
+            "paint_ms": _stats(paint),
+            "loop_latency_ms": _stats(latency),
+            "alloc_kb": round((mem1 - mem0) / 1024, 1),
+            "peak_kb": round((peak - mem0) / 1024, 1),
+        }
+        print(f"[bench] {name:<24} paint p95 {self.scenes[name]['paint_ms']['p95']:.2f} ms")
+
+    # --- scripted sequence ------------------------------------------------
+
+    def run(self):
+        win = self.win
+
+        def scroll(i):
+            key = Qt.Key_Right if (i // 8) % 2 == 0 else Qt.Key_Left
+            QApplication.sendEvent(win.launcher,
+                                   QKeyEvent(QEvent.KeyPress, key, Qt.NoModifier))
+
+        self.run_scene("launcher_scroll", setup=lambda: win.launch_app(0),
+                       per_frame=scroll)
+
+        for idx, spec in enumerate(win.specs):
+            if spec.module is None:
+                continue
+            self.run_scene(f"pane:{spec.id}", setup=lambda i=idx: win.launch_app(i))
+        win.launch_app(0)
+
+        def burst():
+            for n in range(50):
+                win.presenter.post(f"📬 Message {n % 5}", 5000, source="bench")
+        self.run_scene("notifications", setup=burst)
+
+        def voice(i):
+            if i % 10 == 0:
+                win._flash_listening()
+                win.ctx.process_voice_command()
+        self.run_scene("voice_overlay", per_frame=voice)
+        return self.scenes
+
+
+def _select_panes(ids):
+    if not ids:
+        return None
+    from apps import PANES, enabled_panes
+    return enabled_panes(PANES, ids=ids.split(","))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--out", default="bench.json", help="JSON report path")
+    ap.add_argument("--frames", type=int, default=30, help="frames per scene")
+    ap.add_argument("--panes", default="", help="comma list of pane ids from apps.registry")
+    ap.add_argument("--camera", default="synthetic", help="'synthetic' or a video file")
+    ap.add_argument("--dump-dir", default=None, help="also save every frame as PNG")
+    args = ap.parse_args(argv)
+
+    os.environ.setdefault("ARIES_CAMERA_SOURCE", args.camera)
+    tracemalloc.start()
+    app = QApplication(sys.argv[:1])
+
+    import main as aries
+    t0 = time.perf_counter()
+    win = aries.VisionAriesUI(specs=_select_panes(args.panes))
+    boot_ms = (time.perf_counter() - t0) * 1000
+
+    bench = RenderBench(app, win, frames=args.frames, dump_dir=args.dump_dir)
+    scenes = bench.run()
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "qt": QT_VERSION_STR,
+            "machine": platform.machine(),
+            "platform": os.environ.get("QT_QPA_PLATFORM"),
+            "camera": os.environ.get("ARIES_CAMERA_SOURCE"),
+            "frames_per_scene": args.frames,
+        },
+        "boot_ms": round(boot_ms, 1),
+        "scenes": scenes,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"[bench] wrote {args.out}")
+    win.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+# snapshot.py
+"""
+Fast resume: persist small bits of app state across reboots.
+
+Anything that wants to survive a restart registers a provider:
+
+    snapshots.register("ui", save=lambda: {"pane": ...},
+                       restore=lambda state: ..., version=1)
+
+save() asks every provider for its state (plain dicts/lists/tuples/str/
+int/float/bytes -- whatever marshal handles) and writes one file; it runs
+on clean shutdown and every AUTOSAVE_S while running. On boot the file is
+read once, but each entry is only decoded and handed to its provider when
+that provider registers, so state for panes that are built lazily is
+restored lazily too.
+
+File layout (little endian):
+
+    magic "ARSN" | u16 schema | u16 marshal version | u32 len | u32 crc32
+    zlib(marshal({key: marshal((provider version, state))}))
+
+Each entry is marshalled once, when its provider is asked for it; that
+also checks the state is plain data. Entries nobody has claimed yet are
+carried forward as the bytes they were read as.
+
+A snapshot with a different SCHEMA_VERSION / marshal version, a bad CRC or
+a short read is ignored; so is an entry whose provider version changed.
+Writes go to a temp file, are fsync'd and then os.replace'd over the old
+one, so a power cut leaves either the old or the new snapshot, never half.
+"""
+import marshal
+import os
+import struct
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+SCHEMA_VERSION = 2
+MAGIC = b"ARSN"
+_HEADER = struct.Struct("<4sHHII")
+
+DEFAULT_PATH = os.getenv("ARIES_SNAPSHOT",
+                         os.path.expanduser("~/.cache/aries/snapshot.bin"))
+AUTOSAVE_S = 60
+
+
+def encode(entries):
+    """entries: {key: marshal.dumps((version, state))}"""
+    payload = zlib.compress(marshal.dumps(entries), 6)
+    return _HEADER.pack(MAGIC, SCHEMA_VERSION, marshal.version,
+                        len(payload), zlib.crc32(payload)) + payload
+
+
+def decode(blob):
+    """{key: entry bytes}, or None if `blob` isn't a usable snapshot."""
+    if len(blob) < _HEADER.size:
+        return None
+    magic, schema, mversion, length, crc = _HEADER.unpack_from(blob)
+    payload = blob[_HEADER.size:]
+    if (magic != MAGIC or schema != SCHEMA_VERSION or mversion != marshal.version
+            or len(payload) != length or zlib.crc32(payload) != crc):
+        return None
+    try:
+        entries = marshal.loads(zlib.decompress(payload))
+    except (ValueError, EOFError, TypeError, zlib.error):
+        return None
+    return entries if isinstance(entries, dict) else None
+
+
+def decode_entry(raw):
+    """(version, state) from one entry's bytes, or None if it's damaged."""
+    try:
+        version, state = marshal.loads(raw)
+    except (ValueError, EOFError, TypeError):
+        return None
+    return version, state
+
+
+def atomic_write(path, data):
+    """Write `data` to `path` so that a crash leaves the old or new file intact."""
+    d = os.path.dirname(path) or "."
+    os.makedirs(d, exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    # make the rename itself durable
+    try:
+        fd = os.open(d, os.O_RDONLY)
+    except OSError:
+        return      # e.g. Windows dev boxes
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class SnapshotStore:
+    def __init__(self, path=DEFAULT_PATH, autosave_s=AUTOSAVE_S):
+        self.path = path
+        self.autosave_s = autosave_s
+        self._providers = {}        # key -> (save, restore, version)
+        self._pending = {}          # key -> entry bytes not yet restored
+        self._lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(1, thread_name_prefix="snapshot")
+        self._last_crc = None
+        self._closed = False
+        self._next_save = time.monotonic() + autosave_s
+        self.load()
+
+    # ----- providers ------------------------------------------------------
+
+    def register(self, key, save, restore=None, version=1):
+        """
+        Add a provider; if the boot snapshot has state for `key` (same
+        version), `restore(state)` is called right away.
+        """
+        self._providers[key] = (save, restore, version)
+        raw = self._pending.pop(key, None)
+        if raw is None or restore is None:
+            return
+        entry = decode_entry(raw)
+        if entry is None:
+            print(f"[snapshot] skipping damaged '{key}'")
+            return
+        if entry[0] != version:
+            print(f"[snapshot] skipping stale '{key}' (v{entry[0]}, want v{version})")
+            return
+        try:
+            restore(entry[1])
+        except Exception as e:
+            print(f"⚠️ snapshot: restoring '{key}' failed: {e}")
+
+    def unregister(self, key, keep=True):
+        """Drop a provider; with keep=True its last state goes into the next save."""
+        provider = self._providers.pop(key, None)
+        if keep and provider is not None:
+            raw = self._collect_one(key, provider)
+            if raw is not None:
+                self._pending[key] = raw
+
+    def peek(self, key, version=1):
+        """Boot-snapshot state for `key` without registering, or None."""
+        raw = self._pending.get(key)
+        entry = decode_entry(raw) if raw is not None else None
+        return entry[1] if entry and entry[0] == version else None
+
+    # ----- load / save ----------------------------------------------------
+
+    def load(self):
+        try:
+            with open(self.path, "rb") as f:
+                blob = f.read()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            print(f"⚠️ snapshot: can't read {self.path}: {e}")
+            return
+        entries = decode(blob)
+        if entries is None:
+            print(f"[snapshot] ignoring stale or damaged {self.path}")
+            return
+        self._pending = entries
+        self._last_crc = zlib.crc32(blob)
+
+    def _collect_one(self, key, provider):
+        """The provider's entry bytes, or None if it has nothing plain to save."""
+        save, _, version = provider
+        try:
+            # marshal rejects anything that isn't plain data
+            return marshal.dumps((version, save()))
+        except Exception as e:
+            print(f"⚠️ snapshot: '{key}' not saved: {e}")
+            return None
+
+    def collect(self):
+        # unrestored boot state is carried forward until its provider shows up
+        entries = dict(self._pending)
+        for key, provider in list(self._providers.items()):
+            raw = self._collect_one(key, provider)
+            if raw is not None:
+                entries[key] = raw
+        return entries
+
+    def save(self, sync=False):
+        """
+        Snapshot every provider now. State is gathered on the calling thread;
+        the fsync'd write happens on a worker unless `sync` (use at shutdown).
+        Nothing is written if the state hasn't changed since the last
+        successful write.
+        """
+        self._next_save = time.monotonic() + self.autosave_s
+        blob = encode(self.collect())
+        if zlib.crc32(blob) == self._last_crc:
+            return
+        if sync or self._closed:
+            self._write(blob)
+        else:
+            self._writer.submit(self._write, blob)
+
+    def save_if_due(self, now=None):
+        """For polling loops (PaneHost): save once every `autosave_s`."""
+        if (now if now is not None else time.monotonic()) >= self._next_save:
+            self.save()
+
+    def _write(self, blob):
+        with self._lock:
+            try:
+                atomic_write(self.path, blob)
+            except OSError as e:
+                # _last_crc stays put, so the next save tries again
+                print(f"⚠️ snapshot: write to {self.path} failed: {e}")
+                return
+            self._last_crc = zlib.crc32(blob)
+
+    def close(self):
+        """Final synchronous save; call on clean shutdown."""
+        self._closed = True
+        self._writer.shutdown(wait=True)
+        self.save(sync=True)
+
+
+# Shared instance (main.py, pane_loader, services.make_services)
+snapshots = SnapshotStore()
@@ -0,0 +1,114 @@
+# sprite_cache.py
+import os
+from collections import OrderedDict
+
+from PyQt5.QtWidgets import (
+    QGraphicsScene, QGraphicsPixmapItem, QGraphicsDropShadowEffect
+)
+from PyQt5.QtGui import QImage, QPixmap, QPainter, QPainterPath, QColor
+from PyQt5.QtCore import Qt, QRectF
+
+# Live QGraphicsEffects re-blur an offscreen buffer on every repaint, which is
+# expensive under the Pi's software raster. By default we bake glows/shadows
+# into pixmaps once and composite them; set ARIES_LIVE_EFFECTS=1 (or press F2
+# in the main window) to switch back to live effects and compare frame times.
+_live_effects = os.getenv("ARIES_LIVE_EFFECTS", "0") == "1"
+
+
+def live_effects():
+    return _live_effects
+
+
+def set_live_effects(enabled):
+    """Flip between live QGraphicsEffects and cached sprites at runtime."""
+    global _live_effects
+    _live_effects = bool(enabled)
+
+
+class SpriteCache:
+    """
+    Renders glow/shadow halos once per (shape, size, radius, blur, colour)
+    and hands back plain QPixmaps. Each sprite is `blur` px larger than the
+    shape on every side, so draw it at (-blur, -blur) relative to the shape.
+    """
+    def __init__(self, max_entries=48):
+        self.max_entries = max_entries
+        self._sprites = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def rounded_glow(self, w, h, radius, blur, color):
+        """Halo around a rounded rect, with the rect itself left transparent."""
+        key = ("rounded", int(w), int(h), radius, blur, QColor(color).rgba())
+        pix = self._sprites.get(key)
+        if pix is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return pix
+
+        self.misses += 1
+        pix = self._render_halo(int(w), int(h), radius, blur, QColor(color))
+        self._sprites[key] = pix
+        if len(self._sprites) > self.max_entries:
+            self._sprites.popitem(last=False)
+        return pix
+
+    def pixmaps(self):
+        return list(self._sprites.values())
+
+    def clear(self):
+        self._sprites.clear()
+
+    def _render_halo(self, w, h, radius, blur, color):
+        shape = QPixmap(w, h)
+        shape.fill(Qt.transparent)
+        p = QPainter(shape)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setPen(Qt.NoPen)
+        p.setBrush(Qt.white)
+        p.drawRoundedRect(QRectF(0, 0, w, h), radius, radius)
+        p.end()
+
+        # Let Qt's own drop-shadow do the blur exactly once, offscreen.
+        effect = QGraphicsDropShadowEffect()
+        effect.setBlurRadius(blur)
+        effect.setColor(color)
+        effect.setOffset(0, 0)
+        scene = QGraphicsScene()
+        item = QGraphicsPixmapItem(shape)
+        item.setGraphicsEffect(effect)
+        scene.addItem(item)
+
+        out = QImage(w + 2 * blur, h + 2 * blur, QImage.Format_ARGB32_Premultiplied)
+        out.fill(Qt.transparent)
+        p = QPainter(out)
+        p.setRenderHint(QPainter.Antialiasing)
+        scene.render(p, QRectF(0, 0, out.width(), out.height()),
+                     QRectF(-blur, -blur, out.width(), out.height()))
+        # Punch the shape back out so only the halo remains; the caller
+        # paints the real content on top.
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(blur, blur, w, h), radius, radius)
+        p.setCompositionMode(QPainter.CompositionMode_DestinationOut)
+        p.fillPath(path, Qt.black)
+        p.end()
+        return QPixmap.fromImage(out)
+
+
+def frosted(pixmap, radius=12):
+    """
+    Cheap one-shot stand-in for QGraphicsBlurEffect: downscale then smooth
+    upscale. Good enough for a 200 ms "listening" flash over the camera.
+    """
+    if pixmap is None or pixmap.isNull():
+        return pixmap
+    factor = max(2, radius // 2)
+    small = pixmap.scaled(max(1, pixmap.width() // factor),
+                          max(1, pixmap.height() // factor),
+                          Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    return small.scaled(pixmap.size(), Qt.IgnoreAspectRatio,
+                        Qt.SmoothTransformation)
+
+
+# Shared instance for the whole UI
+sprites = SpriteCache()
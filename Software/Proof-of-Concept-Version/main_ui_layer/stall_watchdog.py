@@ -0,0 +1,204 @@
+# stall_watchdog.py
+"""
+Finds out what freezes the UI in the field.
+
+The GUI thread calls beat() once per frame (main.py's frame tick on the
+timer wheel, the ctx build's PaneHost), so it needs no timer of its own.
+While beats are fresh the watchdog thread only wakes when the last one
+would turn `threshold_s` old; once it is older than that the GUI thread is
+stuck in some call, and the watchdog samples its stack
+(sys._current_frames) every `interval_s` until beats resume. Each stall is then charged to the call site
+seen most often in those samples: the innermost frame in our own code
+(main.py:325 StatusBar._update), with the innermost frame overall as the
+leaf (socket.py:717 readinto), so a blocking library call still points at
+whoever made it.
+
+    ARIES_STALL_MS=250            threshold (default 250; 0 turns it off)
+    ARIES_STALL_LOG=stalls        <prefix>.jsonl: one line per stall
+                                  <prefix>.txt:   ranked call sites (close()/F4)
+                                  <prefix>.stacks.log: all-thread dumps
+
+With a log prefix, every stall also writes a faulthandler dump of all
+threads, and faulthandler re-armed on each beat dumps them on its own if
+the GUI thread stops for ARIES_STALL_HANG_S (default 10): that one runs
+without the GIL, so it still fires when a C extension holds it.
+
+report() ranks call sites by total blocked time; ranked() gives the rows.
+This module must stay free of a hard Qt import.
+"""
+import faulthandler
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+STACK_DEPTH = 24
+
+
+def _site(frame):
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{os.path.basename(code.co_filename)}:{frame.f_lineno} {name}"
+
+
+class StallWatchdog:
+    def __init__(self, threshold_s=0.25, interval_s=0.05, output=None, roots=(),
+                 hang_s=10.0):
+        """
+        Create on the GUI thread: that's the thread it watches.
+        threshold_s:  beat gap that counts as a stall; keep it above a frame
+        interval_s:   stack sampling period during a stall
+        roots:        directories whose files count as "our code" for call sites
+        """
+        self.threshold_s = threshold_s
+        self.interval_s = interval_s
+        self.output = output
+        self.roots = tuple(os.path.abspath(r) for r in roots) or (os.path.dirname(HERE),)
+        self.hang_s = hang_s
+        self.ident = threading.get_ident()
+        self.sites = {}             # call site -> {"count", "total_s", "max_s", "leaf", "stack"}
+        self.stalls = 0
+        self.blocked_s = 0.0
+        self._ours_cache = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._last = time.monotonic()
+        self._stacks = None
+        if output:
+            self._stacks = open(f"{output}.stacks.log", "a", encoding="utf-8")
+            faulthandler.dump_traceback_later(hang_s, repeat=True, file=self._stacks)
+        self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    # ----- GUI thread -----------------------------------------------------
+
+    def beat(self):
+        self._last = time.monotonic()
+        if self._stacks is not None:
+            # re-arming pushes the hard-hang dump hang_s into the future
+            faulthandler.dump_traceback_later(self.hang_s, repeat=True, file=self._stacks)
+
+    # ----- watchdog thread ------------------------------------------------
+
+    def _watch(self):
+        wait = self.threshold_s
+        while not self._stop.wait(wait):
+            since = self._last
+            fresh_for = self.threshold_s - (time.monotonic() - since)
+            if fresh_for > 0:
+                wait = max(fresh_for, self.interval_s)     # nothing to see before then
+                continue
+            wait = self.threshold_s
+            samples = {}        # call site -> [count, leaf, stack]
+            self._dump_all(time.monotonic() - since)
+            while not self._stop.is_set() and self._last == since:
+                frame = sys._current_frames().get(self.ident)
+                if frame is not None and self._last == since:   # not already back in the loop
+                    site, leaf, stack = self._culprit(frame)
+                    entry = samples.setdefault(site, [0, leaf, stack])
+                    entry[0] += 1
+                del frame
+                self._stop.wait(self.interval_s)
+            if self._last != since and samples:
+                self._record(self._last - since, samples)
+
+    def _ours(self, filename):
+        ours = self._ours_cache.get(filename)
+        if ours is None:
+            ours = (not filename.startswith("<")
+                    and os.path.abspath(filename).startswith(self.roots)
+                    and os.path.abspath(filename) != os.path.abspath(__file__))
+            self._ours_cache[filename] = ours
+        return ours
+
+    def _culprit(self, frame):
+        """(call site in our code, innermost frame, short stack) for one sample."""
+        leaf = _site(frame)
+        site = None
+        f = frame
+        while f is not None:
+            if self._ours(f.f_code.co_filename):
+                site = _site(f)
+                break
+            f = f.f_back
+        stack = "".join(traceback.format_stack(frame, limit=STACK_DEPTH))
+        return site or leaf, leaf, stack
+
+    def _record(self, duration, samples):
+        site, (n, leaf, stack) = max(samples.items(), key=lambda kv: kv[1][0])
+        with self._lock:
+            self.stalls += 1
+            self.blocked_s += duration
+            s = self.sites.setdefault(site, {"count": 0, "total_s": 0.0, "max_s": 0.0,
+                                             "leaf": leaf, "stack": stack})
+            s["count"] += 1
+            s["total_s"] += duration
+            if duration >= s["max_s"]:
+                s["max_s"], s["leaf"], s["stack"] = duration, leaf, stack
+        print(f"[stall] ⚠️  GUI blocked {duration * 1000:.0f} ms in {site}"
+              + (f" ({leaf})" if leaf != site else ""))
+        if self.output:
+            with open(f"{self.output}.jsonl", "a", encoding="utf-8") as f:
+                f.write(json.dumps({"t": time.time(), "ms": round(duration * 1000, 1),
+                                    "site": site, "leaf": leaf, "samples": n,
+                                    "others": {k: v[0] for k, v in samples.items() if k != site},
+                                    "stack": stack}) + "\n")
+
+    def _dump_all(self, blocked_s):
+        if self._stacks is None:
+            return
+        self._stacks.write(f"\n--- {time.strftime('%Y-%m-%d %H:%M:%S')} GUI thread "
+                           f"blocked {blocked_s * 1000:.0f} ms ---\n")
+        self._stacks.flush()
+        faulthandler.dump_traceback(file=self._stacks, all_threads=True)
+
+    # ----- reporting ------------------------------------------------------
+
+    def ranked(self):
+        """[(call site, stalls, total s, max s, leaf)] most blocked time first."""
+        with self._lock:
+            rows = [(k, s["count"], s["total_s"], s["max_s"], s["leaf"])
+                    for k, s in self.sites.items()]
+        rows.sort(key=lambda r: r[2], reverse=True)
+        return rows
+
+    def stats(self):
+        with self._lock:
+            return {"stalls": self.stalls, "blocked_s": round(self.blocked_s, 3),
+                    "sites": len(self.sites)}
+
+    def report(self):
+        lines = [f"GUI stalls over {self.threshold_s * 1000:.0f} ms: {self.stalls}, "
+                 f"{self.blocked_s:.1f} s blocked",
+                 f"{'stalls':>7} {'total s':>8} {'max ms':>8}  call site  (leaf)"]
+        for site, n, total, worst, leaf in self.ranked():
+            extra = f"  ({leaf})" if leaf != site else ""
+            lines.append(f"{n:7d} {total:8.2f} {worst * 1000:8.0f}  {site}{extra}")
+        return "\n".join(lines)
+
+    def write_report(self):
+        if self.output:
+            with open(f"{self.output}.txt", "w", encoding="utf-8") as f:
+                f.write(self.report() + "\n")
+
+    def close(self):
+        self._stop.set()
+        self._thread.join(1.0)
+        stacks, self._stacks = self._stacks, None       # beat() stops re-arming
+        if stacks is not None:
+            faulthandler.cancel_dump_traceback_later()
+            stacks.close()
+        self.write_report()
+
+
+def watchdog_from_env(roots=()):
+    """StallWatchdog unless ARIES_STALL_MS=0; call on the GUI thread."""
+    ms = float(os.getenv("ARIES_STALL_MS", "250"))
+    if ms <= 0:
+        return None
+    return StallWatchdog(threshold_s=ms / 1000, interval_s=min(0.05, ms / 4000),
+                         output=os.getenv("ARIES_STALL_LOG") or None, roots=roots,
+                         hang_s=float(os.getenv("ARIES_STALL_HANG_S", "10")))
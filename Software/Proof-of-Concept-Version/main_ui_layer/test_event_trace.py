@@ -0,0 +1,129 @@
+# test_event_trace.py
+"""TraceRecorder -> read_trace / replay round trips on temp files."""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import event_trace
+from event_trace import TraceRecorder, read_trace, replay, trace_info
+
+
+def _record(path, events, **kw):
+    rec = TraceRecorder(str(path), flush_s=60, **kw)
+    for ev in events:
+        rec.record(*ev)
+    rec.close()
+    return rec
+
+
+def test_round_trip_keeps_order_spacing_and_payloads(tmp_path):
+    path = tmp_path / "t.aevt"
+    _record(path, [
+        ("VOICE", {"text": "open maps"}, 1, 100.0),
+        ("TELEMETRY", {"cpu": 0.25, "temps": [51, 52]}, 3, 100.5),
+        ("VOICE", {"text": "back"}, 1, 102.25),
+    ])
+    got = list(read_trace(str(path)))
+    assert [(t, ty, p, pl) for t, ty, p, pl in got] == [
+        (0.0, "VOICE", 1, {"text": "open maps"}),
+        (0.5, "TELEMETRY", 3, {"cpu": 0.25, "temps": [51, 52]}),
+        (2.25, "VOICE", 1, {"text": "back"}),
+    ]
+    info = trace_info(str(path))
+    assert info["events"] == 3 and info["types"] == {"VOICE": 2, "TELEMETRY": 1}
+
+
+def test_long_traces_do_not_drift(tmp_path):
+    path = tmp_path / "t.aevt"
+    _record(path, [("TICK", {}, 2, 5.0 + i * 0.0333337) for i in range(10_000)])
+    *_, last = read_trace(str(path))
+    assert last[0] == pytest.approx(9_999 * 0.0333337, abs=2e-6)
+
+
+def test_payloads_that_marshal_refuses_are_flattened(tmp_path):
+    path = tmp_path / "t.aevt"
+    _record(path, [("DETECTIONS", {"frame": object(), "boxes": [(1, 2, 3, 4)]}, 3, 1.0)])
+    (_, _, _, payload), = read_trace(str(path))
+    assert payload == {"frame": "<object>", "boxes": [[1, 2, 3, 4]]}
+
+
+def test_qt_signals_are_recorded_with_flattened_args(tmp_path):
+    class Signal:
+        def connect(self, slot):
+            self.slot = slot
+
+    path = tmp_path / "t.aevt"
+    rec = TraceRecorder(str(path), flush_s=60)
+    frame, gesture = Signal(), Signal()
+    rec.record_signal(frame, "FRAME", names=["image", "ts"])
+    rec.record_signal(gesture, "GESTURE")
+    frame.slot(object(), 12.5)
+    gesture.slot("swipe_left", {"dx": -40})
+    rec.close()
+    assert [(ty, pl) for _, ty, _, pl in read_trace(str(path))] == [
+        ("FRAME", {"image": "<object>", "ts": 12.5}),
+        ("GESTURE", {"args": ["swipe_left", {"dx": -40}]}),
+    ]
+
+
+def test_backlog_is_capped_and_counted(tmp_path):
+    rec = _record(tmp_path / "t.aevt", [("E", {}, 2, float(i)) for i in range(10)],
+                  max_pending=4)
+    assert rec.stats()["recorded"] == 4 and rec.stats()["dropped"] == 6
+
+
+def test_trace_cut_off_mid_block_keeps_the_complete_blocks(tmp_path):
+    path = tmp_path / "t.aevt"
+    rec = TraceRecorder(str(path), flush_s=60)
+    rec.record("A", {}, 2, 1.0)
+    rec._flush()
+    rec.record("B", {"pad": "x" * 1000}, 2, 2.0)
+    rec.close()
+    blob = path.read_bytes()
+    path.write_bytes(blob[:-10])
+    assert [ty for _, ty, _, _ in read_trace(str(path))] == ["A"]
+
+
+def test_not_a_trace_is_rejected(tmp_path):
+    path = tmp_path / "t.aevt"
+    path.write_bytes(b"nope" * 8)
+    with pytest.raises(ValueError):
+        list(read_trace(str(path)))
+
+
+def test_rotating_directory_keeps_the_newest_files(tmp_path):
+    for i in range(5):
+        (tmp_path / f"trace-2020010{i}-000000.aevt").write_bytes(b"")
+    rec = _record(tmp_path, [("E", {}, 2, 1.0)], keep=3)
+    files = sorted(os.listdir(tmp_path))
+    assert len(files) == 3 and os.path.basename(rec.file) in files
+
+
+def test_replay_at_max_speed_filters_types(tmp_path):
+    path = tmp_path / "t.aevt"
+    _record(path, [("VOICE", {"n": 1}, 1, 0.0), ("TELEMETRY", {}, 3, 5.0),
+                   ("VOICE", {"n": 2}, 1, 10.0)])
+    got = []
+    report = replay(str(path), lambda *ev: got.append(ev), speed=None, types={"VOICE"})
+    assert got == [("VOICE", {"n": 1}, 1), ("VOICE", {"n": 2}, 1)]
+    assert report["events"] == 2 and report["seconds"] < 1.0
+
+
+@pytest.mark.skipif(not os.path.isdir(event_trace.CTX_BUILD), reason="ctx build not in this tree")
+def test_cli_replays_into_a_headless_host(tmp_path):
+    path = tmp_path / "t.aevt"
+    _record(path, [("NOTIFY", {"n": i}, 2, i * 0.001) for i in range(10)]
+            + [("VOICE", {"text": "open maps"}, 1, 0.02)])
+    env = dict(os.environ, PYTHONPATH="", ARIES_SNAPSHOT=str(tmp_path / "snap.bin"))
+    out = subprocess.run(
+        [sys.executable, event_trace.__file__, "replay", str(path), "--max",
+         "--json", str(tmp_path / "load.json")],
+        cwd=tmp_path, env=env, capture_output=True, text=True, timeout=60)
+    assert out.returncode == 0, out.stderr
+    report = json.loads((tmp_path / "load.json").read_text())
+    assert report["replay"]["events"] == 11
+    assert report["handled"].get("NOTIFY") == 10
+    assert report["bus"]["published"] >= 11
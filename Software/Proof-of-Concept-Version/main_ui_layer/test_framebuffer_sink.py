@@ -0,0 +1,142 @@
+# test_framebuffer_sink.py
+"""FramebufferSink on a regular file: pixel formats, dirty rows, fbdev geometry."""
+import numpy as np
+import pytest
+
+pytest.importorskip("PyQt5.QtGui")
+
+from PyQt5.QtGui import QImage, QColor
+
+import framebuffer_sink as fbs
+from framebuffer_sink import FramebufferSink, fb_geometry
+
+W, H = 4, 3
+RED, GREEN, BLUE = (255, 0, 0), (0, 255, 0), (0, 0, 255)
+ROW_COLORS = [RED, GREEN, BLUE]
+
+
+def _image(colors=ROW_COLORS, w=W):
+    img = QImage(w, len(colors), QImage.Format_RGB32)
+    for y, rgb in enumerate(colors):
+        for x in range(w):
+            img.setPixelColor(x, y, QColor(*rgb))
+    return img
+
+
+def _file(tmp_path, name="panel.raw"):
+    return str(tmp_path / name)
+
+
+@pytest.mark.parametrize("fmt, expect", [
+    ("XRGB8888", {RED: [0, 0, 255, 255], GREEN: [0, 255, 0, 255], BLUE: [255, 0, 0, 255]}),
+    ("RGB888", {RED: [0, 0, 255], GREEN: [0, 255, 0], BLUE: [255, 0, 0]}),
+    ("RGB565", {RED: [0x00, 0xF8], GREEN: [0xE0, 0x07], BLUE: [0x1F, 0x00]}),
+])
+def test_each_format_lands_in_the_file(tmp_path, fmt, expect):
+    path = _file(tmp_path)
+    sink = FramebufferSink(path, W, H, fmt)
+    assert sink.write(_image()) == H
+    sink.close()
+    bpp = fbs.FORMATS[fmt]
+    raw = np.fromfile(path, np.uint8).reshape(H, W * bpp)
+    for y, rgb in enumerate(ROW_COLORS):
+        assert raw[y].reshape(W, bpp).tolist() == [expect[rgb]] * W
+
+
+def test_only_changed_rows_are_written(tmp_path):
+    sink = FramebufferSink(_file(tmp_path), W, H, "RGB565")
+    assert sink.write(_image()) == 3
+    assert sink.write(_image()) == 0
+    assert sink.write(_image([RED, RED, BLUE])) == 1
+    assert sink.write(_image([GREEN, GREEN, GREEN])) == 3
+    assert (sink.frames, sink.rows_written) == (4, 7)
+    sink.close()
+
+
+def test_dirty_rows_really_go_to_the_map(tmp_path):
+    path = _file(tmp_path)
+    sink = FramebufferSink(path, W, H, "RGB888")
+    sink.write(_image())
+    sink.write(_image([RED, BLUE, BLUE]))
+    sink.close()
+    raw = np.fromfile(path, np.uint8).reshape(H, W * 3)
+    assert raw[1, :3].tolist() == [255, 0, 0]       # blue, stored B,G,R
+
+
+def test_stride_padding_is_left_alone(tmp_path):
+    path = _file(tmp_path)
+    stride = W * 2 + 8
+    with open(path, "wb") as f:
+        f.write(b"\xAA" * stride * H)
+    sink = FramebufferSink(path, W, H, "RGB565", stride=stride)
+    sink.write(_image())
+    sink.close()
+    raw = np.fromfile(path, np.uint8).reshape(H, stride)
+    assert (raw[:, W * 2:] == 0xAA).all()
+
+
+def test_frames_of_another_size_are_scaled(tmp_path):
+    sink = FramebufferSink(_file(tmp_path), W, H, "XRGB8888")
+    assert sink.write(_image(ROW_COLORS * 2, w=W * 2)) == H
+    sink.close()
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        FramebufferSink(_file(tmp_path), W, H, "YUYV")
+
+
+def _fake_sysfs(tmp_path, monkeypatch, **attrs):
+    sysfs = tmp_path / "sys"
+    (sysfs / "fb7").mkdir(parents=True)
+    for name, value in attrs.items():
+        (sysfs / "fb7" / name).write_text(value + "\n")
+    monkeypatch.setattr(fbs, "SYSFS", str(sysfs))
+    return str(tmp_path / "fb7")
+
+
+def test_double_buffered_fbdev_uses_the_visible_mode(tmp_path, monkeypatch):
+    path = _fake_sysfs(tmp_path, monkeypatch, virtual_size="800,960",
+                       modes="U:800x480p-60", bits_per_pixel="16", stride="1600")
+    assert fb_geometry(path) == (800, 480, "RGB565", 1600, 960, 0)
+    with open(path, "wb") as f:
+        f.truncate(1600 * 960)
+    sink = FramebufferSink(path)
+    assert sink.size() == (800, 480)
+    img = QImage(800, 480, QImage.Format_RGB32)
+    img.fill(QColor(*RED))
+    assert sink.write(img) == 480
+    sink.close()
+    px = np.fromfile(path, "<u2").reshape(960, 800)
+    assert (px[:480] == 0xF800).all()               # the visible page
+    assert (px[480:] == 0).all()                    # the back page is untouched
+
+
+def test_fbdev_without_modes_falls_back_to_the_virtual_size(tmp_path, monkeypatch):
+    path = _fake_sysfs(tmp_path, monkeypatch, virtual_size="640,400", bits_per_pixel="32")
+    assert fb_geometry(path) == (640, 400, "XRGB8888", 2560, 400, 0)
+
+
+def test_plain_files_have_no_geometry(tmp_path):
+    assert fb_geometry(_file(tmp_path)) is None
+
+
+def test_sink_size_comes_from_config_yaml(tmp_path, monkeypatch):
+    pytest.importorskip("yaml")
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text("display:\n  width: 640\n  height: 400\n")
+    monkeypatch.setenv("ARIES_CONFIG", str(cfg))
+    monkeypatch.setenv("ARIES_FB", _file(tmp_path))
+    monkeypatch.delenv("ARIES_FB_SIZE", raising=False)
+    sink = fbs.sink_from_env()
+    assert sink.size() == (640, 400)
+    sink.close()
+    monkeypatch.setenv("ARIES_FB_SIZE", "320x240")
+    sink = fbs.sink_from_env()
+    assert sink.size() == (320, 240)
+    sink.close()
+
+
+def test_missing_config_falls_back_to_the_default(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARIES_CONFIG", str(tmp_path / "missing.yaml"))
+    assert fbs.configured_size() == fbs.DEFAULT_SIZE
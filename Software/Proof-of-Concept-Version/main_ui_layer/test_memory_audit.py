@@ -0,0 +1,92 @@
+# test_memory_audit.py
+"""MemoryAudit: heap attribution to our own files, probes, growth ranking."""
+import json
+import os
+import tracemalloc
+
+import pytest
+
+from memory_audit import MB, MemoryAudit, _slope_per_hour
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+_kept = []
+
+
+def _leak(mb):
+    _kept.append(bytearray(mb * MB))
+
+
+@pytest.fixture
+def audit(tmp_path):
+    was_tracing = tracemalloc.is_tracing()
+    a = MemoryAudit(output=str(tmp_path / "mem"), roots=[HERE])
+    yield a
+    a.close()
+    _kept.clear()
+    if not was_tracing:
+        tracemalloc.stop()
+
+
+def test_slope_is_in_mb_per_hour():
+    assert _slope_per_hour([(t * 60.0, t * MB) for t in range(10)]) == pytest.approx(60.0)
+    assert _slope_per_hour([(0.0, MB)]) == 0.0
+    assert _slope_per_hour([(5.0, MB), (5.0, 2 * MB)]) == 0.0
+
+
+def test_heap_is_charged_to_the_file_that_allocated_it(audit):
+    audit.add_rule("test_memory_audit", "leaky")
+    _leak(4)
+    audit.sample()
+    audit._pool.submit(lambda: None).result()   # wait for the grouping
+    heap = audit.series["heap:leaky"][-1][1]
+    assert heap >= 4 * MB
+    assert "rss" in audit.series and "native" in audit.series
+
+
+def test_files_outside_the_roots_are_not_ours(audit):
+    assert audit._owner("<frozen importlib._bootstrap>") == ""
+    assert audit._owner(json.__file__) == ""
+    assert audit._owner(os.path.join(HERE, "camera.py")) == "camera"
+    audit.add_rule("camera.py", "camera-pipeline")
+    assert audit._owner(os.path.join(HERE, "camera.py")) == "camera-pipeline"
+
+
+def test_probes_report_counts_and_failing_probes_are_dropped(audit):
+    audit.probe("canvas", lambda: (3 * MB, 42))
+    audit.probe("broken", lambda: 1 / 0)
+    audit.sample()
+    audit.close()
+    assert audit.series["probe:canvas"][-1][1] == 3 * MB
+    assert audit.counts == {"canvas": 42}
+    assert "broken" not in audit._probes
+    report = audit.report()
+    assert "probe:canvas  (42 items)" in report
+
+
+def test_growth_ranks_the_fastest_climber_first(audit):
+    audit.series = {
+        "heap:camera": [(t * 60.0, 10 * MB) for t in range(30)],
+        "heap:pane:draw": [(t * 60.0, (10 + t) * MB) for t in range(30)],
+        "rss": [(t * 60.0, (100 + t / 10) * MB) for t in range(30)],
+    }
+    keys = [k for k, _, _ in audit.growth()]
+    assert keys == ["heap:pane:draw", "rss", "heap:camera"]
+    # only the last 5 minutes: the draw pane is still climbing at 60 MB/h
+    (key, now, rate), = [r for r in audit.growth(window_s=300) if r[0] == "heap:pane:draw"]
+    assert now == pytest.approx(39.0) and rate == pytest.approx(60.0)
+
+
+def test_item_counts_only_label_their_probe(audit):
+    audit.counts = {"camera": 1}
+    audit.series = {"heap:camera": [(0.0, MB)], "probe:camera": [(0.0, MB)]}
+    lines = audit.report().splitlines()
+    assert [ln for ln in lines if "items" in ln] == [
+        next(ln for ln in lines if ln.endswith("probe:camera  (1 items)"))]
+
+
+def test_samples_and_report_are_written(audit, tmp_path):
+    audit.sample()
+    audit.close()
+    lines = (tmp_path / "mem.jsonl").read_text().splitlines()
+    assert len(lines) == 1 and "rss" in json.loads(lines[0])["mb"]
+    assert (tmp_path / "mem.txt").read_text().startswith("memory audit:")
@@ -0,0 +1,120 @@
+# test_notification_presenter.py
+"""NotificationPresenter against a stand-in card: no QApplication, no window."""
+import pytest
+
+pytest.importorskip("PyQt5.QtCore")
+
+from notification_presenter import NotificationPresenter, ALERT, NORMAL
+
+
+class _Signal:
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, fn):
+        self._slots.append(fn)
+
+    def emit(self):
+        for fn in self._slots:
+            fn()
+
+
+class FakeCard:
+    """The FloatingCard surface the presenter uses; busy from show until dismiss()."""
+
+    def __init__(self):
+        self.dismissed = _Signal()
+        self.shown = []
+        self.busy = False
+
+    def showMessage(self, text, duration=3000):
+        self.shown.append(text)
+        self.busy = True
+
+    def isBusy(self):
+        return self.busy
+
+    def dismiss(self):
+        self.busy = False
+        self.dismissed.emit()
+
+
+def _presenter(**kw):
+    card = FakeCard()
+    kw.setdefault("min_interval_ms", 0)
+    return NotificationPresenter(card, **kw), card
+
+
+def test_burst_of_same_message_coalesces_into_one_card():
+    p, card = _presenter()
+    for _ in range(50):
+        p.post("New email", source="phone", priority=NORMAL)
+    assert card.shown == ["New email"]
+    assert p._current.count == 50
+    assert p._current.label() == "New email  ×50"
+    assert p.pending() == 0
+
+
+def test_queued_duplicates_coalesce():
+    p, card = _presenter()
+    p.post("first", source="phone")
+    for _ in range(5):
+        p.post("New email", source="phone")
+    assert p.pending() == 1
+    assert p._heap[0].count == 5
+
+
+def test_backlog_below_threshold_is_shown_as_is():
+    p, card = _presenter(summarize_after=3)
+    p.post("first", source="phone")
+    p.post("a", source="phone")
+    p.post("b", source="phone")
+    card.dismiss()
+    # popped "a" with one more queued: len(heap) + 1 == 2 < summarize_after
+    assert card.shown == ["first", "a"]
+    assert p.pending() == 1
+
+
+def test_backlog_at_threshold_is_summarized():
+    p, card = _presenter(summarize_after=3)
+    p.post("first", source="phone")
+    for text in ("a", "b", "c"):
+        p.post(text, source="phone")
+    card.dismiss()
+    # len(heap) + 1 == 3 >= summarize_after: everything folds into one card
+    assert card.shown[-1].startswith("3 notifications\n")
+    assert p.pending() == 0
+
+
+def test_fifty_distinct_notifications_cost_two_cards():
+    p, card = _presenter()
+    for i in range(50):
+        p.post(f"message {i}", source="phone")
+    card.dismiss()
+    card.dismiss()
+    assert len(card.shown) == 2
+    # the queue overflowed: dropped entries still count in the summary
+    assert card.shown[1].startswith("49 notifications\n")
+
+
+def test_alert_preempts_and_is_never_summarized():
+    p, card = _presenter(summarize_after=2)
+    p.post("first", source="phone")
+    for text in ("a", "b", "c"):
+        p.post(text, source="phone")
+    p.post("Battery critical", source="system", priority=ALERT)
+    # shown straight away, on top of the busy card, without waiting its turn
+    assert card.shown == ["first", "Battery critical"]
+    assert p._current.priority == ALERT
+    assert p.pending() == 3
+    card.dismiss()
+    assert card.shown[-1].startswith("3 notifications\n")
+
+
+def test_alert_does_not_preempt_another_alert():
+    p, card = _presenter()
+    p.post("Fall detected", source="system", priority=ALERT)
+    p.post("Battery critical", source="system", priority=ALERT)
+    assert card.shown == ["Fall detected"]
+    card.dismiss()
+    assert card.shown == ["Fall detected", "Battery critical"]
@@ -0,0 +1,98 @@
+# test_pane_loader.py
+"""PaneLoader drops a pane's asyncio work when it's left, hibernated or unloaded."""
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("PyQt5.QtWidgets")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QStackedWidget, QWidget
+
+from async_runtime import AsyncRuntime
+from pane_loader import PaneLoader
+
+
+class SlowPane(QWidget):
+    """Asks for something that never arrives, like an LLM pane on bad Wi-Fi."""
+
+    def __init__(self, parent=None, loop=None):
+        super().__init__(parent)
+        self.loop = loop
+        self.waiting = False
+        self.got = []
+
+    def ask(self):
+        self.waiting = True
+        self.loop.submit(asyncio.sleep(60, "answer"), on_result=self.got.append,
+                         on_cancel=self._cancelled, owner=self)
+
+    def _cancelled(self):
+        self.waiting = False
+
+    def onHibernate(self):
+        pass
+
+    def onWake(self):
+        pass
+
+
+class Spec:
+    def __init__(self, id, module):
+        self.id, self.label, self.module, self.cls = id, id.title(), module, "SlowPane"
+
+    def load(self):
+        return SlowPane
+
+
+@pytest.fixture
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def loop():
+    rt = AsyncRuntime(post=lambda fn: fn())
+    yield rt
+    rt.shutdown()
+
+
+@pytest.fixture
+def loader(app, loop):
+    pages = QStackedWidget()
+    specs = [Spec("camera", None), Spec("llm", "slow_pane"), Spec("translator", "slow_pane")]
+    pl = PaneLoader(pages, specs, {"parent": None, "loop": loop}, on_home=lambda: None)
+    yield pl
+    pl.shutdown()
+    pages.deleteLater()
+
+
+def _open(loader, idx):
+    loader.show(idx)
+    page = loader.ensure(idx)
+    page.ask()
+    return page
+
+
+def test_leaving_a_pane_cancels_its_requests(loader, loop):
+    page = _open(loader, 1)
+    assert page.waiting and loop.pending() == 1
+    loader.show(0)
+    assert not page.waiting and loop.pending() == 0 and page.got == []
+
+
+def test_showing_the_same_pane_again_keeps_them(loader, loop):
+    page = _open(loader, 1)
+    loader.show(1)
+    assert page.waiting and loop.pending() == 1
+
+
+def test_hibernating_and_unloading_cancel_too(loader, loop):
+    llm = _open(loader, 1)
+    translator = _open(loader, 2)           # leaving llm cancelled its request
+    llm.ask()
+    loader._hibernate("llm")
+    assert not llm.waiting and translator.waiting
+    loader.unload(2)
+    assert not translator.waiting and loop.pending() == 0
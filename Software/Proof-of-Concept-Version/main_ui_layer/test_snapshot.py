@@ -0,0 +1,98 @@
+# test_snapshot.py
+"""SnapshotStore against a temp file: round trip, stale/damaged input, retries."""
+import snapshot
+from snapshot import SnapshotStore
+
+
+def _store(tmp_path):
+    return SnapshotStore(path=str(tmp_path / "snapshot.bin"))
+
+
+def test_state_survives_a_restart(tmp_path):
+    a = _store(tmp_path)
+    a.register("ui", lambda: {"pane": "weather", "idx": 2})
+    a.close()
+
+    got = []
+    b = _store(tmp_path)
+    assert b.peek("ui") == {"pane": "weather", "idx": 2}
+    b.register("ui", lambda: None, got.append)
+    assert got == [{"pane": "weather", "idx": 2}]
+
+
+def test_unclaimed_state_is_carried_forward(tmp_path):
+    a = _store(tmp_path)
+    a.register("pane:music", lambda: ["track", 42])
+    a.close()
+
+    b = _store(tmp_path)         # the music pane is never built this run
+    b.register("ui", lambda: "home")
+    b.close()
+
+    got = []
+    _store(tmp_path).register("pane:music", lambda: None, got.append)
+    assert got == [["track", 42]]
+
+
+def test_stale_provider_version_is_skipped(tmp_path):
+    a = _store(tmp_path)
+    a.register("ui", lambda: "old layout", version=1)
+    a.close()
+
+    got = []
+    _store(tmp_path).register("ui", lambda: None, got.append, version=2)
+    assert got == []
+
+
+def test_damaged_file_is_ignored(tmp_path):
+    a = _store(tmp_path)
+    a.register("ui", lambda: "home")
+    a.close()
+    path = tmp_path / "snapshot.bin"
+    blob = bytearray(path.read_bytes())
+    blob[-1] ^= 0xFF
+    path.write_bytes(bytes(blob))
+
+    assert _store(tmp_path).peek("ui") is None
+
+
+def test_state_that_is_not_plain_data_is_left_out(tmp_path):
+    a = _store(tmp_path)
+    a.register("bad", lambda: object())
+    a.register("ui", lambda: "home")
+    a.close()
+
+    b = _store(tmp_path)
+    assert b.peek("bad") is None
+    assert b.peek("ui") == "home"
+
+
+def test_unchanged_state_is_not_rewritten(tmp_path, monkeypatch):
+    writes = []
+    monkeypatch.setattr(snapshot, "atomic_write", lambda path, data: writes.append(data))
+    s = _store(tmp_path)
+    state = {"pane": "home"}
+    s.register("ui", lambda: state)
+    s.save(sync=True)
+    s.save(sync=True)
+    assert len(writes) == 1
+    state["pane"] = "weather"
+    s.save(sync=True)
+    assert len(writes) == 2
+
+
+def test_failed_write_is_retried_with_the_same_state(tmp_path, monkeypatch):
+    writes = []
+
+    def flaky(path, data):
+        writes.append(data)
+        if len(writes) == 1:
+            raise OSError("disk full")
+
+    monkeypatch.setattr(snapshot, "atomic_write", flaky)
+    s = _store(tmp_path)
+    s.register("ui", lambda: "home")
+    s.save()                    # on the writer thread
+    s._writer.shutdown(wait=True)
+    s.close()                   # same state: must still be written
+    assert len(writes) == 2 and writes[0] == writes[1]
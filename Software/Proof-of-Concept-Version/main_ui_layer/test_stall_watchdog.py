@@ -0,0 +1,61 @@
+# test_stall_watchdog.py
+"""StallWatchdog: idle while beats are fresh, stalls charged to our call site."""
+import os
+import threading
+import time
+
+import stall_watchdog as sw
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class CountingEvent(threading.Event):
+    def __init__(self):
+        super().__init__()
+        self.waits = 0
+
+    def wait(self, timeout=None):
+        self.waits += 1
+        return super().wait(timeout)
+
+
+def _watchdog(monkeypatch, threshold_s):
+    monkeypatch.setattr(sw.threading, "Event", CountingEvent)
+    dog = sw.StallWatchdog(threshold_s=threshold_s, interval_s=0.01, roots=[HERE])
+    monkeypatch.undo()
+    return dog
+
+
+def _frames(seconds, dog, frame_s=0.016):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        dog.beat()
+        time.sleep(frame_s)
+
+
+def _blocking_call(seconds):
+    time.sleep(seconds)
+
+
+def test_fresh_beats_wake_the_watchdog_once_per_threshold(monkeypatch):
+    dog = _watchdog(monkeypatch, threshold_s=0.2)
+    try:
+        _frames(1.0, dog)
+        assert dog._stop.waits <= 8         # ~5; polling at interval_s would be ~100
+        assert dog.stats()["stalls"] == 0
+    finally:
+        dog.close()
+
+
+def test_a_stall_is_charged_to_the_blocking_call(monkeypatch):
+    dog = _watchdog(monkeypatch, threshold_s=0.1)
+    try:
+        dog.beat()
+        _blocking_call(0.4)
+        _frames(0.2, dog)
+        assert dog.stats()["stalls"] == 1
+        (site, n, total, worst, leaf), = dog.ranked()
+        assert site.startswith("test_stall_watchdog.py:") and "_blocking_call" in site
+        assert 0.3 < worst < 0.6
+    finally:
+        dog.close()
@@ -0,0 +1,119 @@
+# test_timer_wheel.py
+"""TimerWheel on a simulated clock: periods, one-shots, coalescing, stop()."""
+import pytest
+
+from timer_wheel import TimerWheel, TICK_S
+
+
+class SimClock:
+    def __init__(self):
+        self.now = 1000.0           # anything but 0: the wheel works relative to t0
+
+    def __call__(self):
+        return self.now
+
+
+class Driver:
+    """Stands in for the Qt timer: jump the clock to each armed wakeup."""
+
+    def __init__(self, wheel, clock):
+        self.wheel = wheel
+        self.clock = clock
+        self.due = None
+        self.wakeups = 0
+        wheel.attach(self.arm)
+
+    def arm(self, delay_s):
+        self.due = None if delay_s is None else self.clock.now + delay_s
+
+    def run_until(self, t):
+        while self.due is not None and self.due <= t:
+            self.clock.now = self.due
+            self.wakeups += 1
+            self.wheel.wake()
+        self.clock.now = t
+
+
+def _wheel():
+    clock = SimClock()
+    wheel = TimerWheel(clock=clock)
+    return wheel, clock, Driver(wheel, clock)
+
+
+@pytest.mark.parametrize("interval_s", [0.016, 1 / 30, 0.1, 1.0, 15.0, 30.0, 300.0])
+def test_periodic_timers_keep_their_period(interval_s):
+    wheel, clock, driver = _wheel()
+    fired = []
+    t = wheel.every(interval_s, lambda: fired.append(clock.now - wheel.t0))
+    runs = 40
+    driver.run_until(wheel.t0 + interval_s * (runs + 0.5))
+    assert len(fired) == runs
+    slack = t.slack()
+    for k, at in enumerate(fired, start=1):
+        # never early, never later than the slack (plus one tick of rounding),
+        # and no drift: run k is due at k * interval on the wheel's clock
+        assert k * interval_s - 1e-9 <= at <= k * interval_s + slack + TICK_S + 1e-9
+
+
+@pytest.mark.parametrize("delay_s", [0.004, 0.2, 3.0, 60.0, 400.0, 1000.0])
+def test_one_shots_fire_once_within_slack(delay_s):
+    wheel, clock, driver = _wheel()
+    fired = []
+    t = wheel.after(delay_s, lambda: fired.append(clock.now - wheel.t0))
+    driver.run_until(wheel.t0 + delay_s * 3 + 1)
+    assert len(fired) == 1
+    assert delay_s - 1e-9 <= fired[0] <= delay_s + t.slack() + TICK_S + 1e-9
+    assert not t.isActive()
+    assert driver.due is None       # nothing left: the driver is disarmed
+
+
+def test_equal_and_multiple_intervals_share_wakeups():
+    wheel, clock, driver = _wheel()
+    calls = []
+    wheel.every(0.016, lambda: calls.append("frame"), slack_s=0)
+    wheel.every(1 / 30, lambda: calls.append("camera"), slack_s=0.016)
+    wheel.every(0.1, lambda: calls.append("assistant"), slack_s=0.016)
+    wheel.every(1.0, lambda: calls.append("status"))
+    driver.run_until(wheel.t0 + 10.0)
+    # the other timers ride on the frame ticks instead of adding their own
+    assert len(calls) > driver.wakeups
+    assert driver.wakeups <= calls.count("frame") + 1
+
+
+def test_stop_and_restart():
+    wheel, clock, driver = _wheel()
+    fired = []
+    t = wheel.timer(lambda: fired.append(clock.now), 100)
+    t.start()
+    driver.run_until(wheel.t0 + 0.35)
+    assert len(fired) == 3
+    t.stop()
+    driver.run_until(wheel.t0 + 1.0)
+    assert len(fired) == 3 and not t.isActive()
+    t.start(50)
+    driver.run_until(wheel.t0 + 1.2)
+    assert t.interval() == 50 and len(fired) == 3 + 4
+
+
+def test_stall_skips_missed_runs_but_keeps_phase():
+    wheel, clock, driver = _wheel()
+    fired = []
+    wheel.every(0.1, lambda: fired.append(clock.now - wheel.t0), slack_s=0)
+    driver.run_until(wheel.t0 + 0.25)
+    clock.now = wheel.t0 + 1.03         # GUI thread stuck for ~0.8 s
+    wheel.wake()
+    driver.run_until(wheel.t0 + 1.45)
+    assert len(fired) == 2 + 1 + 4      # one catch-up run, not eight
+    for at in fired[3:]:
+        assert abs(at / 0.1 - round(at / 0.1)) < 1e-6
+
+
+def test_callback_may_stop_another_timer_in_the_same_tick():
+    wheel, clock, driver = _wheel()
+    fired = []
+    b = wheel.timer(lambda: fired.append("b"), 100, slack_ms=0)
+    a = wheel.timer(lambda: (fired.append("a"), b.stop()), 100, slack_ms=0)
+    a.start()
+    b.start()
+    driver.run_until(wheel.t0 + 0.15)
+    assert fired == ["a"]
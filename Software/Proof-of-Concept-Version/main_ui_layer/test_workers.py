@@ -0,0 +1,58 @@
+# test_workers.py
+"""Supervisor with real child processes whose workers never come up."""
+import time
+
+import workers as wk
+
+
+# targets for the child processes (`python workers.py ... test_workers:<fn>`)
+
+def unavailable_worker(ch):
+    ch.send("error", error="ModuleNotFoundError: No module named 'mediapipe'")
+    return wk.UNAVAILABLE
+
+
+def crashing_worker(ch):
+    raise RuntimeError("boom")
+
+
+def _wait_state(sup, name, state, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while sup.state(name) != state and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return sup.state(name) == state
+
+
+def _cpu_over(seconds):
+    c0, t0 = time.process_time(), time.monotonic()
+    time.sleep(seconds)
+    return (time.process_time() - c0) / (time.monotonic() - t0)
+
+
+def test_unavailable_worker_is_not_restarted_and_supervisor_idles():
+    sup = wk.Supervisor(log=lambda *a: None)
+    sup.add("vision", "test_workers:unavailable_worker")
+    sup.start()
+    try:
+        assert _wait_state(sup, "vision", wk.UNAVAILABLE_STATE)
+        assert sup.workers["vision"].error.startswith("ModuleNotFoundError")
+        # nothing left to listen to: the supervisor must sleep, not spin
+        assert _cpu_over(1.0) < 0.1
+        assert sup.state("vision") == wk.UNAVAILABLE_STATE
+    finally:
+        sup.stop()
+
+
+def test_supervisor_idles_while_a_worker_is_in_backoff():
+    sup = wk.Supervisor(log=lambda *a: None)
+    sup.add("voice", "test_workers:crashing_worker")
+    sup.start()
+    try:
+        assert _wait_state(sup, "voice", wk.RESTARTING)
+        w = sup.workers["voice"]
+        assert w.restarts == 1 and w.next_start > time.monotonic() - 0.1
+        assert _cpu_over(0.5) < 0.1
+        # and it still restarts once the backoff is over
+        assert _wait_state(sup, "voice", wk.STARTING, timeout=3.0) or w.restarts >= 2
+    finally:
+        sup.stop()
@@ -0,0 +1,390 @@
+# timer_wheel.py
+"""
+One timer for the whole UI, so periodic work shares wakeups.
+
+Every QTimer, QTimer.singleShot and sleep loop wakes the process on its
+own schedule: the 16 ms frame tick, the camera at 30 fps, the assistant at
+10 fps, pane trackers, the status bar, notification polling, card hold
+timers... On the Zero 2W those separate wakeups cost battery even when
+each one does almost nothing. Everything here runs off a single Qt timer
+that is only armed for the next tick that actually has work:
+
+    from timer_wheel import wheel
+    h = wheel.every(1 / 30, self.update_frame, slack_s=1 / 60, owner=self)
+    wheel.after(0.2, self._frost.hide)
+    self.timer = wheel.timer(self.step, slack_ms=15, owner=self)    # QTimer-like:
+    self.timer.start(66); self.timer.stop(); self.timer.isActive()
+
+Timers are kept in a hierarchical wheel (4 levels x 64 slots, TICK_S = 4 ms
+resolution, ~18 h range); adding, stopping and firing are O(1) and far-off
+timers are cascaded down as their slot comes round.
+
+Coalescing: each timer may fire anywhere in [due, due + slack]. A timer
+joins a tick that is already armed inside that window if there is one,
+otherwise it lands on the coarsest power-of-two tick grid the window
+allows, so later timers can join it. Periodic timers are also phase
+aligned (their first due time is a multiple of the interval on the wheel's
+clock), so 16 ms, 32 ms and 1 s timers keep landing on the same ticks.
+Default slack is 10% of the interval; pass slack_s=0 for the frame tick.
+
+stats() reports wheel wakeups/s against callbacks/s (what separate timers
+would have cost) and voluntary context switches/s, the best proxy for CPU
+wakeups we can read without root (on Linux psutil reports the main, i.e.
+GUI, thread's).
+
+GUI thread only (callbacks run there). This module must stay free of a
+hard Qt import; attach_qt() drives it from a QTimer (done on first use
+once a QApplication exists, if main.py hasn't yet).
+"""
+import math
+import time
+from collections import deque
+
+import psutil
+
+TICK_S = 0.004
+BITS = 6
+SLOTS = 1 << BITS
+MASK = SLOTS - 1
+LEVELS = 4
+RANGE = 1 << (BITS * LEVELS)        # ticks the wheel can hold
+
+
+class Timer:
+    """Handle for one wheel timer; start/stop/isActive/setInterval mirror QTimer (ms)."""
+
+    def __init__(self, wheel, fn, interval_s=0.0, single_shot=False, slack_s=None, name=None):
+        self.wheel = wheel
+        self.fn = fn
+        self.interval_s = interval_s
+        self.single_shot = single_shot
+        self.slack_s = slack_s
+        self.name = name or getattr(fn, "__qualname__", "timer")
+        self.fired = 0
+        self.nominal = None         # when it's due on the wheel clock, before slack
+        self._k = 0                 # periodic: nominal = _k * interval_s
+        self.expires = None         # tick it will fire on
+        self._slot = None
+
+    # QTimer-compatible surface
+    def start(self, ms=None):
+        if ms is not None:
+            self.interval_s = ms / 1000
+        self.wheel._start(self)
+
+    def stop(self):
+        self.wheel._stop(self)
+
+    cancel = stop
+
+    def isActive(self):
+        return self._slot is not None
+
+    def setInterval(self, ms):
+        self.interval_s = ms / 1000
+        if self.isActive():
+            self.start()
+
+    def interval(self):
+        return int(self.interval_s * 1000)
+
+    def setSingleShot(self, on):
+        self.single_shot = bool(on)
+
+    def slack(self):
+        if self.slack_s is not None:
+            return self.slack_s
+        return self.interval_s * 0.1
+
+
+class TimerWheel:
+    def __init__(self, tick_s=TICK_S, clock=time.monotonic):
+        """clock: seconds, monotonic; tests pass a simulated one"""
+        self.tick_s = tick_s
+        self.clock = clock
+        self.t0 = clock()
+        self._tick = 0              # last tick processed
+        self._levels = [[[] for _ in range(SLOTS)] for _ in range(LEVELS)]
+        self._count = 0
+        self._periodic = set()
+        self._arm = None            # driver: arm(delay_s) / arm(None) to disarm
+        self._armed = None          # tick the driver is armed for
+        self._qt = None
+        self._advancing = False
+        self.wakeups = 0
+        self.fired = 0
+        self._log = deque(maxlen=8192)      # (t, callbacks run) per wakeup
+        self._proc = psutil.Process()
+        self._cs = None             # (t, voluntary ctx switches) at the last stats()
+
+    # ----- creating timers ----------------------------------------------------
+
+    def timer(self, fn, interval_ms=0, single_shot=False, slack_ms=None, owner=None):
+        """A stopped Timer to use like a QTimer: start(ms), stop(), isActive()."""
+        t = Timer(self, fn, interval_ms / 1000, single_shot,
+                  None if slack_ms is None else slack_ms / 1000)
+        self._own(t, owner)
+        return t
+
+    def every(self, interval_s, fn, slack_s=None, owner=None):
+        t = Timer(self, fn, interval_s, False, slack_s)
+        self._own(t, owner)
+        t.start()
+        return t
+
+    def after(self, delay_s, fn, slack_s=None, owner=None):
+        t = Timer(self, fn, delay_s, True, slack_s)
+        self._own(t, owner)
+        t.start()
+        return t
+
+    def _own(self, t, owner):
+        # QObject owners: stop with them, like a QTimer parented to them would
+        destroyed = getattr(owner, "destroyed", None)
+        if destroyed is not None:
+            destroyed.connect(lambda *_: t.stop())
+
+    # ----- scheduling -----------------------------------------------------------
+
+    def _ticks(self, now):
+        return int((now - self.t0) / self.tick_s + 1e-6)
+
+    def _start(self, t):
+        if t._slot is not None:
+            self._unlink(t)
+        now = self.clock() - self.t0
+        if t.single_shot or t.interval_s <= 0:
+            t.nominal = now + t.interval_s
+        else:
+            # phase-align to the wheel clock so equal / multiple intervals
+            # coincide; the first run is the next multiple strictly after now
+            t._k = int(now / t.interval_s + 1e-6) + 1
+            t.nominal = t._k * t.interval_s
+            self._periodic.add(t)
+        self._place(t)
+        if not self._advancing and (self._armed is None or t.expires < self._armed):
+            self._rearm()
+
+    def _stop(self, t):
+        self._periodic.discard(t)
+        if t._slot is not None:
+            self._unlink(t)
+            if not self._advancing and (self._count == 0 or t.expires == self._armed):
+                self._rearm()
+
+    def _place(self, t):
+        # (epsilon: 0.016 / 0.004 must come out as 4 ticks, not 5)
+        lo = max(math.ceil(t.nominal / self.tick_s - 1e-6), self._tick + 1)
+        hi = max(lo, int((t.nominal + t.slack()) / self.tick_s + 1e-6))
+        tick = None
+        # join an already armed tick inside the window
+        for k in range(lo, min(hi, self._tick + SLOTS - 1) + 1):
+            if self._levels[0][k & MASK]:
+                tick = k
+                break
+        if tick is None:
+            # else the coarsest grid point the window allows
+            g = 1 << max(0, (hi - lo + 1).bit_length())
+            while g > 1 and -(-lo // g) * g > hi:
+                g >>= 1
+            tick = -(-lo // g) * g
+        t.expires = tick
+        self._insert(t)
+
+    def _insert(self, t):
+        delta = t.expires - self._tick
+        if delta < SLOTS:
+            level, idx = 0, t.expires & MASK
+        else:
+            level = min(LEVELS - 1, (min(delta, RANGE - 1).bit_length() - 1) // BITS)
+            idx = (min(t.expires, self._tick + RANGE - 1) >> (BITS * level)) & MASK
+        t._slot = self._levels[level][idx]
+        t._slot.append(t)
+        self._count += 1
+
+    def _unlink(self, t):
+        t._slot.remove(t)
+        t._slot = None
+        self._count -= 1
+
+    # ----- running ------------------------------------------------------------
+
+    def advance(self, now=None):
+        """Run every timer due by `now`; returns how many callbacks ran."""
+        target = self._ticks(self.clock() if now is None else now)
+        ran = 0
+        self._advancing = True
+        try:
+            while self._tick < target:
+                if self._count == 0:
+                    self._tick = target
+                    break
+                self._tick += 1
+                tick = self._tick
+                if not tick & MASK:
+                    self._cascade(tick)
+                slot = self._levels[0][tick & MASK]
+                # one at a time: a callback may stop() a timer later in the slot
+                while slot:
+                    t = slot.pop(0)
+                    t._slot = None
+                    self._count -= 1
+                    if t.expires > tick:            # parked far ahead; not yet
+                        self._insert(t)
+                        continue
+                    if not t.single_shot and t.interval_s > 0:
+                        t._k += 1
+                        behind = target * self.tick_s - t._k * t.interval_s
+                        if behind > 0:
+                            # fell behind (a stall): skip the missed runs, like
+                            # QTimer, but stay on the same phase
+                            t._k += math.ceil(behind / t.interval_s)
+                        t.nominal = t._k * t.interval_s
+                        self._place(t)
+                    else:
+                        self._periodic.discard(t)
+                    t.fired += 1
+                    ran += 1
+                    try:
+                        t.fn()
+                    except Exception as e:
+                        print(f"[timers] ⚠️  {t.name} failed: {type(e).__name__}: {e}")
+        finally:
+            self._advancing = False
+        self.fired += ran
+        return ran
+
+    def _cascade(self, tick):
+        for level in range(1, LEVELS):
+            idx = (tick >> (BITS * level)) & MASK
+            slot = self._levels[level][idx]
+            moved, slot[:] = list(slot), []
+            for t in moved:
+                self._count -= 1
+                self._insert(t)
+            if idx:
+                break               # higher levels only wrap when this one does
+
+    def next_due(self):
+        """Tick of the next timer, or None when nothing is scheduled."""
+        if self._count == 0:
+            return None
+        best = None
+        for level in range(LEVELS):
+            shift = BITS * level
+            idx = (self._tick >> shift) & MASK
+            for k in range(1, SLOTS + 1):
+                slot = self._levels[level][(idx + k) & MASK]
+                if slot:
+                    first = min(t.expires for t in slot)
+                    if best is None or first < best:
+                        best = first
+                    break
+            # anything on the next level is due after its next cascade
+            nxt = ((self._tick >> (shift + BITS)) + 1) << (shift + BITS)
+            if best is not None and best < nxt:
+                break
+        return best
+
+    # ----- drivers ------------------------------------------------------------
+
+    def _rearm(self):
+        if self._arm is None and not self._auto_qt():
+            return
+        nxt = self.next_due()
+        self._armed = nxt
+        if nxt is None:
+            self._arm(None)
+        else:
+            self._arm(max(0.0, self.t0 + nxt * self.tick_s - self.clock()))
+
+    def wake(self):
+        """Driver callback: run what's due, then re-arm for the next tick."""
+        now = self.clock()
+        self._armed = None
+        self.wakeups += 1
+        ran = self.advance(now)
+        self._log.append((now, ran))
+        self._rearm()
+        return ran
+
+    def attach_qt(self, parent):
+        """Drive the wheel from one single-shot QTimer on `parent`."""
+        from PyQt5.QtCore import Qt, QTimer
+        if self._qt:
+            self._qt.stop()
+        qt = QTimer(parent)
+        qt.setSingleShot(True)
+        qt.setTimerType(Qt.PreciseTimer)
+        qt.timeout.connect(self.wake)
+
+        def arm(delay_s):
+            if delay_s is None:
+                qt.stop()
+            else:
+                qt.start(math.ceil(delay_s * 1000))     # never early: no empty wakeups
+
+        def detach(*_):
+            # parent deleted (e.g. the main window at exit): stop driving it
+            if self._qt is qt:
+                self._qt = self._arm = self._armed = None
+
+        qt.destroyed.connect(detach)
+        self._qt = qt
+        self._arm = arm
+        self._rearm()
+        return qt
+
+    def _auto_qt(self):
+        # modules may create timers before main.py attaches a parent
+        if self._qt is False:
+            return False
+        try:
+            from PyQt5.QtCore import QCoreApplication
+        except Exception:
+            self._qt = False        # headless: only attach() drivers
+            return False
+        if QCoreApplication.instance() is None:
+            return False
+        self.attach_qt(None)
+        return True
+
+    def attach(self, arm):
+        """Any other driver: arm(delay_s or None); it must call wake() when that elapses."""
+        self._arm = arm
+        self._rearm()
+
+    # ----- reporting ----------------------------------------------------------
+
+    def stats(self, window_s=10.0):
+        now = self.clock()
+        span = max(1e-3, min(window_s, now - self.t0))
+        recent = [n for t, n in self._log if t >= now - window_s]
+        out = {"timers": self._count, "periodic": len(self._periodic),
+               "wakeups_s": round(len(recent) / span, 1),
+               "callbacks_s": round(sum(recent) / span, 1)}
+        out["coalesced"] = round(1 - out["wakeups_s"] / out["callbacks_s"], 3) if out["callbacks_s"] else 0.0
+        cs = self._proc.num_ctx_switches().voluntary
+        if self._cs is not None and now > self._cs[0]:
+            out["ctx_switches_s"] = round((cs - self._cs[1]) / (now - self._cs[0]), 1)
+        self._cs = (now, cs)
+        return out
+
+    def timers(self):
+        """[(name, interval ms, slack ms, times fired)] for periodic timers, most frequent first."""
+        rows = [(t.name, round(t.interval_s * 1000, 1), round(t.slack() * 1000, 1), t.fired)
+                for t in self._periodic]
+        rows.sort(key=lambda r: r[1])
+        return rows
+
+    def report(self):
+        s = self.stats()
+        lines = [f"timer wheel: {s['wakeups_s']} wakeups/s for {s['callbacks_s']} callbacks/s"
+                 + (f", {s['ctx_switches_s']} ctx switches/s" if "ctx_switches_s" in s else ""),
+                 f"{'every ms':>9} {'slack ms':>9} {'fired':>8}  timer"]
+        for name, every, slack, fired in self.timers():
+            lines.append(f"{every:9.1f} {slack:9.1f} {fired:8d}  {name}")
+        return "\n".join(lines)
+
+
+wheel = TimerWheel()
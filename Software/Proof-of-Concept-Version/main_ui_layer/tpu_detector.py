@@ -1,6 +1,9 @@
 # tpu_detector.py
 
 import numpy as np
+
+from boot_profiler import profiler
+
 try:
     from pycoral.utils.edgetpu import make_interpreter
     from pycoral.adapters import common, detect
@@ -23,8 +26,9 @@ class TPUDetector:
 
         if EDGE_SUPPORTED:
             try:
-                self.interpreter = make_interpreter(model_path)
-                self.interpreter.allocate_tensors()
+                with profiler.phase("TPUDetector model", "model"):
+                    self.interpreter = make_interpreter(model_path)
+                    self.interpreter.allocate_tensors()
                 self.use_tpu = True
             except Exception as e:
                 print(f"⚠️ TPUDetector failed to load {model_path}: {e}")
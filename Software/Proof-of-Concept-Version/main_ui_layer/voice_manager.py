@@ -6,6 +6,17 @@ import sounddevice as sd
 from vosk import Model, KaldiRecognizer
 from PyQt5.QtCore import QThread, pyqtSignal
 
+from boot_profiler import profiler
+
+DEFAULT_MODEL = "models/vosk-model-small-en-us-0.15"
+
+
+def load_model(model_path: str = DEFAULT_MODEL):
+    """Load the Vosk model; safe to call off the GUI thread (see warmup.py)."""
+    with profiler.phase("Vosk Model", "model"):
+        return Model(model_path)
+
+
 class VoiceManager(QThread):
     """
     Runs Vosk STT on the mic once triggered.
@@ -14,11 +25,13 @@ class VoiceManager(QThread):
     commandRecognized = pyqtSignal(str)
 
     def __init__(self,
-                 model_path: str = "models/vosk-model-small-en-us-0.15"):
+                 model_path: str = DEFAULT_MODEL,
+                 model=None):
+        """`model`: an already loaded vosk Model (e.g. from warm-up)."""
         super().__init__()
         self.q = queue.Queue()
         try:
-            self.model = Model(model_path)
+            self.model = model if model is not None else load_model(model_path)
             self.rec = KaldiRecognizer(self.model, 16000)
             self.running = False
         except Exception as e:
@@ -0,0 +1,131 @@
+# warmup.py
+"""
+Background warm-up of heavy resources while the splash is up.
+
+Jobs (Vosk model, TPU interpreter, MediaPipe graphs, icon atlas, ...) run
+in a small thread pool as soon as VisionAriesUI starts building. Results
+come back on the GUI thread via Qt signals, so callers can either poll
+
+    warmup.state("vosk")        # "warming" | "ready" | "failed" | None
+    warmup.get("vosk")          # the loaded object, or None
+
+or register `warmup.when_ready("vosk", callback)`.
+
+Threads rather than processes: interpreters and models aren't picklable, and
+the loaders spend their time in C code (file I/O, graph setup) with the GIL
+released anyway.
+"""
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from boot_profiler import profiler
+
+WARMING, READY, FAILED = "warming", "ready", "failed"
+
+
+class WarmupOrchestrator(QObject):
+    progress = pyqtSignal(str, int, int)    # job name, done, total
+    jobReady = pyqtSignal(str, object)      # job name, value
+    jobFailed = pyqtSignal(str, str)        # job name, error
+    allDone = pyqtSignal()
+
+    # emitted from worker threads; queued onto the GUI thread
+    _finished = pyqtSignal(str, object, str, float)
+
+    def __init__(self, max_workers=3, parent=None):
+        super().__init__(parent)
+        self.max_workers = max_workers
+        self._pool = None
+        self._states = {}       # name -> WARMING / READY / FAILED
+        self._values = {}
+        self._errors = {}
+        self._waiters = {}      # name -> [callback(value)]
+        self._finished.connect(self._onFinished)
+
+    # ----- submitting -----------------------------------------------------
+
+    def start(self, jobs):
+        """
+        jobs: {name: zero-arg callable}. Names already submitted are skipped,
+        so calling this again (e.g. a second window) is harmless.
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.max_workers,
+                                            thread_name_prefix="warmup")
+        for name, loader in jobs.items():
+            if name in self._states:
+                continue
+            self._states[name] = WARMING
+            self._pool.submit(self._run, name, loader)
+        self.progress.emit("", self.done_count(), len(self._states))
+
+    def _run(self, name, loader):
+        t0 = time.perf_counter()
+        try:
+            with profiler.phase(f"warmup:{name}", "warmup"):
+                value = loader()
+            err = ""
+        except Exception as e:
+            traceback.print_exc()
+            value, err = None, f"{type(e).__name__}: {e}"
+        self._finished.emit(name, value, err, time.perf_counter() - t0)
+
+    def _onFinished(self, name, value, err, secs):
+        if err:
+            self._states[name] = FAILED
+            self._errors[name] = err
+            print(f"⚠️ warm-up {name} failed after {secs:.2f}s: {err}")
+            self.jobFailed.emit(name, err)
+        else:
+            self._states[name] = READY
+            self._values[name] = value
+            self.jobReady.emit(name, value)
+        for cb in self._waiters.pop(name, []):
+            cb(value)
+        self.progress.emit(name, self.done_count(), len(self._states))
+        if self.done_count() == len(self._states):
+            self.allDone.emit()
+
+    # ----- querying -------------------------------------------------------
+
+    def state(self, name):
+        return self._states.get(name)
+
+    def is_warming(self, name):
+        return self._states.get(name) == WARMING
+
+    def get(self, name):
+        return self._values.get(name)
+
+    def error(self, name):
+        return self._errors.get(name)
+
+    def busy(self):
+        return any(s == WARMING for s in self._states.values())
+
+    def failed_jobs(self):
+        return [n for n, s in self._states.items() if s == FAILED]
+
+    def done_count(self):
+        return sum(1 for s in self._states.values() if s != WARMING)
+
+    def when_ready(self, name, callback):
+        """
+        Call `callback(value)` on the GUI thread once `name` has finished
+        (value is None if it failed). Runs immediately if it already has.
+        """
+        if self._states.get(name) == WARMING:
+            self._waiters.setdefault(name, []).append(callback)
+        else:
+            callback(self._values.get(name))
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Shared instance, like sprite_cache.sprites
+warmup = WarmupOrchestrator()
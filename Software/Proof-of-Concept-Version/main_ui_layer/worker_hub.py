@@ -0,0 +1,165 @@
+# worker_hub.py
+"""
+Qt side of workers.py: owns the Supervisor and the camera FrameRing and turns
+worker messages into signals on the GUI thread.
+
+    ARIES_WORKERS=vision,voice python main.py    # default
+    ARIES_WORKERS=vision ...                     # voice stays in-process
+    ARIES_WORKERS=off ...                        # everything in-process
+
+Analyses are refcounted: panes call acquire("hands", self) while they
+need landmarks (acquire("detector", self) for Edge TPU detections) and
+release(...) when they hibernate or go away; the vision worker only keeps a
+MediaPipe graph / TPU interpreter and only analyses frames while the count
+is > 0.
+set_cadence(fps) and set_voice_mode("push" | "hotword") come from the power
+profile (power_profiles.py). After a worker restart the current wants,
+cadence and voice mode are sent again.
+"""
+import os
+import threading
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+import workers as wk
+
+FRAME_CAPACITY = 1280 * 720 * 3     # largest camera frame the ring accepts
+
+
+class WorkerHub(QObject):
+    handsReady = pyqtSignal(int, object)        # frame seq, [[(x, y, z) * 21], ...]
+    detectionsReady = pyqtSignal(int, object)   # frame seq, [(xmin, ymin, xmax, ymax, id, score)]
+    voiceText = pyqtSignal(str)
+    workerState = pyqtSignal(str, str)          # name, wk.STARTING / READY / ...
+
+    # emitted from the supervisor thread; queued onto the GUI thread
+    _message = pyqtSignal(str, object)
+    _state = pyqtSignal(str, str)
+
+    def __init__(self, names=("vision", "voice"), parent=None):
+        super().__init__(parent)
+        self.names = tuple(names)
+        self.ring = wk.FrameRing.create(capacity=FRAME_CAPACITY) if "vision" in names else None
+        self.sup = wk.Supervisor(on_message=self._message.emit, on_state=self._onStateThread)
+        if "vision" in names:
+            self.sup.add("vision", "workers:vision_worker", ring=self.ring.name)
+        if "voice" in names:
+            self.sup.add("voice", "workers:voice_worker")
+        self.latest_hands = (0, [])
+        self.latest_detections = (0, [])
+        self._holders = {}                      # what -> {id(owner)}
+        self._cadence = None                    # vision fps, None = the worker's default
+        self._voice_mode = "push"
+        self._settled = {n: threading.Event() for n in names}
+        self._message.connect(self._onMessage)
+        self._state.connect(self._onState)
+
+    def start(self):
+        self.sup.start()
+
+    def state(self, name):
+        return self.sup.state(name)
+
+    def ready(self, name):
+        return self.sup.state(name) == wk.READY
+
+    def active(self, name):
+        """Running or coming back: callers should use the worker, not a local copy."""
+        return self.sup.state(name) in (wk.STARTING, wk.READY, wk.RESTARTING)
+
+    def wait_ready(self, name, timeout=wk.START_S):
+        """Block (warm-up thread) until `name` is ready or unavailable; True if ready."""
+        ev = self._settled.get(name)
+        if ev is None:
+            return False
+        ev.wait(timeout)
+        return self.ready(name)
+
+    # ----- camera frames --------------------------------------------------
+
+    def publish(self, frame):
+        """CameraFeed hook: hand a BGR frame to the vision worker."""
+        if self.ring is None or not self.ready("vision"):
+            return 0
+        try:
+            return self.ring.write(frame)
+        except ValueError as e:
+            print(f"[workers] ⚠️  {e}; vision worker disabled")
+            self.ring = None
+            return 0
+
+    # ----- analyses -------------------------------------------------------
+
+    def acquire(self, what, owner):
+        holders = self._holders.setdefault(what, set())
+        if not holders:
+            self.sup.send("vision", cmd="enable", what=what, on=True)
+        holders.add(id(owner))
+
+    def release(self, what, owner):
+        holders = self._holders.get(what, set())
+        if id(owner) in holders:
+            holders.discard(id(owner))
+            if not holders:
+                self.sup.send("vision", cmd="enable", what=what, on=False)
+
+    def set_cadence(self, fps):
+        """How many frames a second the vision worker analyses."""
+        self._cadence = fps
+        self.sup.send("vision", cmd="cadence", fps=fps)
+
+    def listen(self):
+        """One utterance from the voice worker; arrives as voiceText."""
+        return self.sup.send("voice", cmd="listen")
+
+    def set_voice_mode(self, mode):
+        """
+        "hotword": mic always open, what's said after the hotword arrives
+        as voiceText; "push": the mic only opens on listen().
+        """
+        self._voice_mode = mode
+        self.sup.send("voice", cmd="mode", mode=mode)
+
+    # ----- supervisor callbacks -------------------------------------------
+
+    def _onStateThread(self, name, state):
+        if state in (wk.READY, wk.UNAVAILABLE_STATE, wk.STOPPED):
+            self._settled[name].set()
+        self._state.emit(name, state)
+
+    def _onState(self, name, state):
+        if state == wk.READY and name == "vision":
+            for what, holders in self._holders.items():
+                if holders:
+                    self.sup.send("vision", cmd="enable", what=what, on=True)
+            if self._cadence is not None:
+                self.sup.send("vision", cmd="cadence", fps=self._cadence)
+        elif state == wk.READY and name == "voice" and self._voice_mode != "push":
+            self.sup.send("voice", cmd="mode", mode=self._voice_mode)
+        self.workerState.emit(name, state)
+
+    def _onMessage(self, name, msg):
+        kind = msg.get("type")
+        if kind == "hands":
+            self.latest_hands = (msg["seq"], msg["hands"])
+            self.handsReady.emit(msg["seq"], msg["hands"])
+        elif kind == "detections":
+            self.latest_detections = (msg["seq"], msg["objects"])
+            self.detectionsReady.emit(msg["seq"], msg["objects"])
+        elif kind == "text":
+            self.voiceText.emit(msg.get("text", ""))
+
+    def shutdown(self):
+        self.sup.stop()
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+
+
+def hub_from_env():
+    """WorkerHub for ARIES_WORKERS (default "vision,voice"), or None when off."""
+    spec = os.getenv("ARIES_WORKERS", "vision,voice").strip().lower()
+    if spec in ("", "0", "off", "none"):
+        return None
+    names = [n for n in (s.strip() for s in spec.split(",")) if n in ("vision", "voice")]
+    return WorkerHub(names) if names else None
@@ -0,0 +1,517 @@
+# workers.py
+"""
+Vision and voice in their own processes, so MediaPipe, the TPU detector and
+Vosk decoding stop competing with Qt painting for one GIL.
+
+    camera (GUI process) --FrameRing (shared memory)--> vision worker
+    GUI process <--Connection (socketpair, pickled dicts)--> every worker
+
+FrameRing is a fixed ring of frame slots in multiprocessing.shared_memory.
+The camera writes each BGR frame into the next slot and bumps a sequence
+number; the vision worker only ever reads the newest slot, so it drops frames
+instead of queueing them when it falls behind. A slot is stamped with its
+sequence number after the pixels are written and checked again after the
+copy, so a read torn by the writer lapping the ring is discarded.
+
+Results and commands are small dicts over a socketpair Connection:
+
+    worker -> GUI   {"type": "ready"} / "heartbeat" / "error" / "hands" /
+                    "detections" / "text", ...
+    GUI -> worker   {"cmd": "stop"} / "enable" / "cadence" / "listen" / "mode"
+
+Supervisor starts each worker as `python workers.py ...` (not a
+multiprocessing fork: forking a process with Qt threads is unsafe, and the
+spawn start method would re-import main.py in every child), watches for
+exits, EOF and missed heartbeats, and restarts crashed or hung workers with
+exponential backoff. A worker that exits with UNAVAILABLE (missing module or
+model) is not restarted; callers fall back to running in-process.
+
+This module must stay free of Qt: the workers import it.
+"""
+import importlib
+import json
+import os
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from multiprocessing.connection import Connection, wait
+
+import numpy as np
+
+WORKER_SCRIPT = os.path.abspath(__file__)
+UNAVAILABLE = 3         # worker exit code: don't restart me
+
+HEARTBEAT_S = 1.0
+HANG_S = 10.0           # no message for this long once ready -> restart
+START_S = 90.0          # model loading on a Zero 2W is slow
+STABLE_S = 30.0         # ready this long -> backoff resets
+MAX_BACKOFF_S = 30.0
+POLL_S = 0.25           # supervisor checks states at least this often
+
+STARTING, READY, RESTARTING, UNAVAILABLE_STATE, STOPPED = (
+    "starting", "ready", "restarting", "unavailable", "stopped")
+
+
+# ----- shared-memory frame ring ----------------------------------------------
+
+_HEADER = struct.Struct("<4sIIQ")       # magic, slots, slot capacity, newest seq
+_SEQ_AT = 12
+_SLOT = struct.Struct("<QdIII")         # seq, timestamp, h, w, channels
+_MAGIC = b"ARF1"
+_ALIGN = 64
+
+
+def _align(n):
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class FrameRing:
+    def __init__(self, shm, owner):
+        self.shm = shm
+        self.owner = owner
+        magic, self.slots, self.capacity, _ = _HEADER.unpack_from(shm.buf, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{shm.name} is not a frame ring")
+        self.stride = _align(_SLOT.size + self.capacity)
+
+    @classmethod
+    def create(cls, slots=4, capacity=960 * 540 * 3):
+        """capacity: bytes per frame; larger frames are rejected by write()."""
+        size = _align(_HEADER.size) + slots * _align(_SLOT.size + capacity)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        _HEADER.pack_into(shm.buf, 0, _MAGIC, slots, capacity, 0)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        shm = shared_memory.SharedMemory(name=name)
+        # the creator owns the segment; don't let this process' resource
+        # tracker unlink it when the worker exits
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return cls(shm, owner=False)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def seq(self):
+        return struct.unpack_from("<Q", self.shm.buf, _SEQ_AT)[0]
+
+    def _offset(self, seq):
+        return _align(_HEADER.size) + (seq % self.slots) * self.stride
+
+    def write(self, frame, ts=None):
+        """Publish `frame` (uint8, HxW or HxWxC); returns its sequence number."""
+        frame = np.ascontiguousarray(frame, dtype=np.uint8)
+        if frame.nbytes > self.capacity:
+            raise ValueError(f"frame {frame.shape} exceeds ring capacity {self.capacity} B")
+        buf = self.shm.buf
+        seq = self.seq + 1
+        off = self._offset(seq)
+        _SLOT.pack_into(buf, off, 0, 0.0, 0, 0, 0)         # slot is being rewritten
+        dst = np.ndarray(frame.shape, np.uint8, buffer=buf, offset=off + _SLOT.size)
+        dst[...] = frame
+        del dst
+        h, w = frame.shape[:2]
+        c = frame.shape[2] if frame.ndim == 3 else 1
+        _SLOT.pack_into(buf, off, seq, time.time() if ts is None else ts, h, w, c)
+        struct.pack_into("<Q", buf, _SEQ_AT, seq)
+        return seq
+
+    def read(self, after=0):
+        """(seq, timestamp, frame copy) for the newest frame after `after`, or None."""
+        seq = self.seq
+        if seq <= after:
+            return None
+        buf = self.shm.buf
+        off = self._offset(seq)
+        stamp, ts, h, w, c = _SLOT.unpack_from(buf, off)
+        if stamp != seq:
+            return None
+        shape = (h, w, c) if c > 1 else (h, w)
+        frame = np.ndarray(shape, np.uint8, buffer=buf, offset=off + _SLOT.size).copy()
+        if _SLOT.unpack_from(buf, off)[0] != seq:
+            return None     # the writer lapped us mid-copy
+        return seq, ts, frame
+
+    def close(self):
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+# ----- worker side ------------------------------------------------------------
+
+class Channel:
+    """A worker's end of the pipe: send results, poll commands, heartbeat."""
+
+    def __init__(self, name, conn):
+        self.name = name
+        self.conn = conn
+        self.stopping = False
+        self._last_send = 0.0
+
+    def send(self, type, **msg):
+        msg["type"] = type
+        try:
+            self.conn.send(msg)
+        except OSError:
+            self.stopping = True    # GUI process is gone
+        self._last_send = time.monotonic()
+
+    def tick(self):
+        if time.monotonic() - self._last_send >= HEARTBEAT_S:
+            self.send("heartbeat")
+
+    def commands(self, timeout=0.0):
+        """Pending commands; waits up to `timeout` for the first one."""
+        out = []
+        try:
+            while not self.stopping and self.conn.poll(timeout):
+                cmd = self.conn.recv()
+                timeout = 0.0
+                if cmd.get("cmd") == "stop":
+                    self.stopping = True
+                else:
+                    out.append(cmd)
+        except (EOFError, OSError):
+            self.stopping = True
+        return out
+
+
+def vision_worker(ch, ring, hands=False, detector=False, max_hands=1,
+                  min_confidence=0.6, fps=15,
+                  detector_model="models/yolo_nano_edgetpu.tflite"):
+    """
+    Hand landmarks (MediaPipe) and Edge TPU detections on the newest camera
+    frame. Each analysis runs only while enabled ({"cmd": "enable", "what":
+    "hands", "on": True}); the Hands graph is dropped again when nobody wants
+    it. {"cmd": "cadence", "fps": 2} changes how often it analyses (power
+    profiles). Results are tagged with the frame's ring sequence number.
+    """
+    try:
+        import cv2
+        import mediapipe as mp
+    except ImportError as e:
+        ch.send("error", error=f"{type(e).__name__}: {e}")
+        return UNAVAILABLE
+    frames = FrameRing.attach(ring)
+    want = {"hands": hands, "detector": detector}
+    graph = det = None
+    last = 0
+    period = 1.0 / fps
+    pending = []            # commands that arrived while waiting
+    ch.send("ready")
+    try:
+        while not ch.stopping:
+            cmds, pending = pending + ch.commands(), []
+            for cmd in cmds:
+                if cmd.get("cmd") == "enable" and cmd.get("what") in want:
+                    want[cmd["what"]] = bool(cmd.get("on"))
+                elif cmd.get("cmd") == "cadence" and cmd.get("fps", 0) > 0:
+                    period = 1.0 / cmd["fps"]
+            if want["hands"] and graph is None:
+                graph = mp.solutions.hands.Hands(
+                    static_image_mode=False, max_num_hands=max_hands,
+                    min_detection_confidence=min_confidence,
+                    min_tracking_confidence=min_confidence)
+            elif not want["hands"] and graph is not None:
+                graph.close()
+                graph = None
+            if want["detector"] and det is None:
+                from tpu_detector import TPUDetector
+                det = TPUDetector(model_path=detector_model)
+                if not det.use_tpu:
+                    want["detector"] = False
+            if graph is None and not want["detector"]:
+                pending += ch.commands(timeout=HEARTBEAT_S)   # idle until asked for something
+                ch.tick()
+                continue
+
+            got = frames.read(last)
+            if got is None:
+                pending += ch.commands(timeout=0.005)
+                ch.tick()
+                continue
+            t0 = time.monotonic()
+            last, ts, frame = got
+            if graph is not None:
+                res = graph.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+                found = [[(p.x, p.y, p.z) for p in h.landmark]
+                         for h in (res.multi_hand_landmarks or [])]
+                ch.send("hands", seq=last, ts=ts, hands=found)
+            if want["detector"] and det is not None:
+                ch.send("detections", seq=last, ts=ts, objects=det.detect(frame))
+            ch.tick()
+            spare = period - (time.monotonic() - t0)
+            if spare > 0:
+                pending += ch.commands(timeout=spare)
+    finally:
+        if graph is not None:
+            graph.close()
+        frames.close()
+    return 0
+
+
+def voice_worker(ch, model_path="models/vosk-model-small-en-us-0.15",
+                 samplerate=16000, max_listen_s=8.0, mode="push", hotword="aries"):
+    """
+    Vosk on the mic; each {"cmd": "listen"} yields one {"type": "text"}.
+
+    {"cmd": "mode", "mode": "hotword"} keeps the mic open and decoding, and
+    an utterance starting with `hotword` is sent as text too (what follows
+    it; the hotword alone waits for the next utterance, as "listen" does).
+    That costs a core on a Zero 2W, so power profiles switch back to "push":
+    the mic is only opened on "listen".
+    """
+    try:
+        import queue
+        import sounddevice as sd
+        from vosk import Model, KaldiRecognizer
+        model = Model(model_path)
+    except Exception as e:
+        ch.send("error", error=f"{type(e).__name__}: {e}")
+        return UNAVAILABLE
+    q = queue.Queue()
+    stream = rec = None
+    until = 0.0             # taking one utterance until then ("listen")
+    ch.send("ready")
+    try:
+        while not ch.stopping:
+            for cmd in ch.commands(timeout=0 if stream is not None else HEARTBEAT_S):
+                if cmd.get("cmd") == "listen":
+                    until = time.monotonic() + max_listen_s
+                elif cmd.get("cmd") == "mode" and cmd.get("mode") in ("push", "hotword"):
+                    mode = cmd["mode"]
+            ch.tick()
+            if (mode == "hotword" or until) and stream is None:
+                rec = KaldiRecognizer(model, samplerate)
+                stream = sd.RawInputStream(samplerate=samplerate, blocksize=8000,
+                                           dtype="int16", channels=1,
+                                           callback=lambda data, *_: q.put(bytes(data)))
+                stream.start()
+            elif mode == "push" and not until and stream is not None:
+                stream.close()
+                stream = None
+                while not q.empty():
+                    q.get_nowait()
+            if stream is None:
+                continue
+
+            try:
+                data = q.get(timeout=0.5)
+            except queue.Empty:
+                data = None
+            text = ""
+            if data is not None and rec.AcceptWaveform(data):
+                text = json.loads(rec.Result()).get("text", "").strip()
+            if until:
+                if not text and time.monotonic() >= until:
+                    text = json.loads(rec.FinalResult()).get("text", "").strip()
+                    rec = KaldiRecognizer(model, samplerate)
+                elif not text:
+                    continue
+                until = 0.0
+                ch.send("text", text=text)
+            elif text == hotword:
+                until = time.monotonic() + max_listen_s
+            elif text.startswith(hotword + " "):
+                ch.send("text", text=text[len(hotword):].strip())
+    finally:
+        if stream is not None:
+            stream.close()
+    return 0
+
+
+def _child_main(argv):
+    name, fd, target, opts = argv[0], int(argv[1]), argv[2], json.loads(argv[3])
+    module, func = target.split(":")
+    ch = Channel(name, Connection(fd))
+    try:
+        return getattr(importlib.import_module(module), func)(ch, **opts) or 0
+    except KeyboardInterrupt:
+        return 0
+
+
+# ----- supervisor (GUI process) -----------------------------------------------
+
+class _Worker:
+    def __init__(self, name, target, opts, restart):
+        self.name = name
+        self.target = target
+        self.opts = opts
+        self.restart = restart
+        self.proc = None
+        self.conn = None
+        self.lock = threading.Lock()
+        self.state = STOPPED
+        self.error = ""
+        self.restarts = 0
+        self.backoff = 1.0
+        self.started = 0.0
+        self.ready_at = 0.0
+        self.last_msg = 0.0
+        self.next_start = 0.0
+
+
+class Supervisor:
+    def __init__(self, on_message=None, on_state=None, hang_s=HANG_S, log=print):
+        """
+        on_message(name, msg) / on_state(name, state) run on the supervisor's
+        thread; Qt callers should forward them through a signal.
+        """
+        self.on_message = on_message or (lambda name, msg: None)
+        self.on_state = on_state or (lambda name, state: None)
+        self.hang_s = hang_s
+        self.log = log
+        self.workers = {}
+        self._stopping = False
+        self._thread = None
+
+    def add(self, name, target, restart=True, **opts):
+        """target: "module:function" taking (Channel, **opts); opts must be JSON-able."""
+        self.workers[name] = _Worker(name, target, opts, restart)
+
+    def start(self):
+        for w in self.workers.values():
+            self._spawn(w)
+        self._thread = threading.Thread(target=self._pump, name="supervisor", daemon=True)
+        self._thread.start()
+
+    def state(self, name):
+        w = self.workers.get(name)
+        return w.state if w else None
+
+    def send(self, name, **msg):
+        """Queue a command for worker `name`; False if it isn't running."""
+        w = self.workers.get(name)
+        if w is None:
+            return False
+        with w.lock:
+            if w.conn is None:
+                return False
+            try:
+                w.conn.send(msg)
+                return True
+            except OSError:
+                return False
+
+    def _set_state(self, w, state):
+        if state != w.state:
+            w.state = state
+            self.on_state(w.name, state)
+
+    def _spawn(self, w):
+        parent, child = socket.socketpair()
+        try:
+            w.proc = subprocess.Popen(
+                [sys.executable, WORKER_SCRIPT, w.name, str(child.fileno()),
+                 w.target, json.dumps(w.opts)],
+                pass_fds=(child.fileno(),))
+        except OSError as e:
+            parent.close()
+            w.error = str(e)
+            self._set_state(w, UNAVAILABLE_STATE)
+            return
+        finally:
+            child.close()
+        with w.lock:
+            w.conn = Connection(parent.detach())
+        w.started = w.last_msg = time.monotonic()
+        self._set_state(w, STARTING)
+
+    def _reap(self, w, why):
+        with w.lock:
+            if w.conn is not None:
+                w.conn.close()
+                w.conn = None
+        code = None
+        if w.proc is not None:
+            try:
+                # EOF usually means it's exiting; give it a moment to report why
+                w.proc.wait(0.5)
+            except subprocess.TimeoutExpired:
+                w.proc.kill()
+            code = w.proc.wait()
+            w.proc = None
+        if self._stopping:
+            self._set_state(w, STOPPED)
+        elif code == UNAVAILABLE or not w.restart:
+            self.log(f"[workers] {w.name} unavailable: {w.error or why}")
+            self._set_state(w, UNAVAILABLE_STATE)
+        else:
+            w.restarts += 1
+            w.next_start = time.monotonic() + w.backoff
+            self.log(f"[workers] ⚠️  {w.name} {why} (exit {code}); "
+                     f"restart #{w.restarts} in {w.backoff:.0f}s")
+            w.backoff = min(w.backoff * 2, MAX_BACKOFF_S)
+            self._set_state(w, RESTARTING)
+
+    def _handle(self, w, msg):
+        w.last_msg = time.monotonic()
+        kind = msg.get("type")
+        if kind == "heartbeat":
+            return
+        if kind == "ready":
+            w.ready_at = w.last_msg
+            self._set_state(w, READY)
+        elif kind == "error":
+            w.error = msg.get("error", "")
+        self.on_message(w.name, msg)
+
+    def _pump(self):
+        while not self._stopping:
+            live = {w.conn: w for w in self.workers.values() if w.conn is not None}
+            if live:
+                ready = wait(list(live), timeout=POLL_S)
+            else:
+                # nothing to listen to (all unavailable or in backoff): sleep
+                # until the next restart is due instead of spinning
+                ready = ()
+                now = time.monotonic()
+                due = [w.next_start - now for w in self.workers.values()
+                       if w.state == RESTARTING]
+                time.sleep(max(0.0, min([POLL_S] + due)))
+            for conn in ready:
+                w = live[conn]
+                try:
+                    while conn.poll():
+                        self._handle(w, conn.recv())
+                except (EOFError, OSError):
+                    self._reap(w, "closed its pipe")
+            now = time.monotonic()
+            for w in self.workers.values():
+                if w.state == RESTARTING and now >= w.next_start:
+                    self._spawn(w)
+                elif w.proc is not None and w.proc.poll() is not None:
+                    self._reap(w, "exited")
+                elif w.state == READY and now - w.last_msg > self.hang_s:
+                    self._reap(w, f"silent for {now - w.last_msg:.0f}s")
+                elif w.state == STARTING and now - w.started > START_S:
+                    self._reap(w, "never became ready")
+                elif w.state == READY and now - w.ready_at > STABLE_S:
+                    w.backoff = 1.0
+
+    def stop(self, timeout=2.0):
+        self._stopping = True
+        for name in self.workers:
+            self.send(name, cmd="stop")
+        if self._thread is not None:
+            self._thread.join(timeout)
+        deadline = time.monotonic() + timeout
+        for w in self.workers.values():
+            if w.proc is not None:
+                try:
+                    w.proc.wait(max(0.0, deadline - time.monotonic()))
+                except subprocess.TimeoutExpired:
+                    pass
+            self._reap(w, "stopped")
+
+
+if __name__ == "__main__":
+    sys.exit(_child_main(sys.argv[1:]))
@@ -1,30 +1,53 @@
 # apps/__init__.py
-from .base_pane            import BasePane
-from .assistant_pane       import AssistantPane
-from .settings_pane        import SettingsPane
-from .maps_pane            import MapsPane
-from .bluetooth_pane       import BluetoothPane
-from .photo_pane           import PhotoPane
-from .video_pane           import VideoPane
-from .translator_pane      import TranslatorPane
-from .nav_pane             import NavPane
-from .music_pane           import MusicPane
-from .music_pane_unavailable import MusicPaneUnavailable
-from .call_pane            import CallPane
-from .gesture_canvas_pane  import GestureCanvasPane
-from .llm_pane             import LLMPane
-from .theme_manager        import ThemeManager
-from .shared_ar_pane       import SharedARPane
-from .spatial_audio_manager import SpatialAudioManager
-from .livestream_pane      import LiveStreamPane
-from .drawing_pane         import DrawingPane
-from .person_tracker_pane  import PersonTrackerPane
+# Pane classes are imported on first access (PEP 562), so `import apps` stays
+# cheap and heavy dependencies load only for panes that are actually opened.
+# Use apps.registry to list panes without importing them.
+import importlib
+
+from .registry import PaneSpec, PANES, enabled_panes
+
+_LAZY = {
+    "BasePane":             "base_pane",
+    "AssistantPane":        "assistant_pane",
+    "SettingsPane":         "settings_pane",
+    "MapsPane":             "maps_pane",
+    "BluetoothPane":        "bluetooth_pane",
+    "PhotoPane":            "photo_pane",
+    "VideoPane":            "video_pane",
+    "TranslatorPane":       "translator_pane",
+    "NavPane":              "nav_pane",
+    "MusicPane":            "music_pane",
+    "MusicPaneUnavailable": "music_pane_unavailable",
+    "CallPane":             "call_pane",
+    "GestureCanvasPane":    "gesture_canvas_pane",
+    "LLMPane":              "llm_pane",
+    "ThemeManager":         "theme_manager",
+    "SharedARPane":         "shared_ar_pane",
+    "SpatialAudioManager":  "spatial_audio_manager",
+    "LiveStreamPane":       "livestream_pane",
+    "DrawingPane":          "drawing_pane",
+    "PersonTrackerPane":    "person_tracker_pane",
+}
+
+
+def __getattr__(name):
+    mod = _LAZY.get(name)
+    if mod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{mod}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
+
 
 __all__ = [
-    "BasePane",
+    "BasePane", "PaneSpec", "PANES", "enabled_panes",
     "AssistantPane", "SettingsPane", "MapsPane", "BluetoothPane",
     "PhotoPane", "VideoPane", "TranslatorPane", "NavPane",
     "MusicPane", "CallPane", "GestureCanvasPane",
     "LLMPane", "ThemeManager", "SharedARPane", "SpatialAudioManager",
     "LiveStreamPane", "DrawingPane", "PersonTrackerPane"
-]
\ No newline at end of file
+]
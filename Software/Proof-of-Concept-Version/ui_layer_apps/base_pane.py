@@ -22,4 +22,15 @@ class BasePane(QWidget):
 
     def onHide(self):
         """Called when this pane is about to be hidden."""
-        pass
\ No newline at end of file
+        pass
+
+    def onHibernate(self):
+        """
+        Hidden and memory is tight: drop heavy resources (models, graphs,
+        canvases, decoded images). See main_ui_layer/memory_manager.py.
+        """
+        pass
+
+    def onWake(self):
+        """About to be shown again after onHibernate(): rebuild what it dropped."""
+        pass
@@ -1,37 +1,101 @@
 # drawing_pane.py
 
+import sys
+
 import cv2, numpy as np
-import mediapipe as mp
 from PyQt5.QtCore import QTimer, Qt
 from PyQt5.QtWidgets import QWidget
 from PyQt5.QtGui import QPainter, QPen, QColor
 
+INDEX_TIP = 8   # mediapipe HandLandmark.INDEX_FINGER_TIP
+
 class DrawingPane(QWidget):
     """
     Air-drawing canvas: track your index fingertip
     and draw a freehand stroke in 2D.
+
+    With a vision worker (main_ui_layer/worker_hub.py) the landmarks come
+    from that process; otherwise MediaPipe runs here on a 15 fps timer.
     """
-    def __init__(self, camera_feed, parent=None):
+    def __init__(self, camera_feed, parent=None, vision=None, timers=None):
         super().__init__(parent)
         self.camera = camera_feed
         self.setAttribute(Qt.WA_TransparentForMouseEvents, False)
         self.setAttribute(Qt.WA_OpaquePaintEvent)
         self.setAutoFillBackground(False)
 
-        # Mediapipe hand tracker
-        self.hands = mp.solutions.hands.Hands(
+        self.path = []  # list of QPointF
+        self.hands = None
+        self._tracking = False      # holding the vision worker's hand tracking
+        if timers is not None:      # shared timer wheel (main_ui_layer/timer_wheel.py)
+            self.timer = timers.timer(self.step, slack_ms=16, owner=self)
+        else:
+            self.timer = QTimer(self)
+            self.timer.timeout.connect(self.step)
+
+        self.vision = vision if vision is not None and vision.active("vision") else None
+        if self.vision is not None:
+            self.vision.handsReady.connect(self._onHands)
+            self.vision.workerState.connect(self._onWorkerState)
+            self.vision.acquire("hands", self)
+            self._tracking = True
+            self.destroyed.connect(lambda *_, v=self.vision, me=self: v.release("hands", me))
+        else:
+            self._startLocal()
+
+    def _make_hands(self):
+        import mediapipe as mp
+        return mp.solutions.hands.Hands(
             static_image_mode=False,
             max_num_hands=1,
             min_detection_confidence=0.7,
             min_tracking_confidence=0.7
         )
-        self.path = []  # list of QPointF
 
-        # throttle to 15fps
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.step)
+    def _startLocal(self):
+        # Mediapipe hand tracker, throttled to 15fps
+        self.hands = self._make_hands()
         self.timer.start(66)
 
+    def _onWorkerState(self, name, state):
+        if name == "vision" and state == "unavailable" and self.vision is not None:
+            self.vision.handsReady.disconnect(self._onHands)
+            self.vision = None
+            if self._tracking:      # hibernated panes start locally on wake
+                self._tracking = False
+                self._startLocal()
+
+    def _onHands(self, seq, hands):
+        if not self._tracking or not hands:
+            return
+        x, y, _ = hands[0][INDEX_TIP]
+        self.path.append((int(x * self.width()), int(y * self.height())))
+        self.update()
+
+    # memory pressure (see main_ui_layer/memory_manager.py)
+    def onHibernate(self):
+        self.timer.stop()
+        if self.vision is not None:
+            self.vision.release("hands", self)
+            self._tracking = False
+        elif self.hands is not None:
+            self.hands.close()
+        self.hands = None
+
+    def onWake(self):
+        if self.vision is not None:
+            self.vision.acquire("hands", self)
+            self._tracking = True
+        else:
+            self._startLocal()
+
+    # memory audit (see main_ui_layer/memory_audit.py)
+    def memoryProbes(self):
+        def path():
+            per_point = sys.getsizeof((0, 0)) + 2 * sys.getsizeof(1000)
+            return sys.getsizeof(self.path) + len(self.path) * per_point, len(self.path)
+        return {"path": path}
+
     def step(self):
         pix = self.camera.pixmap()
         if pix is None or pix.isNull():
@@ -48,12 +112,20 @@ class DrawingPane(QWidget):
         # detect hand + index fingertip
         res = self.hands.process(rgb)
         if res.multi_hand_landmarks:
-            lm = res.multi_hand_landmarks[0].landmark[mp.solutions.hands.HandLandmark.INDEX_FINGER_TIP]
+            lm = res.multi_hand_landmarks[0].landmark[INDEX_TIP]
             x = int(lm.x * self.width())
             y = int(lm.y * self.height())
             self.path.append((x,y))
         self.update()
 
+    # fast resume (see main_ui_layer/snapshot.py)
+    def snapshotState(self):
+        return {"path": [tuple(pt) for pt in self.path]}
+
+    def restoreState(self, state):
+        self.path = [tuple(pt) for pt in state.get("path", [])]
+        self.update()
+
     def paintEvent(self, ev):
         p = QPainter(self)
         pen = QPen(QColor(0,255,0,200), 4, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
@@ -1,16 +1,21 @@
+import zlib
+
 import cv2
 import numpy as np
-import mediapipe as mp
 from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout
 from PyQt5.QtGui import QPixmap, QImage, QPainter, QPen, QColor
 from PyQt5.QtCore import Qt, QTimer
 
+# mediapipe HandLandmark indices
+THUMB_TIP, INDEX_TIP = 4, 8
+
 class GestureCanvasPane(QWidget):
     """
     Pane that overlays gesture-based drawing on top of the camera feed.
-    Pinch (index-thumb) draws on a persistent canvas.
+    Pinch (index-thumb) draws on a persistent canvas. Hand landmarks come
+    from the vision worker (main_ui_layer/worker_hub.py) when there is one.
     """
-    def __init__(self, camera_feed, parent=None):
+    def __init__(self, camera_feed, parent=None, vision=None, timers=None):
         super().__init__(parent)
         self.camera = camera_feed
         self.view = QLabel(self)
@@ -21,11 +26,33 @@ class GestureCanvasPane(QWidget):
 
         # Canvas for drawing
         self.canvas = None
+        self._restored = None   # canvas from the last run, see restoreState
+        self._packed = None     # (shape, zlib bytes) while hibernated
         self.drawing = False
         self.prev_pt = None
 
-        # MediaPipe Hands
+        # Hand landmarks: the vision worker's, or MediaPipe Hands in-process
+        self.hands = None
+        self.gesture_enabled = False
+        self.vision = vision if vision is not None and vision.active("vision") else None
+        if self.vision is not None:
+            self.vision.acquire("hands", self)
+            self.vision.workerState.connect(self._onWorkerState)
+            self.destroyed.connect(lambda *_, v=self.vision, me=self: v.release("hands", me))
+        else:
+            self._make_hands()
+
+        # Update loop
+        if timers is not None:      # shared timer wheel (main_ui_layer/timer_wheel.py)
+            self.timer = timers.timer(self.update_frame, slack_ms=16, owner=self)
+        else:
+            self.timer = QTimer(self)
+            self.timer.timeout.connect(self.update_frame)
+        self.timer.start(30)
+
+    def _make_hands(self):
         try:
+            import mediapipe as mp
             self.hands = mp.solutions.hands.Hands(
                 static_image_mode=False,
                 max_num_hands=1,
@@ -38,11 +65,47 @@ class GestureCanvasPane(QWidget):
             self.hands = None
             self.gesture_enabled = False
 
-        # Update loop
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_frame)
+    def _onWorkerState(self, name, state):
+        if name == "vision" and state == "unavailable" and self.vision is not None:
+            self.vision = None
+            if self.timer.isActive():   # hibernated panes start locally on wake
+                self._make_hands()
+
+    # memory pressure (see main_ui_layer/memory_manager.py)
+    def onHibernate(self):
+        self.timer.stop()
+        if self.vision is not None:
+            self.vision.release("hands", self)
+        if self.hands is not None:
+            self.hands.close()
+        self.hands = None
+        self.gesture_enabled = False
+        canvas = self.canvas if self.canvas is not None else self._restored
+        if canvas is not None:
+            # mostly-empty strokes compress to a few KB
+            self._packed = (canvas.shape, zlib.compress(canvas.tobytes(), 1))
+        self.canvas = self._restored = None
+        self.view.clear()
+
+    def onWake(self):
+        if self._packed is not None:
+            shape, data = self._packed
+            self._restored = np.frombuffer(zlib.decompress(data), np.uint8).reshape(shape).copy()
+            self._packed = None
+        if self.vision is not None:
+            self.vision.acquire("hands", self)
+        else:
+            self._make_hands()
         self.timer.start(30)
 
+    # memory audit (see main_ui_layer/memory_audit.py)
+    def memoryProbes(self):
+        def canvas():
+            if self._packed is not None:
+                return len(self._packed[1])
+            return sum(a.nbytes for a in (self.canvas, self._restored) if a is not None)
+        return {"canvas": canvas}
+
     def update_frame(self):
         pix = self.camera.pixmap()
         if pix is None or pix.isNull():
@@ -52,27 +115,36 @@ class GestureCanvasPane(QWidget):
         h, w, _ = img.shape
 
         if self.canvas is None:
-            self.canvas = np.zeros_like(img)
+            if self._restored is not None and self._restored.shape == img.shape:
+                self.canvas = self._restored
+            else:
+                self.canvas = np.zeros_like(img)
+            self._restored = None
 
-        if self.gesture_enabled:
+        found = []
+        if self.vision is not None:
+            found = self.vision.latest_hands[1]
+        elif self.gesture_enabled:
             rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
             res = self.hands.process(rgb)
-            if res.multi_hand_landmarks:
-                lm = res.multi_hand_landmarks[0]
-                # get tip of index finger and thumb
-                tip_i = lm.landmark[mp.solutions.hands.HandLandmark.INDEX_FINGER_TIP]
-                tip_t = lm.landmark[mp.solutions.hands.HandLandmark.THUMB_TIP]
-                pt_i = (int(tip_i.x*w), int(tip_i.y*h))
-                pt_t = (int(tip_t.x*w), int(tip_t.y*h))
-                # distance
-                d = np.hypot(pt_i[0]-pt_t[0], pt_i[1]-pt_t[1]) / max(w,h)
-                # pinch threshold
-                if d < 0.05:
-                    if self.prev_pt:
-                        cv2.line(self.canvas, self.prev_pt, pt_i, (0,255,0), 4)
-                    self.prev_pt = pt_i
-                else:
-                    self.prev_pt = None
+            found = [[(p.x, p.y, p.z) for p in lm.landmark]
+                     for lm in (res.multi_hand_landmarks or [])]
+        if found:
+            lm = found[0]
+            # get tip of index finger and thumb
+            tip_i = lm[INDEX_TIP]
+            tip_t = lm[THUMB_TIP]
+            pt_i = (int(tip_i[0]*w), int(tip_i[1]*h))
+            pt_t = (int(tip_t[0]*w), int(tip_t[1]*h))
+            # distance
+            d = np.hypot(pt_i[0]-pt_t[0], pt_i[1]-pt_t[1]) / max(w,h)
+            # pinch threshold
+            if d < 0.05:
+                if self.prev_pt:
+                    cv2.line(self.canvas, self.prev_pt, pt_i, (0,255,0), 4)
+                self.prev_pt = pt_i
+            else:
+                self.prev_pt = None
 
         # Overlay canvas on frame
         overlay = cv2.addWeighted(img, 1.0, self.canvas, 0.7, 0)
@@ -82,6 +154,22 @@ class GestureCanvasPane(QWidget):
             Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation
         ))
 
+    # fast resume (see main_ui_layer/snapshot.py)
+    def snapshotState(self):
+        if self._packed is not None:
+            shape, data = self._packed
+            return {"shape": shape, "data": zlib.decompress(data)}
+        canvas = self.canvas if self.canvas is not None else self._restored
+        if canvas is None or not canvas.any():
+            return None
+        return {"shape": canvas.shape, "data": canvas.tobytes()}
+
+    def restoreState(self, state):
+        if not state:
+            return
+        shape = tuple(state["shape"])
+        self._restored = np.frombuffer(state["data"], np.uint8).reshape(shape).copy()
+
     def qpixmap_to_cv(self, pix):
         img = pix.toImage().convertToFormat(QImage.Format_RGBA8888)
         w, h = img.width(), img.height()
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import openai
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QPushButton
@@ -6,9 +7,15 @@ from PyQt5.QtGui import QFont
 class LLMPane(QWidget):
     """
     Pane for interacting with an on-device or API-backed LLM.
+    With `loop` (main_ui_layer/async_runtime.py) the request runs on the
+    shared asyncio loop and the answer is appended when it arrives.
     """
-    def __init__(self, parent=None):
+    MODEL = "gpt-3.5-turbo"
+
+    def __init__(self, parent=None, loop=None):
         super().__init__(parent)
+        self.loop = loop
+        self._client = None
         layout = QVBoxLayout(self)
         font = QFont("Helvetica Neue", 12)
         if not font.exactMatch(): font = QFont("Arial", 12)
@@ -34,15 +41,44 @@ class LLMPane(QWidget):
         prompt = self.input.toPlainText().strip()
         if not prompt:
             return
+        self.input.clear()
+        if self.loop is None:
+            try:
+                text = self._ask_blocking(prompt)
+            except Exception as e:
+                text = f"Error: {e}"
+            self._show(prompt, text)
+            return
+        self.send_btn.setEnabled(False)
+        self.loop.submit(self._ask(prompt),
+                         on_result=lambda text: self._show(prompt, text),
+                         on_error=lambda e: self._show(prompt, f"Error: {e}"),
+                         on_cancel=lambda: self.send_btn.setEnabled(True),
+                         owner=self)
+
+    def _messages(self, prompt):
+        return [{"role": "user", "content": prompt}]
+
+    def _ask_blocking(self, prompt):
         # call OpenAI ChatCompletion (or local LLM)
-        try:
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role":"user","content":prompt}]
-            )
-            text = response.choices[0].message.content
-        except Exception as e:
-            text = f"Error: {e}"
+        response = openai.ChatCompletion.create(model=self.MODEL,
+                                                messages=self._messages(prompt))
+        return response.choices[0].message.content
+
+    async def _ask(self, prompt):
+        if hasattr(openai, "AsyncOpenAI"):            # openai >= 1.0
+            if self._client is None:
+                self._client = openai.AsyncOpenAI(api_key=openai.api_key or None)
+            response = await self._client.chat.completions.create(
+                model=self.MODEL, messages=self._messages(prompt))
+        elif hasattr(openai.ChatCompletion, "acreate"):
+            response = await openai.ChatCompletion.acreate(
+                model=self.MODEL, messages=self._messages(prompt))
+        else:
+            return await asyncio.to_thread(self._ask_blocking, prompt)
+        return response.choices[0].message.content
+
+    def _show(self, prompt, text):
+        self.send_btn.setEnabled(True)
         self.output.append(f"> {prompt}\n{text}\n")
-        self.input.clear()
         self.output.moveCursor(self.output.textCursor().End)
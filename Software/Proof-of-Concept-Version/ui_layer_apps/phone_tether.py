@@ -1,5 +1,6 @@
 # phone_tether.py
 
+import asyncio
 import socket
 import pickle
 
@@ -27,3 +28,16 @@ class PhoneTether:
                 if not part: break
                 resp += part
         return pickle.loads(resp)
+
+    async def send_async(self, payload, timeout: float = 5.0):
+        """send() as a coroutine for the shared asyncio loop (ctx.loop)."""
+        data = pickle.dumps(payload, protocol=4)
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), timeout)
+        try:
+            writer.write(data)
+            await writer.drain()
+            resp = await asyncio.wait_for(reader.read(), timeout)
+        finally:
+            writer.close()
+        return pickle.loads(resp)
@@ -0,0 +1,92 @@
+# apps/registry.py
+"""
+Every pane the launcher knows about, by id, module and icon -- without
+importing any of them. Panes are imported and constructed on first launch
+(see main_ui_layer/pane_loader.py), so booting no longer pays for mediapipe,
+openai, bleak, googletrans, pytesseract, spotipy, ... up front.
+"""
+import importlib
+import os
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+class PaneSpec:
+    """
+    id:     stable name, matched against `enabled_panes` in config.yaml
+    label:  launcher caption
+    module: module inside this package (None = the home/camera view)
+    cls:    class name inside `module`
+    icon:   file name inside the assets dir
+    """
+    __slots__ = ("id", "label", "module", "cls", "icon")
+
+    def __init__(self, id, label, module, cls, icon):
+        self.id = id
+        self.label = label
+        self.module = module
+        self.cls = cls
+        self.icon = icon
+
+    def __repr__(self):
+        return f"PaneSpec({self.id!r})"
+
+    def load(self):
+        """Import the pane's module and return its class."""
+        mod = importlib.import_module(f"{__package__}.{self.module}")
+        return getattr(mod, self.cls)
+
+
+# Launcher order. Index 0 is home: the plain camera view.
+PANES = [
+    PaneSpec("camera",       "Camera",       None,                    None,                  "camera.png"),
+    PaneSpec("maps",         "Maps",         "maps_pane",             "MapsPane",            "gps.png"),
+    PaneSpec("assistant",    "Assistant",    "assistant_pane",        "AssistantPane",       "gpt.png"),
+    PaneSpec("settings",     "Settings",     "settings_pane",         "SettingsPane",        "settings.png"),
+    PaneSpec("bluetooth",    "Tether",       "bluetooth_pane",        "BluetoothPane",       "bluetooth.png"),
+    PaneSpec("photos",       "Photos",       "photo_pane",            "PhotoPane",           "photo.png"),
+    PaneSpec("video",        "Video",        "video_pane",            "VideoPane",           "video.png"),
+    PaneSpec("translate",    "Translate",    "translator_pane",       "TranslatorPane",      "translate.png"),
+    PaneSpec("nav",          "Nav",          "nav_pane",              "NavPane",             "nav.png"),
+    PaneSpec("music",        "Music",        "music_pane",            "MusicPane",           "music.png"),
+    PaneSpec("call",         "Call",         "call_pane",             "CallPane",            "call.png"),
+    PaneSpec("draw",         "Draw",         "drawing_pane",          "DrawingPane",         "draw.png"),
+    PaneSpec("track",        "Track",        "person_tracker_pane",   "PersonTrackerPane",   "person.png"),
+    PaneSpec("gesture",      "Gesture",      "gesture_canvas_pane",   "GestureCanvasPane",   "gesture.png"),
+    PaneSpec("llm",          "LLM",          "llm_pane",              "LLMPane",             "llm.png"),
+    PaneSpec("theme",        "Theme",        "theme_manager",         "ThemeManager",        "theme.png"),
+    PaneSpec("sharear",      "ShareAR",      "shared_ar_pane",        "SharedARPane",        "sharear.png"),
+    PaneSpec("spatialaudio", "SpatialAudio", "spatial_audio_manager", "SpatialAudioManager", "spatialaudio.png"),
+    PaneSpec("livestream",   "LiveStream",   "livestream_pane",       "LiveStreamPane",      "livestream.png"),
+]
+
+
+def load_enabled_ids(path=None):
+    """
+    `enabled_panes` from config.yaml (ARIES_CONFIG or ./config.yaml),
+    or None when there's no config / no list, meaning "everything".
+    """
+    path = path or os.getenv("ARIES_CONFIG", "config.yaml")
+    if yaml is None or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cfg = yaml.safe_load(f) or {}
+    except Exception as e:
+        print(f"⚠️ registry: failed to read {path}: {e}")
+        return None
+    ids = cfg.get("enabled_panes")
+    return list(ids) if ids else None
+
+
+def enabled_panes(specs=PANES, ids=None):
+    """Specs filtered by `ids` (default: config.yaml); home is always kept."""
+    if ids is None:
+        ids = load_enabled_ids()
+    if ids is None:
+        return list(specs)
+    wanted = set(ids)
+    return [s for s in specs if s.module is None or s.id in wanted]
@@ -1,22 +1,48 @@
 # apps/settings_pane.py
 from PyQt5.QtWidgets import (
-    QVBoxLayout, QWidget, QTabWidget, QLabel, QCheckBox, QListWidget
+    QVBoxLayout, QWidget, QTabWidget, QLabel, QCheckBox, QListWidget, QComboBox
 )
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QFont
 from .base_pane import BasePane
 
+POWER_CHOICES = [("Auto (battery)", "auto"), ("Performance", "performance"),
+                 ("Balanced", "balanced"), ("Saver", "saver")]
+
+
 class SettingsPane(BasePane):
-    """Settings with 3 tabs: General, Bluetooth, About."""
+    """Settings with 4 tabs: General, Power, Bluetooth, About."""
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, power=None, timers=None):
         super().__init__(parent)
+        self.power = power          # main_ui_layer/power_profiles.PowerManager
         layout = QVBoxLayout(self)
         tabs = QTabWidget()
         layout.addWidget(tabs)
 
         tabs.addTab(self._general_tab(), "General")
+        if power is not None:
+            tabs.addTab(self._power_tab(), "Power")
+            # measured costs only change slowly; refresh while visible
+            if timers is not None:  # shared timer wheel (main_ui_layer/timer_wheel.py)
+                self._powerTimer = timers.timer(self._refresh_power, slack_ms=500, owner=self)
+            else:
+                self._powerTimer = QTimer(self)
+                self._powerTimer.timeout.connect(self._refresh_power)
         tabs.addTab(self._bluetooth_tab(), "Bluetooth")
         tabs.addTab(self._about_tab(),   "About")
 
+    def showEvent(self, ev):
+        super().showEvent(ev)
+        if self.power is not None:
+            self._refresh_power()
+            self._powerTimer.start(2000)
+
+    def hideEvent(self, ev):
+        super().hideEvent(ev)
+        if self.power is not None:
+            self._powerTimer.stop()
+
     def _general_tab(self):
         w = QWidget()
         l = QVBoxLayout(w)
@@ -26,6 +52,44 @@ class SettingsPane(BasePane):
         l.addStretch()
         return w
 
+    def _power_tab(self):
+        w = QWidget()
+        l = QVBoxLayout(w)
+        l.addWidget(QLabel("Power profile:"))
+        self._powerChoice = QComboBox()
+        for label, _ in POWER_CHOICES:
+            self._powerChoice.addItem(label)
+        self._powerChoice.currentIndexChanged.connect(self._on_power_choice)
+        l.addWidget(self._powerChoice)
+        self._powerNow = QLabel()
+        l.addWidget(self._powerNow)
+        # CPU time per minute and wakeups per second while each profile was active
+        self._powerCost = QLabel()
+        self._powerCost.setFont(QFont("Monospace", 9))
+        l.addWidget(self._powerCost)
+        l.addStretch()
+        self._refresh_power()
+        return w
+
+    def _on_power_choice(self, idx):
+        self.power.set_override(POWER_CHOICES[idx][1])
+        self._refresh_power()
+
+    def _refresh_power(self):
+        pm = self.power
+        choice = pm.override or "auto"
+        idx = [name for _, name in POWER_CHOICES].index(choice)
+        if self._powerChoice.currentIndex() != idx:
+            self._powerChoice.blockSignals(True)
+            self._powerChoice.setCurrentIndex(idx)
+            self._powerChoice.blockSignals(False)
+        p = pm.profile
+        self._powerNow.setText(
+            f"Camera {p.camera_size[0]}×{p.camera_size[1]} @ {p.camera_fps} fps · "
+            f"detector {p.detector_fps} fps · display {p.display_fps} fps\n"
+            f"Background: {p.background} · weather every {p.weather_s} s · voice: {p.voice}")
+        self._powerCost.setText(pm.report())
+
     def _bluetooth_tab(self):
         w = QWidget()
         l = QVBoxLayout(w)
@@ -1,3 +1,5 @@
+import asyncio
+import inspect
 import pytesseract
 from googletrans import Translator
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel
@@ -5,9 +7,16 @@ from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
 
 class TranslatorPane(QWidget):
-    def __init__(self, camera_feed, parent=None):
+    """
+    Shows text and its English translation. With `loop` (the shared asyncio
+    runtime) the lookup runs off the GUI thread and a newer text supersedes
+    a lookup still in flight.
+    """
+    def __init__(self, camera_feed, parent=None, loop=None):
         super().__init__(parent)
         self.camera = camera_feed
+        self.loop = loop
+        self._pending = None
         self.translator = Translator()
         layout = QVBoxLayout(self)
         font = QFont("Helvetica Neue",14)
@@ -21,5 +30,23 @@ class TranslatorPane(QWidget):
 
     def translate_current(self, text):
         self.src_label.setText(text)
-        res = self.translator.translate(text, dest='en')
-        self.dst_label.setText(res.text)
\ No newline at end of file
+        if self.loop is None:
+            res = self.translator.translate(text, dest='en')
+            self.dst_label.setText(res.text)
+            return
+        if self._pending is not None:
+            self._pending.cancel()
+        self.dst_label.setText("…")
+        self._pending = self.loop.submit(
+            self.translate_async(text),
+            on_result=self.dst_label.setText,
+            on_error=lambda e: self.dst_label.setText(f"[translation failed: {e}]"),
+            owner=self)
+
+    async def translate_async(self, text, dest='en'):
+        # googletrans >= 4.0 is natively async; older releases block
+        if inspect.iscoroutinefunction(self.translator.translate):
+            res = await self.translator.translate(text, dest=dest)
+        else:
+            res = await asyncio.to_thread(self.translator.translate, text, dest=dest)
+        return res.text
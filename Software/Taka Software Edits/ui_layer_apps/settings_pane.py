@@ -13,6 +13,13 @@
 #   - "set brightness to 70"
 #   - "volume up" / "volume down"
 #   - "hotword is hey vision"   (changes ctx.config['voice_hotword'])
+#   - "power saver" / "power performance" / "power auto"   (ctx.power profile)
+#
+# Reads use ctx.config.get(...), which works on both the plain dict this
+# tree's services.make_services() builds and the immutable Config from
+# config_service. Where ctx.config_service exists, changes go through its
+# set(), which also notifies whoever depends on the key (e.g. the voice
+# manager's hotword); otherwise the dict is edited in place.
 # =============================================================================
 
 from __future__ import annotations
@@ -21,6 +28,18 @@ from ..main_ui_layer.pane_base import Pane
 def _clamp(v: int, lo: int, hi: int) -> int:
     return max(lo, min(hi, int(v)))
 
+def _set_config(ctx, key: str, value) -> None:
+    """Set a dotted config key via ctx.config_service, or in the plain config dict."""
+    svc = getattr(ctx, "config_service", None)
+    if svc is not None:
+        svc.set(key, value)
+        return
+    node = ctx.config
+    *parents, leaf = key.split(".")
+    for p in parents:
+        node = node.setdefault(p, {})
+    node[leaf] = value
+
 class SettingsPane(Pane):
     id = "settings"
     title = "Settings"
@@ -31,38 +50,44 @@ class SettingsPane(Pane):
         store = self.ctx.store
         store.setdefault("brightness", 70)   # 0..100
         store.setdefault("volume", 50)       # 0..100
-        # reflect features flags from config for display
-        feats = self.ctx.config.get("features", {})
-        self._bg_remove = bool(feats.get("background_removal", False))
-        self._bg_mode = feats.get("background_mode", "black")
 
     def render(self) -> None:
         y = 72
         self.ctx.overlay.card(self.title, "Say 'toggle background removal' or 'volume up'")
         self.ctx.overlay.text(f"Brightness: {self.ctx.store['brightness']}%", 12, y, size=16); y += 22
         self.ctx.overlay.text(f"Volume:     {self.ctx.store['volume']}%", 12, y, size=16); y += 22
-        self.ctx.overlay.text(f"Background: {'ON' if self._bg_remove else 'OFF'} ({self._bg_mode})", 12, y, size=16); y += 22
-        self.ctx.overlay.text(f"Hotword:    {self.ctx.config.get('voice_hotword', 'hey vision')}", 12, y, size=16)
+        feats = self.ctx.config.get("features", {})   # read per frame: follows config.yaml edits
+        self.ctx.overlay.text(f"Background: {'ON' if feats.get('background_removal', False) else 'OFF'} ({feats.get('background_mode', 'black')})", 12, y, size=16); y += 22
+        self.ctx.overlay.text(f"Hotword:    {self.ctx.config.get('voice_hotword', 'hey vision')}", 12, y, size=16); y += 22
+        power = getattr(self.ctx, "power", None)
+        if power is not None:
+            # measured CPU time / wakeups per profile (power_profiles.py)
+            mode = "pinned" if power.override else "auto"
+            self.ctx.overlay.text(f"Power:      {power.active} ({mode})", 12, y, size=16); y += 22
+            for name, _, cpu, wakeups, _ in power.rows():
+                if cpu is not None:
+                    cost = f"{cpu:.1f} CPU s/min"
+                    if wakeups is not None:
+                        cost += f", {wakeups:.0f} wakeups/s"
+                    self.ctx.overlay.text(f"  {name}: {cost}", 12, y, size=12); y += 18
 
     def on_voice(self, text: str) -> None:
         t = (text or "").strip().lower()
 
         # Background removal toggle
         if "toggle background removal" in t:
-            self._bg_remove = not self._bg_remove
-            self.ctx.config.setdefault("features", {})["background_removal"] = self._bg_remove
-            self.ctx.overlay.toast(f"Background {'ON' if self._bg_remove else 'OFF'}")
+            on = not self.ctx.config.get("features", {}).get("background_removal", False)
+            _set_config(self.ctx, "features.background_removal", on)
+            self.ctx.overlay.toast(f"Background {'ON' if on else 'OFF'}")
             return
 
         # Background blur/black
         if "set background blur" in t:
-            self._bg_mode = "blur"
-            self.ctx.config.setdefault("features", {})["background_mode"] = "blur"
+            _set_config(self.ctx, "features.background_mode", "blur")
             self.ctx.overlay.toast("Background mode: blur")
             return
         if "set background black" in t:
-            self._bg_mode = "black"
-            self.ctx.config.setdefault("features", {})["background_mode"] = "black"
+            _set_config(self.ctx, "features.background_mode", "black")
             self.ctx.overlay.toast("Background mode: black")
             return
 
@@ -86,10 +111,24 @@ class SettingsPane(Pane):
             self.ctx.overlay.toast(f"Volume {self.ctx.store['volume']}%")
             return
 
+        # Power profile
+        if t.startswith("power ") and getattr(self.ctx, "power", None) is not None:
+            name = t.split("power ", 1)[1].strip()
+            if name in ("auto", "performance", "balanced", "saver"):
+                _set_config(self.ctx, "power.profile", name)
+                if getattr(self.ctx, "config_service", None) is None:
+                    # no config subscriber to hand it to ctx.power
+                    self.ctx.power.set_override(name)
+                self.ctx.overlay.toast(f"Power: {self.ctx.power.active}"
+                                       + ("" if name == "auto" else " (pinned)"))
+            else:
+                self.ctx.overlay.toast("Say: power saver / balanced / performance / auto")
+            return
+
         # Hotword
         if t.startswith("hotword is "):
             new_hw = text.split("hotword is ", 1)[1].strip()
             if new_hw:
-                self.ctx.config["voice_hotword"] = new_hw
+                _set_config(self.ctx, "voice_hotword", new_hw)
                 self.ctx.overlay.toast(f"Hotword: {new_hw}")
             return
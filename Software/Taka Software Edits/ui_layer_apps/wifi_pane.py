@@ -14,9 +14,12 @@
 #   - On Raspberry Pi OS / Debian, install NetworkManager (nmcli) for real ops:
 #       sudo apt update && sudo apt install network-manager -y
 #   - Keep UI minimal for smart glasses (text + toasts).
+#   - With ctx.loop (async_runtime.py) nmcli runs as an asyncio subprocess and
+#     results land on the host loop; without it the calls block as before.
 # =============================================================================
 
 from __future__ import annotations
+import asyncio
 import os
 import subprocess
 from typing import Any, List, Tuple
@@ -31,17 +34,22 @@ def _has_nmcli() -> bool:
     except Exception:
         return False
 
+SCAN_ARGS = ["-t", "-f", "SSID,SIGNAL", "device", "wifi", "list"]
+
 def _scan_nmcli() -> List[Tuple[str, int]]:
     """
     Return list of (SSID, SIGNAL) using nmcli.
     SIGNAL is 0..100. Hidden SSIDs are filtered out.
     """
     out = subprocess.run(
-        ["nmcli", "-t", "-f", "SSID,SIGNAL", "device", "wifi", "list"],
+        ["nmcli", *SCAN_ARGS],
         stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False, text=True
-    ).stdout.strip()
+    ).stdout
+    return _parse_scan(out)
+
+def _parse_scan(out: str) -> List[Tuple[str, int]]:
     networks = []
-    for line in out.splitlines():
+    for line in out.strip().splitlines():
         try:
             ssid, sig = line.split(":")
             ssid = ssid.strip()
@@ -64,13 +72,27 @@ def _connect_nmcli(ssid: str, password: str) -> Tuple[bool, str]:
         # save a connection profile; NM may prompt; we capture output
         cmd = ["nmcli", "d", "wifi", "connect", ssid, "password", password]
         res = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=False)
-        if res.returncode == 0:
-            return True, res.stdout.strip() or "Connected."
-        else:
-            return False, res.stderr.strip() or "Failed to connect."
+        return _connect_result(res.returncode, res.stdout, res.stderr)
     except Exception as e:
         return False, f"Error: {e}"
 
+def _connect_result(code: int, out: str, err: str) -> Tuple[bool, str]:
+    if code == 0:
+        return True, out.strip() or "Connected."
+    return False, err.strip() or "Failed to connect."
+
+async def _nmcli(*args: str, timeout: float = 30.0) -> Tuple[int, str, str]:
+    """nmcli as an asyncio subprocess: (returncode, stdout, stderr)."""
+    proc = await asyncio.create_subprocess_exec(
+        "nmcli", *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+    try:
+        out, err = await asyncio.wait_for(proc.communicate(), timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, out.decode(errors="replace"), err.decode(errors="replace")
+
 class WiFiPane(Pane):
     id = "wifi"
     title = "Wi-Fi"
@@ -78,9 +100,10 @@ class WiFiPane(Pane):
 
     def on_mount(self) -> None:
         """
-        Initialize pane state. Keep it tinythis is wearable UI.
+        Initialize pane state. Keep it tiny—this is wearable UI.
         """
-        self.networks: List[Tuple[str, int]] = []  # list of (ssid, signal)
+        # list of (ssid, signal); last run's scan until the user rescans
+        self.networks: List[Tuple[str, int]] = self.__dict__.pop("_restored_networks", [])
         self.simulated = not _has_nmcli()
         if self.simulated:
             self.ctx.notify.info("Wi-Fi (simulated): nmcli not found")
@@ -90,6 +113,14 @@ class WiFiPane(Pane):
         self._last_ssid = ""
         self._last_password = ""
 
+    def snapshot_state(self) -> Any:
+        """Fast resume: keep the last scan results across reboots."""
+        return [tuple(n) for n in getattr(self, "networks", [])]
+
+    def restore_state(self, state: Any) -> None:
+        # on_mount() picks these up
+        self._restored_networks = [(str(ssid), int(sig)) for ssid, sig in state]
+
     def render(self) -> None:
         """
         Minimal text-driven UI. We rely on voice or dev keys to trigger actions.
@@ -146,10 +177,19 @@ class WiFiPane(Pane):
             # fake data for dev machines
             self.networks = [("CampusWiFi", 82), ("Lab-5G", 68), ("Guest", 40)]
             self.ctx.overlay.toast("Scanned (simulated)")
-        else:
-            nets = _scan_nmcli()
-            self.networks = nets
-            self.ctx.overlay.toast(f"Found {len(nets)} networks")
+            return
+        loop = getattr(self.ctx, "loop", None)
+        if loop is not None:
+            self.ctx.overlay.toast("Scanning...")
+            loop.submit(_nmcli(*SCAN_ARGS),
+                        on_result=lambda r: self._on_scanned(_parse_scan(r[1])),
+                        on_error=self._on_error, owner=self)
+            return
+        self._on_scanned(_scan_nmcli())
+
+    def _on_scanned(self, nets: List[Tuple[str, int]]) -> None:
+        self.networks = nets
+        self.ctx.overlay.toast(f"Found {len(nets)} networks")
 
     def _do_connect(self, ssid: str, password: str) -> None:
         if not ssid:
@@ -161,7 +201,16 @@ class WiFiPane(Pane):
             self.ctx.overlay.toast(f"Connected to {ssid} (simulated)")
             return
 
-        ok, msg = _connect_nmcli(ssid, password)
+        loop = getattr(self.ctx, "loop", None)
+        if loop is not None:
+            self.ctx.overlay.toast(f"Connecting to {ssid}...")
+            loop.submit(_nmcli("d", "wifi", "connect", ssid, "password", password),
+                        on_result=lambda r: self._on_connected(*_connect_result(*r)),
+                        on_error=self._on_error, owner=self)
+            return
+        self._on_connected(*_connect_nmcli(ssid, password))
+
+    def _on_connected(self, ok: bool, msg: str) -> None:
         self.ctx.store["wifi_connected"] = bool(ok)
         self.ctx.overlay.toast(msg)
 
@@ -171,10 +220,22 @@ class WiFiPane(Pane):
             self.ctx.overlay.toast("Disconnected (simulated)")
             return
         # With nmcli we can deactivate the active connection:
+        loop = getattr(self.ctx, "loop", None)
+        if loop is not None:
+            loop.submit(_nmcli("con", "down", "id", self._last_ssid),
+                        on_result=lambda r: self._on_disconnected(),
+                        on_error=self._on_error, owner=self)
+            return
         try:
             subprocess.run(["nmcli", "con", "down", "id", self._last_ssid],
                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
-            self.ctx.store["wifi_connected"] = False
-            self.ctx.overlay.toast("Disconnected")
+            self._on_disconnected()
         except Exception as e:
-            self.ctx.overlay.toast(f"Error: {e}")
+            self._on_error(e)
+
+    def _on_disconnected(self) -> None:
+        self.ctx.store["wifi_connected"] = False
+        self.ctx.overlay.toast("Disconnected")
+
+    def _on_error(self, e: Exception) -> None:
+        self.ctx.overlay.toast(f"Error: {e}")